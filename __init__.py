@@ -26,11 +26,13 @@ import bpy
 from bpy.props import (StringProperty, BoolProperty, EnumProperty, 
                       IntProperty, FloatProperty, CollectionProperty)
 from bpy.types import PropertyGroup, Operator, Panel
+from bpy.app.handlers import persistent
 import bmesh
 import os
 import time
 import math
-from collections import defaultdict
+import numpy as np
+from collections import defaultdict, Counter
 from mathutils import Vector
 
 bl_info = {
@@ -56,8 +58,300 @@ def collect_children_objects(obj, all_objects=None):
         collect_children_objects(child, all_objects)
     return all_objects
 
+def select_by_names(view_layer, names_to_select):
+    """Select exactly the view layer objects whose names are in the set, returning them, in one pass"""
+    selected_objects = []
+    for obj in view_layer.objects:
+        should_select = obj.name in names_to_select
+        if obj.select_get() != should_select:
+            obj.select_set(should_select)
+        if should_select:
+            selected_objects.append(obj)
+    return selected_objects
+
+def select_only(view_layer, objects):
+    """Select exactly the given objects in one pass and make the first one active"""
+    select_by_names(view_layer, {obj.name for obj in objects})
+    if objects:
+        view_layer.objects.active = objects[0]
+
+def read_flags(collection, attr, dtype=bool):
+    """Read one property of every item in a collection with a single foreach_get call"""
+    values = np.empty(len(collection), dtype=dtype)
+    collection.foreach_get(attr, values)
+    return values
+
+def modifier_fix_object_names(scene):
+    """Return the analyzed objects whose geometry-adding modifiers the wizard applies"""
+    mesh_results = scene.mesh_analysis_results
+    flags = read_flags(mesh_results, "has_geometry_adding_modifiers")
+    return [mesh_results[index].object_name for index in np.flatnonzero(flags)]
+
+def uv_fix_object_names(scene):
+    """Return the analyzed objects without UV channels that the wizard unwraps"""
+    mesh_results = scene.mesh_analysis_results
+    flags = read_flags(mesh_results, "uv_channel_count", np.int32) == 0
+    return [mesh_results[index].object_name for index in np.flatnonzero(flags)]
+
+def count_analysis_issues(scene):
+    """Count analysis issues and collect the objects needing modifier or UV fixes
+    
+    Returns tuple: (materials_with_issues, modifier_object_names, uv_object_names)
+    """
+    material_results = scene.material_analysis_results
+    material_issues = (read_flags(material_results, "has_naming_issues") |
+                       read_flags(material_results, "is_empty_material") |
+                       read_flags(material_results, "has_uv_conflicts"))
+    
+    return int(material_issues.sum()), modifier_fix_object_names(scene), uv_fix_object_names(scene)
+
+def update_wizard_counters(scene):
+    """Store the analysis summary counters on the wizard state so the wizard draw only reads them"""
+    wizard = scene.horizon_wizard_state
+    materials_with_issues, modifier_object_names, uv_object_names = count_analysis_issues(scene)
+    
+    wizard.materials_with_issues = materials_with_issues
+    wizard.objects_with_modifiers = len(modifier_object_names)
+    wizard.objects_needing_uvs = len(uv_object_names)
+    wizard.materials_for_baking = int((read_flags(bpy.data.materials, "users", np.int32) > 0).sum())
+    if not wizard.export_selected_only:
+        # Whole-scene exports report the scene's mesh count, which may change after the analysis ran
+        wizard.mesh_objects = sum(1 for obj in scene.objects if obj.type == 'MESH')
+    wizard.analysis_dirty = False
+
+def refresh_valid_export_selection(wizard):
+    """Flag which stored selection names still exist and cache how many do"""
+    objects = bpy.data.objects
+    valid_count = 0
+    for item in wizard.original_selected_objects:
+        exists = item.name in objects
+        assign_if_changed(item, "exists", exists)
+        valid_count += exists
+    assign_if_changed(wizard, "valid_export_count", valid_count)
+
+def store_original_selection(context, wizard):
+    """Remember the current selection and active object so the wizard can export them later"""
+    wizard.original_selected_objects.clear()
+    for obj in context.selected_objects:
+        wizard.original_selected_objects.add().name = obj.name
+    wizard.valid_export_count = len(wizard.original_selected_objects)
+    
+    if wizard.original_selected_objects:
+        wizard.export_selected_only = True
+        if context.active_object:
+            wizard.original_active_object = context.active_object.name
+    else:
+        # No selection, export all objects
+        wizard.original_active_object = ""
+        wizard.export_selected_only = False
+
+def mark_wizard_analysis_dirty(scene):
+    """Flag the wizard summary counters as stale after the analysis results changed"""
+    wizard = scene.horizon_wizard_state
+    assign_if_changed(wizard, "analysis_dirty", True)
+    # Results changed outside a full wizard analysis, so the next one must not be skipped
+    assign_if_changed(wizard, "last_analysis_signature", "")
+
+def finish_wizard_step_edits(wizard):
+    """Clear the scene-changed hint after a wizard step, so only the user's own edits raise it again"""
+    assign_if_changed(wizard, "scene_changed", False)
+    # The step's edits reach the depsgraph handler after the operator returns, in the same event loop
+    # pass; timers run at the start of the next pass, so the flag covers exactly those updates
+    _selection_cache['wizard_edits_pending'] = True
+    if not bpy.app.timers.is_registered(end_wizard_step_edits):
+        bpy.app.timers.register(end_wizard_step_edits, first_interval=0.0)
+
+def end_wizard_step_edits():
+    """Timer callback treating depsgraph updates as user edits again once a wizard step's updates went through"""
+    _selection_cache['wizard_edits_pending'] = False
+    return None
+
+def get_analysis_signature(context):
+    """Return a signature of the scene state the wizard analysis depends on"""
+    return str(hash((len(context.scene.objects), len(bpy.data.materials), _selection_cache['data_generation'],
+                     frozenset(obj.name for obj in context.selected_objects))))
+
+def scene_mesh_objects_with_materials(scene):
+    """Return the scene's mesh objects that have at least one material slot"""
+    return [obj for obj in scene.objects if obj.type == 'MESH' and obj.data and obj.data.materials]
+
+# === SELECTION CACHE ===
+
+# Signature of the selection the cached counts were computed for, the object count seen last,
+# a counter bumped when geometry or materials are edited or objects are added or removed
+# (not on plain transforms), and whether the pending updates come from a wizard step's own edits
+_selection_cache = {'signature': None, 'object_count': None, 'data_generation': 0, 'wizard_edits_pending': False}
+
+def assign_if_changed(owner, attr, value):
+    """Write a property only when its value differs, avoiding redundant update notifications"""
+    if getattr(owner, attr) != value:
+        setattr(owner, attr, value)
+
+def refresh_selection_cache(scene, view_layer, objects_updated=False):
+    """Recompute selection-derived counts when the selection or the selected objects changed"""
+    selected_objects = view_layer.objects.selected
+    signature = frozenset(obj.name for obj in selected_objects)
+    selection_changed = signature != _selection_cache['signature']
+    if not selection_changed and not objects_updated:
+        return
+    _selection_cache['signature'] = signature
+    
+    settings = scene.horizon_export_settings
+    
+    # Walk the selected hierarchies once here instead of on every panel redraw; object edits can
+    # re-parent or add children under the selection, so they recount too
+    all_objects = set()
+    for obj in selected_objects:
+        collect_children_objects(obj, all_objects)
+    mesh_count = sum(1 for obj in all_objects if obj.type == 'MESH' and obj.data)
+    assign_if_changed(settings, "selected_mesh_count", mesh_count)
+    
+    # Modifier tallies for the directly selected meshes (modifiers can change without a selection change)
+    mesh_objects = [obj for obj in selected_objects if obj.type == 'MESH' and obj.data]
+    objects_with_modifiers = 0
+    total_modifiers = 0
+    for obj in mesh_objects:
+        modifier_count = len(obj.modifiers)
+        if modifier_count > 0:
+            objects_with_modifiers += 1
+            total_modifiers += modifier_count
+    
+    assign_if_changed(settings, "selected_direct_mesh_count", len(mesh_objects))
+    assign_if_changed(settings, "objects_with_modifiers", objects_with_modifiers)
+    assign_if_changed(settings, "total_modifiers", total_modifiers)
+    update_selection_labels(settings)
+
+def update_selection_labels(settings):
+    """Rebuild the button labels that depend on the cached selection counts"""
+    mesh_count = settings.selected_mesh_count
+    if mesh_count > 0:
+        decimate_label = f"🔻 Decimate Meshes ({mesh_count} objects)"
+    else:
+        decimate_label = "🔻 Decimate Meshes (No Meshes Selected)"
+    
+    direct_count = settings.selected_direct_mesh_count
+    if direct_count == 0:
+        apply_modifiers_label = "🔧 Apply All Modifiers (Select Objects)"
+    elif settings.objects_with_modifiers > 0:
+        apply_modifiers_label = f"🔧 Apply All Modifiers ({settings.total_modifiers} modifiers on {settings.objects_with_modifiers} objects)"
+    else:
+        apply_modifiers_label = "🔧 Apply All Modifiers (No Modifiers Found)"
+    
+    if direct_count >= 2:
+        atlas_label = f"🗂️ Create UV Atlas ({direct_count} objects)"
+    else:
+        atlas_label = "🗂️ Create UV Atlas (Select 2+ Objects)"
+    
+    if direct_count > 0:
+        export_label = f"Export {direct_count} Selected Objects (FBX)"
+    else:
+        export_label = "Export All Objects (FBX)"
+    
+    assign_if_changed(settings, "decimate_button_label", decimate_label)
+    assign_if_changed(settings, "apply_modifiers_button_label", apply_modifiers_label)
+    assign_if_changed(settings, "atlas_button_label", atlas_label)
+    assign_if_changed(settings, "export_button_label", export_label)
+
+def update_material_fix_label(scene):
+    """Recount materials with pending renames and rebuild the Fix All button label"""
+    materials_needing_rename = sum(1 for item in scene.material_analysis_results 
+                                 if not item.material_name.startswith('[Empty Slot') and
+                                 item.has_naming_issues and 
+                                 item.recommended_name and 
+                                 item.recommended_name != item.material_name)
+    
+    settings = scene.horizon_export_settings
+    settings.materials_needing_rename = materials_needing_rename
+    if materials_needing_rename > 0:
+        settings.fix_names_button_label = f"🏷️ Fix All Material Names ({materials_needing_rename})"
+    else:
+        settings.fix_names_button_label = "🏷️ Fix All Material Names (Run Analysis First)"
+
+@persistent
+def horizon_depsgraph_update_handler(scene, depsgraph):
+    """Keep cached selection statistics in sync after scene updates"""
+    # Moving objects or playing animation only sends transform updates, which change neither a cached
+    # count nor anything the analysis reads. Other object updates (parenting, modifiers, added children)
+    # recount the selection; geometry and material edits also outdate the analysis.
+    objects_edited = False
+    content_edited = False
+    for update in depsgraph.updates:
+        id_data = update.id
+        if isinstance(id_data, bpy.types.Material):
+            content_edited = True
+        elif isinstance(id_data, bpy.types.Object):
+            if update.is_updated_geometry:
+                objects_edited = content_edited = True
+            elif not update.is_updated_transform:
+                objects_edited = True
+        elif isinstance(id_data, bpy.types.Mesh) and update.is_updated_geometry:
+            content_edited = True
+    refresh_selection_cache(scene, depsgraph.view_layer, objects_edited)
+    
+    # Objects were added or removed, so the wizard's cached mesh count needs a refresh
+    object_count = len(bpy.data.objects)
+    previous_object_count = _selection_cache['object_count']
+    if object_count != previous_object_count:
+        _selection_cache['object_count'] = object_count
+        wizard = scene.horizon_wizard_state
+        refresh_valid_export_selection(wizard)
+        if wizard.step_analysis_complete:
+            mark_wizard_analysis_dirty(scene)
+        # The first update after registering or loading only records the count
+        if previous_object_count is not None:
+            content_edited = True
+    
+    if content_edited:
+        _selection_cache['data_generation'] += 1
+        
+        # Only flag the analysis as outdated; the user decides when to re-run it.
+        # Updates caused by a wizard step's own fixes are expected and do not count.
+        wizard = scene.horizon_wizard_state
+        if wizard.step_analysis_complete and not wizard.scene_changed and not _selection_cache['wizard_edits_pending']:
+            wizard.scene_changed = True
+
+@persistent
+def horizon_load_post_handler(*args):
+    """Drop the cached selection signature and rebuild the counts for the newly loaded file"""
+    _selection_cache['signature'] = None
+    _selection_cache['object_count'] = None
+    context = bpy.context
+    if context.scene and context.view_layer:
+        refresh_selection_cache(context.scene, context.view_layer, objects_updated=True)
+        # The analysis signature belongs to the previous session
+        wizard = context.scene.horizon_wizard_state
+        assign_if_changed(wizard, "last_analysis_signature", "")
+        assign_if_changed(wizard, "export_base_name", get_export_base_name())
+        if wizard.step_analysis_complete:
+            mark_wizard_analysis_dirty(context.scene)
+
+# === PAGINATION UPDATE CALLBACKS ===
+
+def clamp_page(current_page, total_items, page_size):
+    """Return the current page limited to the last page for the given item count"""
+    max_page = max(0, (total_items - 1) // page_size)
+    return min(current_page, max_page)
+
+def update_materials_page_size(self, context):
+    """Keep the materials page in range when the page size changes"""
+    total_filtered = sum(1 for item in context.scene.material_analysis_results
+                         if not item.material_name.startswith('[Empty Slot'))
+    assign_if_changed(self, "materials_current_page",
+                      clamp_page(self.materials_current_page, total_filtered, self.materials_page_size))
+
+def update_meshes_page_size(self, context):
+    """Keep the meshes page in range when the page size changes"""
+    total_meshes = len(context.scene.mesh_analysis_results)
+    assign_if_changed(self, "meshes_current_page",
+                      clamp_page(self.meshes_current_page, total_meshes, self.meshes_page_size))
+
 # === WIZARD STATE MANAGEMENT ===
 
+class HorizonSelectedObjectName(PropertyGroup):
+    """Name of an object that was selected when the wizard started"""
+    name: StringProperty(name="Object Name", default="")
+    exists: BoolProperty(name="Exists", description="Whether the object is still in the file", default=True)
+
 class HorizonExportWizardState(PropertyGroup):
     """Property group for storing export wizard state and progress"""
     
@@ -90,12 +384,33 @@ class HorizonExportWizardState(PropertyGroup):
     objects_with_modifiers: IntProperty(name="Objects With Modifiers", default=0)
     objects_needing_uvs: IntProperty(name="Objects Needing UVs", default=0)
     materials_for_baking: IntProperty(name="Materials For Baking", default=0)
+    analysis_dirty: BoolProperty(
+        name="Analysis Dirty",
+        description="Analysis results changed since the summary counters were computed",
+        default=False
+    )
+    scene_changed: BoolProperty(
+        name="Scene Changed",
+        description="Objects, meshes or materials were edited since the last analysis",
+        default=False
+    )
+    last_analysis_signature: StringProperty(
+        name="Last Analysis Signature",
+        description="Scene signature the current analysis results were computed for",
+        default=""
+    )
     
     # Original selection preservation for export
-    original_selected_objects: StringProperty(
+    original_selected_objects: CollectionProperty(
+        type=HorizonSelectedObjectName,
         name="Original Selected Objects",
-        description="Comma-separated list of originally selected object names",
-        default=""
+        description="Names of the originally selected objects"
+    )
+    
+    valid_export_count: IntProperty(
+        name="Valid Export Count",
+        description="Number of originally selected objects that still exist",
+        default=0
     )
     
     original_active_object: StringProperty(
@@ -110,6 +425,12 @@ class HorizonExportWizardState(PropertyGroup):
         default=False
     )
     
+    export_base_name: StringProperty(
+        name="Export Base Name",
+        description="File name previewed for wizard exports, taken from the .blend file when the wizard starts or a file is loaded",
+        default=""
+    )
+    
     # User preferences for wizard
     auto_fix_materials: BoolProperty(
         name="Auto-fix Materials",
@@ -349,25 +670,14 @@ class HorizonExportSettings(PropertyGroup):
         subtype='DIR_PATH'
     )
     
-    # UI state properties for scrollable lists
-    materials_list_expanded: BoolProperty(
-        name="Materials List Expanded",
-        description="Whether the detailed materials list is expanded",
-        default=True
-    )
-    
-    meshes_list_expanded: BoolProperty(
-        name="Meshes List Expanded", 
-        description="Whether the detailed meshes list is expanded",
-        default=True
-    )
-    
+    # UI state properties for paginated lists
     materials_page_size: IntProperty(
         name="Materials Page Size",
         description="Number of materials to show per page",
         default=10,
         min=5,
-        max=50
+        max=50,
+        update=update_materials_page_size
     )
     
     materials_current_page: IntProperty(
@@ -382,7 +692,8 @@ class HorizonExportSettings(PropertyGroup):
         description="Number of meshes to show per page", 
         default=10,
         min=5,
-        max=50
+        max=50,
+        update=update_meshes_page_size
     )
     
     meshes_current_page: IntProperty(
@@ -429,6 +740,49 @@ class HorizonExportSettings(PropertyGroup):
         description="Maintain symmetry on meshes with mirror modifier",
         default=False
     )
+    
+    # Cached selection statistics, refreshed by the depsgraph update handler
+    selected_mesh_count: IntProperty(
+        name="Selected Mesh Count",
+        description="Number of mesh objects in the selection, including children",
+        default=0,
+        min=0
+    )
+    
+    selected_direct_mesh_count: IntProperty(
+        name="Directly Selected Mesh Count",
+        description="Number of selected mesh objects, excluding unselected children",
+        default=0,
+        min=0
+    )
+    
+    objects_with_modifiers: IntProperty(
+        name="Objects With Modifiers",
+        description="Number of selected mesh objects that have modifiers",
+        default=0,
+        min=0
+    )
+    
+    total_modifiers: IntProperty(
+        name="Total Modifiers",
+        description="Number of modifiers on the selected mesh objects",
+        default=0,
+        min=0
+    )
+    
+    materials_needing_rename: IntProperty(
+        name="Materials Needing Rename",
+        description="Number of analyzed materials with a pending recommended name",
+        default=0,
+        min=0
+    )
+    
+    # Cached button labels, rebuilt only when the counts they show change
+    decimate_button_label: StringProperty(default="🔻 Decimate Meshes (No Meshes Selected)")
+    apply_modifiers_button_label: StringProperty(default="🔧 Apply All Modifiers (Select Objects)")
+    atlas_button_label: StringProperty(default="🗂️ Create UV Atlas (Select 2+ Objects)")
+    export_button_label: StringProperty(default="Export All Objects (FBX)")
+    fix_names_button_label: StringProperty(default="🏷️ Fix All Material Names (Run Analysis First)")
 
 
 class HorizonAtlasSettings(PropertyGroup):
@@ -575,6 +929,45 @@ class HorizonAtlasSettings(PropertyGroup):
     )
 
 
+# Row status shared by the mesh and material analysis results
+ANALYSIS_STATUS_ITEMS = [
+    ('READY', "Ready", "Ready for export", 'CHECKMARK', 0),
+    ('WARN', "Needs Attention", "Needs attention", 'CANCEL', 1),
+    ('CRITICAL', "Critical", "Critical issues", 'ERROR', 2),
+]
+
+# Icon and text glyph drawn for each row status
+ANALYSIS_STATUS_ICONS = {'READY': 'CHECKMARK', 'WARN': 'CANCEL', 'CRITICAL': 'ERROR'}
+ANALYSIS_STATUS_GLYPHS = {'READY': "✓", 'WARN': "⚠️", 'CRITICAL': "❌"}
+
+# Short shader labels for the material rows, keyed by the analyzed shader type
+SHADER_DISPLAY = {
+    "Principled BSDF": "PBR",
+    "Diffuse BSDF": "Diffuse",
+    "Glossy BSDF": "Glossy",
+    "Transparent BSDF": "Transparent",
+    "Glass BSDF": "Glass",
+    "Emission": "Emission",
+    "Empty Material": "Empty",
+    "Empty Material (No Nodes)": "Empty (No Nodes)",
+    "Empty Material Slot": "Empty Slot",
+    "Unknown": "Unknown",
+}
+
+# Categories of modifiers that might affect performance or workflow
+DESTRUCTIVE_MODIFIER_TYPES = frozenset({
+    'BOOLEAN', 'SOLIDIFY', 'BEVEL', 'SUBDIVISION_SURFACE', 
+    'MULTIRESOLUTION', 'DECIMATE', 'REMESH', 'TRIANGULATE'
+})
+
+# Categories of modifiers that add geometry and should be applied before UV unwrapping
+GEOMETRY_ADDING_MODIFIER_TYPES = frozenset({
+    'ARRAY', 'MIRROR', 'SOLIDIFY', 'BEVEL', 'SUBSURF',
+    'MULTIRES', 'SCREW', 'SKIN', 'BOOLEAN', 'BUILD', 
+    'WIREFRAME', 'NODES'  # Geometry Nodes can add geometry
+})
+
+
 class MeshAnalysisData(PropertyGroup):
     """Property group for storing mesh analysis results"""
     object_name: StringProperty(name="Object Name")
@@ -601,6 +994,13 @@ class MeshAnalysisData(PropertyGroup):
     # Performance warnings
     is_high_poly: BoolProperty(name="Is High Poly", default=False)
     performance_warnings: StringProperty(name="Performance Warnings", default="")
+    
+    # Display strings precomputed at analysis time for the panel rows
+    display_name: StringProperty(name="Display Name", default="")
+    display_poly_text: StringProperty(name="Display Polygon Text", default="")
+    display_issues: StringProperty(name="Display Issues", default="")
+    status: EnumProperty(name="Status", items=ANALYSIS_STATUS_ITEMS, default='READY')
+    status_glyph: StringProperty(name="Status Glyph", default="✓")
 
 
 class MaterialAnalysisData(PropertyGroup):
@@ -639,10 +1039,212 @@ class MaterialAnalysisData(PropertyGroup):
     has_uv_mapping_nodes: BoolProperty(name="Has UV Mapping Nodes", default=False)
     uv_mapping_node_details: StringProperty(name="UV Mapping Node Details", default="")
     needs_uv_correction: BoolProperty(name="Needs UV Correction", default=False)
+    
+    # Baking eligibility (VXC materials rely on vertex colors and are never baked)
+    is_bakeable: BoolProperty(name="Is Bakeable", default=False)
+    
+    # Derived flag so the Setup action can be driven by a single attribute
+    needs_setup: BoolProperty(name="Needs Setup", default=False)
+    
+    # Display strings precomputed at analysis time for the panel rows
+    display_name: StringProperty(name="Display Name", default="")
+    display_shader: StringProperty(name="Display Shader", default="")
+    display_objects: StringProperty(name="Display Objects", default="")
+    status: EnumProperty(name="Status", items=ANALYSIS_STATUS_ITEMS, default='READY')
+    status_glyph: StringProperty(name="Status Glyph", default="✓")
+
 
+def truncate_label(text, max_length):
+    """Shorten text to max_length characters, ending with an ellipsis when cut"""
+    return text if len(text) <= max_length else text[:max_length - 3] + "..."
 
 
+def update_mesh_display(item):
+    """Precompute the status and strings shown for a mesh row in the analysis panel"""
+    item.display_name = truncate_label(item.object_name, 18)
+    item.display_poly_text = f"({item.polygon_count})" if item.polygon_count > 0 else ""
+    
+    issues = []
+    if item.is_high_poly:
+        issues.append("High-poly")
+    if item.uv_channel_count == 0:
+        issues.append("No UVs")
+    if item.has_geometry_adding_modifiers:
+        issues.append("Modifiers")
+    item.display_issues = ", ".join(issues) if issues else "Ready"
+    
+    if item.is_high_poly or item.uv_channel_count == 0:
+        status = 'CRITICAL'
+    elif item.has_geometry_adding_modifiers or item.has_destructive_modifiers:
+        status = 'WARN'
+    else:
+        status = 'READY'
+    item.status = status
+    item.status_glyph = ANALYSIS_STATUS_GLYPHS[status]
+
+
+def update_material_display(item):
+    """Precompute the status and strings shown for a material row in the analysis panel"""
+    item.display_name = truncate_label(item.material_name, 20)
+    item.display_objects = truncate_label(item.using_objects, 40)
+    shader_type = item.shader_type
+    item.display_shader = SHADER_DISPLAY.get(shader_type) or shader_type.replace("ShaderNodeBsdf", "")
+    item.needs_setup = item.is_empty_material and item.can_be_setup
+    
+    if item.is_empty_material or item.has_uv_conflicts or item.has_uv_mapping_nodes:
+        status = 'CRITICAL'
+    elif item.has_naming_issues:
+        status = 'WARN'
+    else:
+        status = 'READY'
+    item.status = status
+    item.status_glyph = ANALYSIS_STATUS_GLYPHS[status]
+
+
+def classify_material_shader(material):
+    """Return (shader_type, is_empty) describing the main shader of a material"""
+    shader_type = "Unknown"
+    is_empty = False
+    
+    if material.use_nodes and material.node_tree:
+        # Check if the node tree is effectively empty
+        shader_nodes = [node for node in material.node_tree.nodes 
+                      if node.type not in ['OUTPUT_MATERIAL']]
+    
+        if not shader_nodes:
+            # Only has output node or no nodes at all
+            shader_type = "Empty Material"
+            is_empty = True
+        elif len(shader_nodes) == 1 and shader_nodes[0].type == 'OUTPUT_MATERIAL':
+            # Only has output node
+            shader_type = "Empty Material"
+            is_empty = True
+        else:
+            # Has actual shader nodes
+            for node in material.node_tree.nodes:
+                if node.type == 'BSDF_PRINCIPLED':
+                    shader_type = "Principled BSDF"
+                    break
+                elif node.type == 'BSDF_DIFFUSE':
+                    shader_type = "Diffuse BSDF"
+                    break
+                elif node.type == 'EMISSION':
+                    shader_type = "Emission"
+                    break
+                elif node.type == 'BSDF_GLOSSY':
+                    shader_type = "Glossy BSDF"
+                    break
+                elif node.type == 'BSDF_TRANSPARENT':
+                    shader_type = "Transparent BSDF"
+                    break
+                elif node.type == 'BSDF_GLASS':
+                    shader_type = "Glass BSDF"
+                    break
+    elif not material.use_nodes:
+        # Legacy material system (no nodes enabled)
+        shader_type = "Empty Material (No Nodes)"
+        is_empty = True
+    else:
+        # Nodes enabled but no node tree
+        shader_type = "Empty Material"
+        is_empty = True
+    
+    return shader_type, is_empty
+
+def fill_material_analysis_item(item, material_name, data):
+    """Populate one material analysis row from collected usage data (objects, shader_type, material_ref, is_empty)"""
+    item.material_name = material_name
+    item.shader_type = data['shader_type']
+    item.using_objects = ", ".join(sorted(data['objects'])) if data['objects'] else "(Unassigned)"
+    
+    # Handle empty materials
+    item.is_empty_material = data.get('is_empty', False)
+    if item.is_empty_material:
+        # Try to guess the purpose of empty materials
+        if any(keyword in material_name.lower() for keyword in ['placeholder', 'temp', 'wip']):
+            item.empty_material_purpose = 'PLACEHOLDER'
+        elif any(keyword in material_name.lower() for keyword in ['group', 'selection', 'org']):
+            item.empty_material_purpose = 'ORGANIZATIONAL'
+        elif any(keyword in material_name.lower() for keyword in ['vertex', 'color', 'vx']):
+            item.empty_material_purpose = 'VERTEX_COLOR'
+        elif any(keyword in material_name.lower() for keyword in ['external', 'system']):
+            item.empty_material_purpose = 'EXTERNAL'
+        else:
+            item.empty_material_purpose = 'UNKNOWN'
+    
+    # Analyze naming and get recommendations
+    issues, recommended_name, recommended_suffix = get_material_naming_recommendation(
+        material_name, data['shader_type'], data['material_ref']
+    )
+    
+    item.has_naming_issues = len(issues) > 0
+    item.naming_issues = "; ".join(issues) if issues else ""
+    item.recommended_name = recommended_name
+    item.recommended_suffix = recommended_suffix
+    
+    # Check for UV conflicts
+    has_uv_conflicts, uv_conflict_details, conflicting_objects = detect_uv_conflicts(data['objects'])
+    item.has_uv_conflicts = has_uv_conflicts
+    item.uv_conflict_details = uv_conflict_details
+    item.conflicting_objects = conflicting_objects
+    
+    # Check for UV mapping nodes
+    has_uv_mapping_nodes, uv_mapping_node_details = detect_uv_mapping_nodes(data['material_ref'])
+    item.has_uv_mapping_nodes = has_uv_mapping_nodes
+    item.uv_mapping_node_details = uv_mapping_node_details
+    item.needs_uv_correction = has_uv_mapping_nodes
+    
+    # Flag bakeable materials once here so panels don't resolve materials per redraw
+    material = data['material_ref']
+    if material:
+        base_name, material_type, texture_info = get_meta_horizon_texture_info(material.name, material)
+        item.is_bakeable = material_type != "VXC"
+    update_material_display(item)
+
+def refresh_material_analysis(scene, material_names, scope_objects):
+    """Re-analyze only the named materials in place, adding rows for materials not listed yet"""
+    results = scene.material_analysis_results
+    
+    # Gather the users of the changed materials in one pass over the analyzed objects
+    material_users = {name: set() for name in material_names}
+    for obj in scope_objects:
+        if obj.type == 'MESH' and obj.data and obj.data.materials:
+            for slot in obj.material_slots:
+                material = slot.material
+                if material and material.name in material_users:
+                    material_users[material.name].add(obj.name)
+    
+    # New rows go before the empty slot rows, which always come last
+    existing_indices = {item.material_name: index for index, item in enumerate(results)}
+    insert_index = next((index for index, item in enumerate(results) 
+                         if item.material_name.startswith('[Empty Slot')), len(results))
+    
+    for material_name in sorted(material_names):
+        material = bpy.data.materials.get(material_name)
+        if not material:
+            continue
+        
+        objects = material_users[material_name]
+        index = existing_indices.get(material_name)
+        if index is None:
+            if not objects:
+                continue  # Not used by anything in the analyzed scope
+            results.add()
+            results.move(len(results) - 1, insert_index)
+            index = insert_index
+            insert_index += 1
+        
+        shader_type, is_empty = classify_material_shader(material)
+        fill_material_analysis_item(results[index], material_name, {
+            'objects': objects, 'shader_type': shader_type, 'material_ref': material, 'is_empty': is_empty
+        })
+    
+    update_material_fix_label(scene)
+    mark_wizard_analysis_dirty(scene)
+
 
+# Whether this Blender build exposes Material.blend_method; checked once in register() instead of per material
+_MATERIAL_HAS_BLEND_METHOD = True
 
 def get_material_naming_recommendation(material_name, shader_type, material):
     """
@@ -696,7 +1298,7 @@ def get_material_naming_recommendation(material_name, shader_type, material):
         alpha_cutoff = False
         
         # Check material blend method
-        if hasattr(material, 'blend_method'):
+        if _MATERIAL_HAS_BLEND_METHOD:
             if material.blend_method in ['BLEND', 'ALPHA']:
                 is_transparent = True
             elif material.blend_method == 'CLIP':
@@ -714,7 +1316,7 @@ def get_material_naming_recommendation(material_name, shader_type, material):
                 has_emission_node = True
             elif node.type in ['BSDF_TRANSPARENT', 'BSDF_GLASS']:
                 has_transparent_shader = True
-            elif node.type == 'ATTRIBUTE' and hasattr(node, 'attribute_name'):
+            elif node.type == 'ATTRIBUTE':
                 if 'Col' in node.attribute_name or 'Color' in node.attribute_name:
                     has_vertex_colors = True
         
@@ -3025,6 +3627,111 @@ class META_HORIZON_OT_create_material_for_slot(Operator):
         layout.prop(self, "setup_type")
 
 
+# Material types offered when setting up empty materials
+EMPTY_MATERIAL_SETUP_ITEMS = [
+    ('BASE_PBR', "Base PBR", "Standard Principled BSDF material"),
+    ('UNLIT', "Unlit", "Emission-based unlit material"),
+    ('BLEND', "Blend", "Unlit material with alpha blending"),
+    ('TRANSPARENT', "Transparent", "Transparent material"),
+    ('VERTEX_COLOR', "Vertex Color", "Material using vertex colors"),
+]
+
+def setup_empty_material_nodes(material, setup_type):
+    """Build a basic Meta Horizon compatible node setup for an empty material"""
+    # Enable nodes if not already enabled
+    if not material.use_nodes:
+        material.use_nodes = True
+    
+    # Clear existing nodes if any
+    material.node_tree.nodes.clear()
+    
+    # Create material output node
+    output_node = material.node_tree.nodes.new(type='ShaderNodeOutputMaterial')
+    output_node.location = (300, 0)
+    
+    if setup_type == 'BASE_PBR':
+        # Create Principled BSDF
+        principled_node = material.node_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
+        principled_node.location = (0, 0)
+        material.node_tree.links.new(principled_node.outputs['BSDF'], output_node.inputs['Surface'])
+        
+        # Set default PBR values
+        principled_node.inputs['Base Color'].default_value = (0.8, 0.8, 0.8, 1.0)
+        principled_node.inputs['Metallic'].default_value = 0.0
+        principled_node.inputs['Roughness'].default_value = 0.5
+        
+    elif setup_type == 'UNLIT':
+        # Create Emission shader
+        emission_node = material.node_tree.nodes.new(type='ShaderNodeEmission')
+        emission_node.location = (0, 0)
+        material.node_tree.links.new(emission_node.outputs['Emission'], output_node.inputs['Surface'])
+        
+        # Set default emission values
+        emission_node.inputs['Color'].default_value = (0.8, 0.8, 0.8, 1.0)
+        emission_node.inputs['Strength'].default_value = 1.0
+        
+        # Update material name to include _Unlit suffix if not present
+        if not material.name.endswith('_Unlit'):
+            material.name = material.name + '_Unlit'
+            
+    elif setup_type == 'BLEND':
+        # Create Emission shader for unlit blend material (no transparency in viewport)
+        emission_node = material.node_tree.nodes.new(type='ShaderNodeEmission')
+        emission_node.location = (0, 0)
+        material.node_tree.links.new(emission_node.outputs['Emission'], output_node.inputs['Surface'])
+        
+        # Set default emission values for unlit blend material
+        emission_node.inputs['Color'].default_value = (0.8, 0.8, 0.8, 1.0)
+        emission_node.inputs['Strength'].default_value = 1.0
+        
+        # Keep as opaque in viewport - alpha is handled during export to BA texture
+        
+        # Update material name to include _Blend suffix if not present
+        if not material.name.endswith('_Blend'):
+            material.name = material.name + '_Blend'
+            
+    elif setup_type == 'TRANSPARENT':
+        # Create Principled BSDF with transparency
+        principled_node = material.node_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
+        principled_node.location = (0, 0)
+        material.node_tree.links.new(principled_node.outputs['BSDF'], output_node.inputs['Surface'])
+        
+        # Set transparent properties
+        principled_node.inputs['Base Color'].default_value = (0.8, 0.8, 0.8, 1.0)
+        principled_node.inputs['Alpha'].default_value = 0.5
+        principled_node.inputs['Metallic'].default_value = 0.0
+        principled_node.inputs['Roughness'].default_value = 0.1
+        
+        # Set material blend mode
+        material.blend_method = 'BLEND'
+        
+        # Update material name to include _Transparent suffix if not present
+        if not material.name.endswith('_Transparent'):
+            material.name = material.name + '_Transparent'
+            
+    elif setup_type == 'VERTEX_COLOR':
+        # Create Principled BSDF with vertex color input
+        principled_node = material.node_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
+        principled_node.location = (0, 0)
+        
+        # Create Vertex Color attribute node
+        vertex_color_node = material.node_tree.nodes.new(type='ShaderNodeAttribute')
+        vertex_color_node.location = (-300, 0)
+        vertex_color_node.attribute_name = "Col"  # Default vertex color attribute
+        
+        # Connect vertex color to base color
+        material.node_tree.links.new(vertex_color_node.outputs['Color'], principled_node.inputs['Base Color'])
+        material.node_tree.links.new(principled_node.outputs['BSDF'], output_node.inputs['Surface'])
+        
+        # Set default PBR values
+        principled_node.inputs['Metallic'].default_value = 0.0
+        principled_node.inputs['Roughness'].default_value = 0.5
+        
+        # Update material name to include _VXC suffix if not present
+        if not material.name.endswith('_VXC'):
+            material.name = material.name + '_VXC'
+
+
 class META_HORIZON_OT_setup_empty_material(Operator):
     """Setup empty material with basic Meta Horizon compatible nodes"""
     bl_idname = "meta_horizon.setup_empty_material"
@@ -3040,13 +3747,7 @@ class META_HORIZON_OT_setup_empty_material(Operator):
     setup_type: EnumProperty(
         name="Setup Type",
         description="Type of material to create",
-        items=[
-            ('BASE_PBR', "Base PBR", "Standard Principled BSDF material"),
-            ('UNLIT', "Unlit", "Emission-based unlit material"),
-            ('BLEND', "Blend", "Unlit material with alpha blending"),
-            ('TRANSPARENT', "Transparent", "Transparent material"),
-            ('VERTEX_COLOR', "Vertex Color", "Material using vertex colors"),
-        ],
+        items=EMPTY_MATERIAL_SETUP_ITEMS,
         default='BASE_PBR'
     )
 
@@ -3061,98 +3762,7 @@ class META_HORIZON_OT_setup_empty_material(Operator):
             self.report({'WARNING'}, f"Material '{self.material_name}' not found")
             return {'CANCELLED'}
         
-        # Enable nodes if not already enabled
-        if not material.use_nodes:
-            material.use_nodes = True
-        
-        # Clear existing nodes if any
-        material.node_tree.nodes.clear()
-        
-        # Create material output node
-        output_node = material.node_tree.nodes.new(type='ShaderNodeOutputMaterial')
-        output_node.location = (300, 0)
-        
-        if self.setup_type == 'BASE_PBR':
-            # Create Principled BSDF
-            principled_node = material.node_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
-            principled_node.location = (0, 0)
-            material.node_tree.links.new(principled_node.outputs['BSDF'], output_node.inputs['Surface'])
-            
-            # Set default PBR values
-            principled_node.inputs['Base Color'].default_value = (0.8, 0.8, 0.8, 1.0)
-            principled_node.inputs['Metallic'].default_value = 0.0
-            principled_node.inputs['Roughness'].default_value = 0.5
-            
-        elif self.setup_type == 'UNLIT':
-            # Create Emission shader
-            emission_node = material.node_tree.nodes.new(type='ShaderNodeEmission')
-            emission_node.location = (0, 0)
-            material.node_tree.links.new(emission_node.outputs['Emission'], output_node.inputs['Surface'])
-            
-            # Set default emission values
-            emission_node.inputs['Color'].default_value = (0.8, 0.8, 0.8, 1.0)
-            emission_node.inputs['Strength'].default_value = 1.0
-            
-            # Update material name to include _Unlit suffix if not present
-            if not material.name.endswith('_Unlit'):
-                material.name = material.name + '_Unlit'
-                
-        elif self.setup_type == 'BLEND':
-            # Create Emission shader for unlit blend material (no transparency in viewport)
-            emission_node = material.node_tree.nodes.new(type='ShaderNodeEmission')
-            emission_node.location = (0, 0)
-            material.node_tree.links.new(emission_node.outputs['Emission'], output_node.inputs['Surface'])
-            
-            # Set default emission values for unlit blend material
-            emission_node.inputs['Color'].default_value = (0.8, 0.8, 0.8, 1.0)
-            emission_node.inputs['Strength'].default_value = 1.0
-            
-            # Keep as opaque in viewport - alpha is handled during export to BA texture
-            
-            # Update material name to include _Blend suffix if not present
-            if not material.name.endswith('_Blend'):
-                material.name = material.name + '_Blend'
-                
-        elif self.setup_type == 'TRANSPARENT':
-            # Create Principled BSDF with transparency
-            principled_node = material.node_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
-            principled_node.location = (0, 0)
-            material.node_tree.links.new(principled_node.outputs['BSDF'], output_node.inputs['Surface'])
-            
-            # Set transparent properties
-            principled_node.inputs['Base Color'].default_value = (0.8, 0.8, 0.8, 1.0)
-            principled_node.inputs['Alpha'].default_value = 0.5
-            principled_node.inputs['Metallic'].default_value = 0.0
-            principled_node.inputs['Roughness'].default_value = 0.1
-            
-            # Set material blend mode
-            material.blend_method = 'BLEND'
-            
-            # Update material name to include _Transparent suffix if not present
-            if not material.name.endswith('_Transparent'):
-                material.name = material.name + '_Transparent'
-                
-        elif self.setup_type == 'VERTEX_COLOR':
-            # Create Principled BSDF with vertex color input
-            principled_node = material.node_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
-            principled_node.location = (0, 0)
-            
-            # Create Vertex Color attribute node
-            vertex_color_node = material.node_tree.nodes.new(type='ShaderNodeAttribute')
-            vertex_color_node.location = (-300, 0)
-            vertex_color_node.attribute_name = "Col"  # Default vertex color attribute
-            
-            # Connect vertex color to base color
-            material.node_tree.links.new(vertex_color_node.outputs['Color'], principled_node.inputs['Base Color'])
-            material.node_tree.links.new(principled_node.outputs['BSDF'], output_node.inputs['Surface'])
-            
-            # Set default PBR values
-            principled_node.inputs['Metallic'].default_value = 0.0
-            principled_node.inputs['Roughness'].default_value = 0.5
-            
-            # Update material name to include _VXC suffix if not present
-            if not material.name.endswith('_VXC'):
-                material.name = material.name + '_VXC'
+        setup_empty_material_nodes(material, self.setup_type)
         
         self.report({'INFO'}, f"Successfully setup '{self.material_name}' as {self.setup_type.replace('_', ' ').title()} material")
         
@@ -3318,13 +3928,12 @@ class META_HORIZON_OT_select_objects_by_material(Operator):
         
         # Find and select all objects using this material
         selected_objects = []
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'MESH' and obj.data and obj.data.materials:
-                for slot in obj.material_slots:
-                    if slot.material and slot.material.name == self.material_name:
-                        obj.select_set(True)
-                        selected_objects.append(obj.name)
-                        break
+        for obj in scene_mesh_objects_with_materials(bpy.context.scene):
+            for slot in obj.material_slots:
+                if slot.material and slot.material.name == self.material_name:
+                    obj.select_set(True)
+                    selected_objects.append(obj.name)
+                    break
         
         if selected_objects:
             # Set the first selected object as active
@@ -3683,7 +4292,7 @@ class META_HORIZON_OT_choose_material_suffix(Operator):
                 
                 # Check material blend method
                 try:
-                    if hasattr(material, 'blend_method'):
+                    if _MATERIAL_HAS_BLEND_METHOD:
                         if material.blend_method in ['BLEND', 'ALPHA']:
                             is_transparent = True
                             reasoning.append(f"Material blend method is '{material.blend_method}' (transparent)")
@@ -3706,14 +4315,15 @@ class META_HORIZON_OT_choose_material_suffix(Operator):
                             
                             # Check metalness - only suggest _Metal if explicitly > 0
                             try:
-                                if 'Metallic' in node.inputs and hasattr(node.inputs['Metallic'], 'default_value'):
-                                    metalness_value = node.inputs['Metallic'].default_value
+                                metallic_socket = node.inputs.get('Metallic')
+                                if metallic_socket is not None:
+                                    metalness_value = metallic_socket.default_value
                                     if metalness_value > 0.0:
                                         is_metallic = True
                                         reasoning.append(f"Metallic value is {metalness_value:.2f} (> 0.0)")
                                 
                                 # Check if metalness input is connected - but don't automatically assume it's metallic
-                                if 'Metallic' in node.inputs and node.inputs['Metallic'].is_linked:
+                                if metallic_socket is not None and metallic_socket.is_linked:
                                     # Only mention the connection, don't automatically set as metallic
                                     reasoning.append("Metallic input is connected to a node (but value not determined)")
                             except:
@@ -3721,14 +4331,15 @@ class META_HORIZON_OT_choose_material_suffix(Operator):
                             
                             # Check alpha
                             try:
-                                if 'Alpha' in node.inputs and hasattr(node.inputs['Alpha'], 'default_value'):
-                                    alpha_value = node.inputs['Alpha'].default_value
+                                alpha_socket = node.inputs.get('Alpha')
+                                if alpha_socket is not None:
+                                    alpha_value = alpha_socket.default_value
                                     if alpha_value < 1.0:
                                         is_transparent = True
                                         reasoning.append(f"Alpha value is {alpha_value:.2f} (< 1.0)")
                                 
                                 # Check if alpha input is connected
-                                if 'Alpha' in node.inputs and node.inputs['Alpha'].is_linked:
+                                if alpha_socket is not None and alpha_socket.is_linked:
                                     is_transparent = True
                                     reasoning.append("Alpha input is connected to a node")
                             except:
@@ -3736,8 +4347,9 @@ class META_HORIZON_OT_choose_material_suffix(Operator):
                             
                             # Check emission
                             try:
-                                if 'Emission Strength' in node.inputs and hasattr(node.inputs['Emission Strength'], 'default_value'):
-                                    emission_strength = node.inputs['Emission Strength'].default_value
+                                strength_socket = node.inputs.get('Emission Strength')
+                                if strength_socket is not None:
+                                    emission_strength = strength_socket.default_value
                                     if emission_strength > 0.0:
                                         reasoning.append(f"Emission strength is {emission_strength:.2f} (> 0.0)")
                                 
@@ -3753,8 +4365,9 @@ class META_HORIZON_OT_choose_material_suffix(Operator):
                             
                             # Check emission strength
                             try:
-                                if 'Strength' in node.inputs and hasattr(node.inputs['Strength'], 'default_value'):
-                                    emission_strength = node.inputs['Strength'].default_value
+                                strength_socket = node.inputs.get('Strength')
+                                if strength_socket is not None:
+                                    emission_strength = strength_socket.default_value
                                     if emission_strength > 0.0:
                                         reasoning.append(f"Emission strength is {emission_strength:.2f}")
                             except:
@@ -3764,7 +4377,7 @@ class META_HORIZON_OT_choose_material_suffix(Operator):
                             has_transparent_shader = True
                             reasoning.append(f"Material contains {node.type.replace('BSDF_', '')} shader node")
                         
-                        elif node.type == 'ATTRIBUTE' and hasattr(node, 'attribute_name'):
+                        elif node.type == 'ATTRIBUTE':
                             if 'Col' in node.attribute_name or 'Color' in node.attribute_name:
                                 has_vertex_colors = True
                                 reasoning.append(f"Material uses vertex colors (attribute: {node.attribute_name})")
@@ -3976,36 +4589,6 @@ class META_HORIZON_OT_choose_material_suffix(Operator):
             explanation_box.label(text="• Used for: Text, icons, UI elements")
 
 
-class META_HORIZON_OT_toggle_materials_list(Operator):
-    """Toggle materials list expanded/collapsed state"""
-    bl_idname = "meta_horizon.toggle_materials_list"
-    bl_label = "Toggle Materials List"
-    bl_description = "Expand or collapse the detailed materials list"
-    bl_options = {'REGISTER'}
-
-    def execute(self, context):
-        settings = context.scene.horizon_export_settings
-        settings.materials_list_expanded = not settings.materials_list_expanded
-        # Reset to first page when toggling
-        settings.materials_current_page = 0
-        return {'FINISHED'}
-
-
-class META_HORIZON_OT_toggle_meshes_list(Operator):
-    """Toggle meshes list expanded/collapsed state"""
-    bl_idname = "meta_horizon.toggle_meshes_list"
-    bl_label = "Toggle Meshes List"
-    bl_description = "Expand or collapse the detailed meshes list"
-    bl_options = {'REGISTER'}
-
-    def execute(self, context):
-        settings = context.scene.horizon_export_settings
-        settings.meshes_list_expanded = not settings.meshes_list_expanded
-        # Reset to first page when toggling
-        settings.meshes_current_page = 0
-        return {'FINISHED'}
-
-
 class META_HORIZON_OT_materials_page_nav(Operator):
     """Navigate materials list pages"""
     bl_idname = "meta_horizon.materials_page_nav"
@@ -4195,6 +4778,126 @@ class META_HORIZON_OT_apply_all_recommended_names(Operator):
         layout.label(text="This will rename materials to follow Meta Horizon naming conventions.", icon='INFO')
 
 
+def resolve_material_uv_conflicts(material_name):
+    """
+    Give every object sharing a material with UV conflicts its own material copy.
+    Returns tuple: (created_material_names, warning_message)
+    """
+    # Find the material
+    original_material = bpy.data.materials.get(material_name)
+    if not original_material:
+        return [], f"Material '{material_name}' not found"
+    
+    # Find all objects using this material
+    objects_using_material = []
+    object_material_slots = {}  # Track which slots contain the material for each object
+    
+    for obj in scene_mesh_objects_with_materials(bpy.context.scene):
+        slots_with_material = []
+        for slot_index, slot in enumerate(obj.material_slots):
+            if slot.material and (slot.material == original_material or slot.material.name == material_name):
+                slots_with_material.append(slot_index)
+        
+        if slots_with_material:
+            objects_using_material.append(obj)
+            object_material_slots[obj.name] = slots_with_material
+    
+    if len(objects_using_material) < 2:
+        return [], f"Material '{material_name}' is not used by multiple objects"
+    
+    # Check if there are actually UV conflicts
+    has_conflicts, conflict_details, conflicting_objects = detect_uv_conflicts([obj.name for obj in objects_using_material])
+    
+    if not has_conflicts:
+        return [], f"No UV conflicts detected for material '{material_name}'"
+    
+    print(f"\n=== Resolving UV Conflicts for '{material_name}' ===")
+    print(f"Found {len(objects_using_material)} objects using this material:")
+    for obj in objects_using_material:
+        slots = object_material_slots.get(obj.name, [])
+        print(f"  • {obj.name} (slots: {slots})")
+    
+    # Check for shared mesh data and make unique copies if needed
+    print(f"\nChecking for shared mesh data...")
+    mesh_data_usage = {}
+    for obj in objects_using_material:
+        mesh_name = obj.data.name
+        if mesh_name not in mesh_data_usage:
+            mesh_data_usage[mesh_name] = []
+        mesh_data_usage[mesh_name].append(obj.name)
+    
+    # Make mesh data unique for objects that share it
+    for mesh_name, object_names in mesh_data_usage.items():
+        if len(object_names) > 1:
+            print(f"  Mesh '{mesh_name}' is shared by {len(object_names)} objects: {object_names}")
+            for i, obj_name in enumerate(object_names):
+                if i == 0:
+                    print(f"    Object '{obj_name}' keeps original mesh data")
+                    continue
+                
+                obj = bpy.data.objects.get(obj_name)
+                if obj:
+                    # Create a unique copy of the mesh data
+                    obj.data = obj.data.copy()
+                    print(f"    Object '{obj_name}' now has unique mesh data: '{obj.data.name}'")
+        else:
+            print(f"  Mesh '{mesh_name}' is used by only one object: {object_names[0]}")
+    
+    # Create a separate material copy for each object that shares the material
+    # This ensures that each object gets its own unique material
+    created_materials = []
+    assignments_made = []
+    
+    # Create unique materials for ALL objects (including the first one)
+    # This ensures complete separation
+    for i, obj in enumerate(objects_using_material):
+        if i == 0:
+            # First object keeps the original material name but we'll verify assignment
+            print(f"Object '{obj.name}' keeps original material '{material_name}'")
+            assignments_made.append(f"{obj.name} → {material_name}")
+            continue
+        
+        # Create a copy of the material for this object
+        material_copy = original_material.copy()
+        
+        # Find a unique name for the material copy
+        base_name = original_material.name
+        counter = i  # Use the object index to ensure uniqueness
+        while bpy.data.materials.get(f"{base_name}.{counter:03d}"):
+            counter += 1
+        
+        material_copy.name = f"{base_name}.{counter:03d}"
+        created_materials.append(material_copy.name)
+        
+        print(f"Created material copy: '{material_copy.name}' for object '{obj.name}'")
+        
+        # Replace the material in the tracked slots for this object
+        slots_to_update = object_material_slots.get(obj.name, [])
+        slots_updated = 0
+        
+        print(f"  Object '{obj.name}' has {len(slots_to_update)} slots to update: {slots_to_update}")
+        
+        for slot_index in slots_to_update:
+            if slot_index < len(obj.material_slots):
+                old_material_name = obj.material_slots[slot_index].material.name if obj.material_slots[slot_index].material else "None"
+                obj.data.materials[slot_index] = material_copy
+                slots_updated += 1
+                print(f"  Updated slot {slot_index} in object '{obj.name}': '{old_material_name}' → '{material_copy.name}'")
+            else:
+                print(f"  ERROR: Slot {slot_index} is out of range for object '{obj.name}' (has {len(obj.material_slots)} slots)")
+        
+        assignments_made.append(f"{obj.name} → {material_copy.name}")
+        
+        if slots_updated == 0:
+            print(f"  ERROR: No slots updated for object '{obj.name}' - this indicates a problem with slot detection")
+    
+    print(f"\nFinal material assignments:")
+    for assignment in assignments_made:
+        print(f"  • {assignment}")
+    
+    return created_materials, ""
+
+
 class META_HORIZON_OT_resolve_uv_conflicts(Operator):
     """Resolve UV conflicts by creating separate material copies for each conflicting object"""
     bl_idname = "meta_horizon.resolve_uv_conflicts"
@@ -4212,135 +4915,24 @@ class META_HORIZON_OT_resolve_uv_conflicts(Operator):
             self.report({'WARNING'}, "No material name provided")
             return {'CANCELLED'}
         
-        # Find the material
-        original_material = bpy.data.materials.get(self.material_name)
-        if not original_material:
-            self.report({'WARNING'}, f"Material '{self.material_name}' not found")
+        created_materials, warning = resolve_material_uv_conflicts(self.material_name)
+        if warning:
+            self.report({'WARNING'}, warning)
             return {'CANCELLED'}
         
-        # Find all objects using this material
-        objects_using_material = []
-        object_material_slots = {}  # Track which slots contain the material for each object
-        
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'MESH' and obj.data and obj.data.materials:
-                slots_with_material = []
-                for slot_index, slot in enumerate(obj.material_slots):
-                    if slot.material and (slot.material == original_material or slot.material.name == self.material_name):
-                        slots_with_material.append(slot_index)
-                
-                if slots_with_material:
-                    objects_using_material.append(obj)
-                    object_material_slots[obj.name] = slots_with_material
-        
-        if len(objects_using_material) < 2:
-            self.report({'WARNING'}, f"Material '{self.material_name}' is not used by multiple objects")
-            return {'CANCELLED'}
-        
-        # Check if there are actually UV conflicts
-        has_conflicts, conflict_details, conflicting_objects = detect_uv_conflicts([obj.name for obj in objects_using_material])
-        
-        if not has_conflicts:
-            self.report({'WARNING'}, f"No UV conflicts detected for material '{self.material_name}'")
-            return {'CANCELLED'}
-        
-        print(f"\n=== Resolving UV Conflicts for '{self.material_name}' ===")
-        print(f"Found {len(objects_using_material)} objects using this material:")
-        for obj in objects_using_material:
-            slots = object_material_slots.get(obj.name, [])
-            print(f"  • {obj.name} (slots: {slots})")
-        
-        # Check for shared mesh data and make unique copies if needed
-        print(f"\nChecking for shared mesh data...")
-        mesh_data_usage = {}
-        for obj in objects_using_material:
-            mesh_name = obj.data.name
-            if mesh_name not in mesh_data_usage:
-                mesh_data_usage[mesh_name] = []
-            mesh_data_usage[mesh_name].append(obj.name)
-        
-        # Make mesh data unique for objects that share it
-        for mesh_name, object_names in mesh_data_usage.items():
-            if len(object_names) > 1:
-                print(f"  Mesh '{mesh_name}' is shared by {len(object_names)} objects: {object_names}")
-                for i, obj_name in enumerate(object_names):
-                    if i == 0:
-                        print(f"    Object '{obj_name}' keeps original mesh data")
-                        continue
-                    
-                    obj = bpy.data.objects.get(obj_name)
-                    if obj:
-                        # Create a unique copy of the mesh data
-                        obj.data = obj.data.copy()
-                        print(f"    Object '{obj_name}' now has unique mesh data: '{obj.data.name}'")
-            else:
-                print(f"  Mesh '{mesh_name}' is used by only one object: {object_names[0]}")
-        
-        # Create a separate material copy for each object that shares the material
-        # This ensures that each object gets its own unique material
-        created_materials = []
-        assignments_made = []
-        
-        # Create unique materials for ALL objects (including the first one)
-        # This ensures complete separation
-        for i, obj in enumerate(objects_using_material):
-            if i == 0:
-                # First object keeps the original material name but we'll verify assignment
-                print(f"Object '{obj.name}' keeps original material '{self.material_name}'")
-                assignments_made.append(f"{obj.name} → {self.material_name}")
-                continue
-            
-            # Create a copy of the material for this object
-            material_copy = original_material.copy()
-            
-            # Find a unique name for the material copy
-            base_name = original_material.name
-            counter = i  # Use the object index to ensure uniqueness
-            while bpy.data.materials.get(f"{base_name}.{counter:03d}"):
-                counter += 1
-            
-            material_copy.name = f"{base_name}.{counter:03d}"
-            created_materials.append(material_copy.name)
-            
-            print(f"Created material copy: '{material_copy.name}' for object '{obj.name}'")
-            
-            # Replace the material in the tracked slots for this object
-            slots_to_update = object_material_slots.get(obj.name, [])
-            slots_updated = 0
-            
-            print(f"  Object '{obj.name}' has {len(slots_to_update)} slots to update: {slots_to_update}")
-            
-            for slot_index in slots_to_update:
-                if slot_index < len(obj.material_slots):
-                    old_material_name = obj.material_slots[slot_index].material.name if obj.material_slots[slot_index].material else "None"
-                    obj.data.materials[slot_index] = material_copy
-                    slots_updated += 1
-                    print(f"  Updated slot {slot_index} in object '{obj.name}': '{old_material_name}' → '{material_copy.name}'")
-                else:
-                    print(f"  ERROR: Slot {slot_index} is out of range for object '{obj.name}' (has {len(obj.material_slots)} slots)")
-            
-            assignments_made.append(f"{obj.name} → {material_copy.name}")
-            
-            if slots_updated == 0:
-                print(f"  ERROR: No slots updated for object '{obj.name}' - this indicates a problem with slot detection")
-        
-        print(f"\nFinal material assignments:")
-        for assignment in assignments_made:
-            print(f"  • {assignment}")
-        
         if created_materials:
             self.report({'INFO'}, 
                        f"UV conflicts resolved for '{self.material_name}': "
                        f"Created {len(created_materials)} unique material copies: {', '.join(created_materials)}")
             
             # Refresh analyses if they exist
-            if hasattr(context.scene, 'material_analysis_results') and context.scene.material_analysis_results:
+            if context.scene.material_analysis_results:
                 if context.scene.horizon_export_settings.analyze_all_materials:
                     bpy.ops.meta_horizon.analyze_all_materials()
                 else:
                     bpy.ops.meta_horizon.analyze_materials()
             
-            if hasattr(context.scene, 'mesh_analysis_results') and context.scene.mesh_analysis_results:
+            if context.scene.mesh_analysis_results:
                 bpy.ops.meta_horizon.analyze_meshes()
         else:
             self.report({'WARNING'}, f"No material copies were created for '{self.material_name}'")
@@ -4355,9 +4947,11 @@ class META_HORIZON_OT_resolve_all_uv_conflicts(Operator):
     bl_description = "Automatically resolve UV conflicts for all materials that have them by creating separate material copies for each conflicting object"
     bl_options = {'REGISTER', 'UNDO'}
 
+    conflict_material_names = []  # Collected once in invoke for the dialog
+
     def execute(self, context):
         # Check if material analysis results exist
-        if not hasattr(context.scene, 'material_analysis_results') or not context.scene.material_analysis_results:
+        if not context.scene.material_analysis_results:
             self.report({'WARNING'}, "No material analysis results found. Please run material analysis first.")
             return {'CANCELLED'}
         
@@ -4384,15 +4978,15 @@ class META_HORIZON_OT_resolve_all_uv_conflicts(Operator):
             try:
                 print(f"\nResolving UV conflicts for material: '{material_name}'")
                 
-                # Call the individual resolve operator
-                result = bpy.ops.meta_horizon.resolve_uv_conflicts(material_name=material_name)
+                # Resolve in place; the analyses are refreshed once after the loop
+                created_materials, warning = resolve_material_uv_conflicts(material_name)
                 
-                if 'FINISHED' in result:
+                if created_materials:
                     successfully_resolved.append(material_name)
                     print(f"  ✓ Successfully resolved UV conflicts for '{material_name}'")
                 else:
                     failed_to_resolve.append(material_name)
-                    print(f"  ✗ Failed to resolve UV conflicts for '{material_name}'")
+                    print(f"  ✗ Failed to resolve UV conflicts for '{material_name}': {warning}")
                     
             except Exception as e:
                 failed_to_resolve.append(material_name)
@@ -4413,6 +5007,16 @@ class META_HORIZON_OT_resolve_all_uv_conflicts(Operator):
             for material_name in failed_to_resolve:
                 print(f"  ✗ {material_name}")
         
+        # Refresh analyses once for all resolved materials
+        if successfully_resolved:
+            if context.scene.horizon_export_settings.analyze_all_materials:
+                bpy.ops.meta_horizon.analyze_all_materials()
+            else:
+                bpy.ops.meta_horizon.analyze_materials()
+            
+            if context.scene.mesh_analysis_results:
+                bpy.ops.meta_horizon.analyze_meshes()
+        
         # Report results to user
         if successfully_resolved and not failed_to_resolve:
             self.report({'INFO'}, f"Successfully resolved UV conflicts for all {len(successfully_resolved)} materials!")
@@ -4425,7 +5029,7 @@ class META_HORIZON_OT_resolve_all_uv_conflicts(Operator):
 
     def invoke(self, context, event):
         # Check if material analysis results exist
-        if not hasattr(context.scene, 'material_analysis_results') or not context.scene.material_analysis_results:
+        if not context.scene.material_analysis_results:
             self.report({'WARNING'}, "No material analysis results found. Please run material analysis first.")
             return {'CANCELLED'}
         
@@ -4439,18 +5043,16 @@ class META_HORIZON_OT_resolve_all_uv_conflicts(Operator):
             self.report({'INFO'}, "No materials with UV conflicts found.")
             return {'FINISHED'}
         
+        self.conflict_material_names = materials_with_conflicts
+        
         # Show confirmation dialog
         return context.window_manager.invoke_confirm(self, event)
     
     def draw(self, context):
         layout = self.layout
         
-        # Count materials with UV conflicts
-        materials_with_conflicts = []
-        if hasattr(context.scene, 'material_analysis_results') and context.scene.material_analysis_results:
-            for material_data in context.scene.material_analysis_results:
-                if material_data.has_uv_conflicts:
-                    materials_with_conflicts.append(material_data.material_name)
+        # Materials with UV conflicts, collected in invoke
+        materials_with_conflicts = self.conflict_material_names
         
         layout.label(text="Resolve UV Conflicts for All Materials", icon='UV_DATA')
         layout.separator()
@@ -4461,7 +5063,7 @@ class META_HORIZON_OT_resolve_all_uv_conflicts(Operator):
             
             # Show first few materials
             max_display = 10
-            for i, material_name in enumerate(materials_with_conflicts[:max_display]):
+            for material_name in materials_with_conflicts[:max_display]:
                 layout.label(text=f"• {material_name}", icon='MATERIAL')
             
             if len(materials_with_conflicts) > max_display:
@@ -4613,7 +5215,7 @@ class META_HORIZON_OT_simplify_material(Operator):
         self.report({'INFO'}, f"Successfully simplified material! Created '{final_name}' and updated {objects_updated} objects. Original saved as '{backup_name}'")
         
         # Refresh material analysis to update the UI
-        if hasattr(context.scene, 'material_analysis_results') and context.scene.material_analysis_results:
+        if context.scene.material_analysis_results:
             try:
                 # Re-analyze materials based on user setting
                 if context.scene.horizon_export_settings.analyze_all_materials:
@@ -4627,6 +5229,36 @@ class META_HORIZON_OT_simplify_material(Operator):
         return {'FINISHED'}
 
 
+def apply_geometry_adding_modifiers(obj):
+    """
+    Apply the geometry-adding modifiers of a mesh object in stack order.
+    Returns tuple: (applied_count, failed_modifiers) where failed_modifiers is a list of (name, error)
+    """
+    # Find geometry-adding modifiers
+    modifiers_to_apply = [modifier.name for modifier in obj.modifiers 
+                          if modifier.type in GEOMETRY_ADDING_MODIFIER_TYPES]
+    if not modifiers_to_apply:
+        return 0, []
+    
+    # Make sure the object is selected and active
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+    
+    # Apply modifiers in order
+    applied_count = 0
+    failed_modifiers = []
+    for modifier_name in modifiers_to_apply:
+        modifier = obj.modifiers.get(modifier_name)
+        if modifier and modifier.type in GEOMETRY_ADDING_MODIFIER_TYPES:
+            try:
+                bpy.ops.object.modifier_apply(modifier=modifier_name)
+                applied_count += 1
+            except RuntimeError as e:
+                failed_modifiers.append((modifier_name, str(e)))
+    
+    return applied_count, failed_modifiers
+
+
 class META_HORIZON_OT_apply_geometry_modifiers(Operator):
     """Apply geometry-adding modifiers to prepare mesh for UV unwrapping"""
     bl_idname = "meta_horizon.apply_geometry_modifiers"
@@ -4654,37 +5286,13 @@ class META_HORIZON_OT_apply_geometry_modifiers(Operator):
             self.report({'WARNING'}, f"Object '{self.object_name}' is not a mesh")
             return {'CANCELLED'}
         
-        # Geometry-adding modifier types
-        geometry_adding_types = {
-            'ARRAY', 'MIRROR', 'SOLIDIFY', 'BEVEL', 'SUBSURF',
-            'MULTIRES', 'SCREW', 'SKIN', 'BOOLEAN', 'BUILD', 
-            'WIREFRAME', 'NODES'
-        }
-        
-        # Find geometry-adding modifiers
-        modifiers_to_apply = []
-        for modifier in obj.modifiers:
-            if modifier.type in geometry_adding_types:
-                modifiers_to_apply.append(modifier.name)
-        
-        if not modifiers_to_apply:
+        if not any(modifier.type in GEOMETRY_ADDING_MODIFIER_TYPES for modifier in obj.modifiers):
             self.report({'WARNING'}, f"No geometry-adding modifiers found on '{self.object_name}'")
             return {'CANCELLED'}
         
-        # Make sure the object is selected and active
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        
-        # Apply modifiers in order
-        applied_count = 0
-        for modifier_name in modifiers_to_apply:
-            modifier = obj.modifiers.get(modifier_name)
-            if modifier and modifier.type in geometry_adding_types:
-                try:
-                    bpy.ops.object.modifier_apply(modifier=modifier_name)
-                    applied_count += 1
-                except RuntimeError as e:
-                    self.report({'WARNING'}, f"Failed to apply modifier '{modifier_name}': {str(e)}")
+        applied_count, failed_modifiers = apply_geometry_adding_modifiers(obj)
+        for modifier_name, error in failed_modifiers:
+            self.report({'WARNING'}, f"Failed to apply modifier '{modifier_name}': {error}")
         
         if applied_count > 0:
             self.report({'INFO'}, f"Applied {applied_count} geometry-adding modifiers to '{self.object_name}'")
@@ -4780,7 +5388,7 @@ class META_HORIZON_OT_apply_all_modifiers(Operator):
                 self.report({'INFO'}, f"Applied {total_modifiers_applied} modifiers to {applied_count} objects (out of {objects_with_modifiers} objects with modifiers)")
             
             # Refresh the mesh analysis if it exists
-            if hasattr(context.scene, 'mesh_analysis_results') and context.scene.mesh_analysis_results:
+            if context.scene.mesh_analysis_results:
                 bpy.ops.meta_horizon.analyze_meshes()
         else:
             self.report({'WARNING'}, f"No modifiers were applied. Found {objects_with_modifiers} objects with modifiers")
@@ -4949,13 +5557,8 @@ class META_HORIZON_OT_decimate_meshes(Operator):
     def draw(self, context):
         layout = self.layout
         
-        # Show settings dialog (before decimation)
-        selected_objects = context.selected_objects
-        all_objects = set()
-        for obj in selected_objects:
-            collect_children_objects(obj, all_objects)
-        
-        mesh_count = len([obj for obj in all_objects if obj.type == 'MESH' and obj.data])
+        # Show settings dialog (before decimation); the count is cached by the depsgraph handler
+        mesh_count = context.scene.horizon_export_settings.selected_mesh_count
         
         layout.label(text=f"Decimate {mesh_count} mesh objects", icon='MOD_DECIM')
         layout.separator()
@@ -5015,7 +5618,11 @@ class META_HORIZON_OT_decimate_single_mesh(Operator):
         default=False
     )
 
-
+    # Mesh counts read once in invoke; the dialog cannot change the mesh while it is open
+    has_mesh = False
+    current_polygons = 0
+    current_vertices = 0
+    current_label = ""
 
     def execute(self, context):
         if not self.object_name:
@@ -5064,16 +5671,17 @@ class META_HORIZON_OT_decimate_single_mesh(Operator):
 
             
             # Update mesh analysis if it exists
-            if hasattr(context.scene, 'mesh_analysis_results'):
-                for item in context.scene.mesh_analysis_results:
-                    if item.object_name == self.object_name:
-                        item.polygon_count = new_polygons
-                        item.vertex_count = new_vertices
-                        item.polygon_count_final = new_polygons
-                        item.vertex_count_final = new_vertices
-                        # Update high-poly status
-                        item.is_high_poly = new_polygons > 10000
-                        break
+            for item in context.scene.mesh_analysis_results:
+                if item.object_name == self.object_name:
+                    item.polygon_count = new_polygons
+                    item.vertex_count = new_vertices
+                    item.polygon_count_final = new_polygons
+                    item.vertex_count_final = new_vertices
+                    # Update high-poly status
+                    item.is_high_poly = new_polygons > 10000
+                    update_mesh_display(item)
+                    mark_wizard_analysis_dirty(context.scene)
+                    break
             
             # Report success
             reduction_percent = ((original_polygons - new_polygons) / original_polygons * 100) if original_polygons > 0 else 0
@@ -5094,6 +5702,14 @@ class META_HORIZON_OT_decimate_single_mesh(Operator):
         self.preserve_boundaries = export_settings.decimate_preserve_boundaries
         self.symmetry = export_settings.decimate_symmetry
         
+        # Current mesh info, formatted once for the dialog
+        obj = bpy.data.objects.get(self.object_name)
+        self.has_mesh = bool(obj and obj.data)
+        if self.has_mesh:
+            self.current_polygons = len(obj.data.polygons)
+            self.current_vertices = len(obj.data.vertices)
+            self.current_label = f"Current: {self.current_polygons:,} polygons, {self.current_vertices:,} vertices"
+        
         # Show settings dialog
         return context.window_manager.invoke_props_dialog(self, width=400)
 
@@ -5101,21 +5717,16 @@ class META_HORIZON_OT_decimate_single_mesh(Operator):
         layout = self.layout
         
         # Object info
-        obj = bpy.data.objects.get(self.object_name)
-        if obj and obj.data:
+        if self.has_mesh:
             info_box = layout.box()
             info_box.label(text=f"Decimating: {self.object_name}", icon='MESH_DATA')
             
-            # Current mesh info
-            current_polygons = len(obj.data.polygons)
-            current_vertices = len(obj.data.vertices)
-            
             info_col = info_box.column()
-            info_col.label(text=f"Current: {current_polygons:,} polygons, {current_vertices:,} vertices")
+            info_col.label(text=self.current_label)
             
-            # Predicted result
-            predicted_polygons = int(current_polygons * self.ratio)
-            predicted_vertices = int(current_vertices * self.ratio)
+            # Predicted result follows the ratio slider, so it is formatted on each redraw
+            predicted_polygons = int(self.current_polygons * self.ratio)
+            predicted_vertices = int(self.current_vertices * self.ratio)
             info_col.label(text=f"After decimation: ~{predicted_polygons:,} polygons, ~{predicted_vertices:,} vertices")
             
             # Reduction percentage
@@ -5201,10 +5812,14 @@ class META_HORIZON_OT_smart_uv_project_selected(Operator):
         original_active = context.view_layer.objects.active
         original_selection = context.selected_objects.copy()
         
+        # Objects are unwrapped one at a time so each keeps the full UV space (a multi-object
+        # Smart UV Project would pack all of them into one shared layout); deselect once up front
+        # and toggle only the current object instead of running select_all per object
+        select_only(context.view_layer, [])
+        
         for obj in mesh_objects:
             try:
-                # Clear selection and select only current object
-                bpy.ops.object.select_all(action='DESELECT')
+                # Select only current object
                 obj.select_set(True)
                 context.view_layer.objects.active = obj
                 
@@ -5249,10 +5864,9 @@ class META_HORIZON_OT_smart_uv_project_selected(Operator):
                     if self.preserve_existing_uvs:
                         for uv_layer in obj.data.uv_layers:
                             if uv_layer != new_uv_layer:
-                                # Store UV coordinates
-                                uv_coords = []
-                                for loop_idx, uv_loop in enumerate(uv_layer.data):
-                                    uv_coords.append((uv_loop.uv[0], uv_loop.uv[1]))
+                                # Store UV coordinates with a single bulk read
+                                uv_coords = np.empty(len(uv_layer.data) * 2, dtype=np.float32)
+                                uv_layer.data.foreach_get("uv", uv_coords)
                                 existing_uv_data.append((uv_layer.name, uv_coords))
                     
                     # Clear all UV layers
@@ -5266,10 +5880,8 @@ class META_HORIZON_OT_smart_uv_project_selected(Operator):
                     if self.preserve_existing_uvs:
                         for uv_name, uv_coords in existing_uv_data:
                             restored_layer = obj.data.uv_layers.new(name=uv_name)
-                            # Restore UV coordinates
-                            for loop_idx, (u, v) in enumerate(uv_coords):
-                                if loop_idx < len(restored_layer.data):
-                                    restored_layer.data[loop_idx].uv = (u, v)
+                            # Restore UV coordinates (same mesh, so the loop count matches)
+                            restored_layer.data.foreach_set("uv", uv_coords)
 
                 # Set the new UV layer as active (Channel 0)
                 obj.data.uv_layers.active = new_uv_layer
@@ -5307,12 +5919,11 @@ class META_HORIZON_OT_smart_uv_project_selected(Operator):
                 
                 print(f"Failed to unwrap UVs for '{obj.name}': {str(e)}")
                 failed_count += 1
-                continue
+            
+            obj.select_set(False)
         
         # Restore original selection and active object
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in original_selection:
-            obj.select_set(True)
+        select_only(context.view_layer, original_selection)
         
         if original_active:
             context.view_layer.objects.active = original_active
@@ -5602,8 +6213,12 @@ class META_HORIZON_OT_analyze_meshes(Operator):
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
         
+        # One depsgraph for the whole analysis, fetched on the first object with modifiers
+        depsgraph = None
+        
         def analyze_object(obj):
             """Recursively analyze object and its children"""
+            nonlocal depsgraph
             if obj.type == 'MESH' and obj.data:
                 mesh_data = obj.data
                 
@@ -5616,9 +6231,12 @@ class META_HORIZON_OT_analyze_meshes(Operator):
                 item.polygon_count = len(mesh_data.polygons)
                 item.vertex_count = len(mesh_data.vertices)
                 
-                # Get evaluated mesh data (with modifiers applied)
-                depsgraph = context.evaluated_depsgraph_get()
-                eval_obj = obj.evaluated_get(depsgraph)
+                # Get evaluated mesh data (with modifiers applied); unmodified meshes keep their counts
+                eval_obj = None
+                if obj.modifiers:
+                    if depsgraph is None:
+                        depsgraph = context.evaluated_depsgraph_get()
+                    eval_obj = obj.evaluated_get(depsgraph)
                 if eval_obj and eval_obj.data:
                     eval_mesh = eval_obj.data
                     item.polygon_count_final = len(eval_mesh.polygons)
@@ -5634,24 +6252,12 @@ class META_HORIZON_OT_analyze_meshes(Operator):
                 destructive_modifiers = []
                 geometry_adding_modifiers = []
                 
-                # Categories of modifiers that might affect performance or workflow
-                destructive_types = {
-                    'BOOLEAN', 'SOLIDIFY', 'BEVEL', 'SUBDIVISION_SURFACE', 
-                    'MULTIRESOLUTION', 'DECIMATE', 'REMESH', 'TRIANGULATE'
-                }
-                
-                # Categories of modifiers that add geometry and should be applied before UV unwrapping
-                geometry_adding_types = {
-                    'ARRAY', 'MIRROR', 'SOLIDIFY', 'BEVEL', 'SUBSURF',
-                    'MULTIRES', 'SCREW', 'SKIN', 'BOOLEAN', 'BUILD', 
-                    'WIREFRAME', 'NODES'  # Geometry Nodes can add geometry
-                }
-                
                 for modifier in obj.modifiers:
-                    modifier_names.append(f"{modifier.name} ({modifier.type})")
-                    if modifier.type in destructive_types:
+                    modifier_type = modifier.type
+                    modifier_names.append(f"{modifier.name} ({modifier_type})")
+                    if modifier_type in DESTRUCTIVE_MODIFIER_TYPES:
                         destructive_modifiers.append(modifier.name)
-                    if modifier.type in geometry_adding_types:
+                    if modifier_type in GEOMETRY_ADDING_MODIFIER_TYPES:
                         geometry_adding_modifiers.append(modifier.name)
                 
                 item.modifier_list = ", ".join(modifier_names) if modifier_names else "None"
@@ -5710,6 +6316,7 @@ class META_HORIZON_OT_analyze_meshes(Operator):
                         warnings.append(f"Modifiers remove {abs(poly_change):,} polygons")
                 
                 item.performance_warnings = "; ".join(warnings) if warnings else "None"
+                update_mesh_display(item)
             
             # Recursively analyze children
             for child in obj.children:
@@ -5749,6 +6356,7 @@ class META_HORIZON_OT_analyze_meshes(Operator):
         if modifier_count > 0:
             report_parts.append(f"{modifier_count} total modifiers")
         
+        mark_wizard_analysis_dirty(context.scene)
         self.report({'INFO'}, ". ".join(report_parts) + ".")
         
         return {'FINISHED'}
@@ -5778,15 +6386,14 @@ class META_HORIZON_OT_analyze_all_materials(Operator):
         # Analyze material usage across all objects
         empty_slots_data = defaultdict(lambda: {'objects': set(), 'slot_indices': set()})
         
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'MESH' and obj.data and obj.data.materials:
-                for slot_index, slot in enumerate(obj.material_slots):
-                    if slot.material:
-                        material_data[slot.material.name]['objects'].add(obj.name)
-                    else:
-                        # Track empty material slots
-                        empty_slots_data[obj.name]['objects'].add(obj.name)
-                        empty_slots_data[obj.name]['slot_indices'].add(slot_index)
+        for obj in scene_mesh_objects_with_materials(bpy.context.scene):
+            for slot_index, slot in enumerate(obj.material_slots):
+                if slot.material:
+                    material_data[slot.material.name]['objects'].add(obj.name)
+                else:
+                    # Track empty material slots
+                    empty_slots_data[obj.name]['objects'].add(obj.name)
+                    empty_slots_data[obj.name]['slot_indices'].add(slot_index)
         
         # Now analyze all materials, whether they're used or not
         for material in all_materials:
@@ -5798,51 +6405,7 @@ class META_HORIZON_OT_analyze_all_materials(Operator):
             material_data[material.name]['material_ref'] = material
             
             # Determine shader type and check if material is empty
-            shader_type = "Unknown"
-            is_empty = False
-            
-            if material.use_nodes and material.node_tree:
-                # Check if the node tree is effectively empty
-                shader_nodes = [node for node in material.node_tree.nodes 
-                              if node.type not in ['OUTPUT_MATERIAL']]
-                
-                if not shader_nodes:
-                    # Only has output node or no nodes at all
-                    shader_type = "Empty Material"
-                    is_empty = True
-                elif len(shader_nodes) == 1 and shader_nodes[0].type == 'OUTPUT_MATERIAL':
-                    # Only has output node
-                    shader_type = "Empty Material"
-                    is_empty = True
-                else:
-                    # Has actual shader nodes
-                    for node in material.node_tree.nodes:
-                        if node.type == 'BSDF_PRINCIPLED':
-                            shader_type = "Principled BSDF"
-                            break
-                        elif node.type == 'BSDF_DIFFUSE':
-                            shader_type = "Diffuse BSDF"
-                            break
-                        elif node.type == 'EMISSION':
-                            shader_type = "Emission"
-                            break
-                        elif node.type == 'BSDF_GLOSSY':
-                            shader_type = "Glossy BSDF"
-                            break
-                        elif node.type == 'BSDF_TRANSPARENT':
-                            shader_type = "Transparent BSDF"
-                            break
-                        elif node.type == 'BSDF_GLASS':
-                            shader_type = "Glass BSDF"
-                            break
-            elif not material.use_nodes:
-                # Legacy material system (no nodes enabled)
-                shader_type = "Empty Material (No Nodes)"
-                is_empty = True
-            else:
-                # Nodes enabled but no node tree
-                shader_type = "Empty Material"
-                is_empty = True
+            shader_type, is_empty = classify_material_shader(material)
             
             material_data[material.name]['shader_type'] = shader_type
             material_data[material.name]['is_empty'] = is_empty
@@ -5856,54 +6419,14 @@ class META_HORIZON_OT_analyze_all_materials(Operator):
         
         for material_name, data in material_data.items():
             item = context.scene.material_analysis_results.add()
-            item.material_name = material_name
-            item.shader_type = data['shader_type']
-            
+            fill_material_analysis_item(item, material_name, data)
             
             # Check if material is unassigned
             if not data['objects']:
-                item.using_objects = "(Unassigned)"
                 unassigned_materials += 1
-            else:
-                item.using_objects = ", ".join(sorted(data['objects']))
             
-            # Handle empty materials
-            item.is_empty_material = data.get('is_empty', False)
             if item.is_empty_material:
                 empty_materials += 1
-                # Try to guess the purpose of empty materials
-                if any(keyword in material_name.lower() for keyword in ['placeholder', 'temp', 'wip']):
-                    item.empty_material_purpose = 'PLACEHOLDER'
-                elif any(keyword in material_name.lower() for keyword in ['group', 'selection', 'org']):
-                    item.empty_material_purpose = 'ORGANIZATIONAL'
-                elif any(keyword in material_name.lower() for keyword in ['vertex', 'color', 'vx']):
-                    item.empty_material_purpose = 'VERTEX_COLOR'
-                elif any(keyword in material_name.lower() for keyword in ['external', 'system']):
-                    item.empty_material_purpose = 'EXTERNAL'
-                else:
-                    item.empty_material_purpose = 'UNKNOWN'
-            
-            # Analyze naming and get recommendations
-            issues, recommended_name, recommended_suffix = get_material_naming_recommendation(
-                material_name, data['shader_type'], data['material_ref']
-            )
-            
-            item.has_naming_issues = len(issues) > 0
-            item.naming_issues = "; ".join(issues) if issues else ""
-            item.recommended_name = recommended_name
-            item.recommended_suffix = recommended_suffix
-            
-            # Check for UV conflicts
-            has_uv_conflicts, uv_conflict_details, conflicting_objects = detect_uv_conflicts(data['objects'])
-            item.has_uv_conflicts = has_uv_conflicts
-            item.uv_conflict_details = uv_conflict_details
-            item.conflicting_objects = conflicting_objects
-            
-            # Check for UV mapping nodes
-            has_uv_mapping_nodes, uv_mapping_node_details = detect_uv_mapping_nodes(data['material_ref'])
-            item.has_uv_mapping_nodes = has_uv_mapping_nodes
-            item.uv_mapping_node_details = uv_mapping_node_details
-            item.needs_uv_correction = has_uv_mapping_nodes
             
             if item.has_naming_issues:
                 total_issues += 1
@@ -5930,6 +6453,7 @@ class META_HORIZON_OT_analyze_all_materials(Operator):
                 item.naming_issues = ""
                 item.recommended_name = ""
                 item.recommended_suffix = ""
+                update_material_display(item)
         
         total_materials = len(material_data)
         assigned_materials = total_materials - unassigned_materials
@@ -5958,6 +6482,8 @@ class META_HORIZON_OT_analyze_all_materials(Operator):
         if uv_conflict_materials > 0:
             report_parts.append(f"{uv_conflict_materials} materials have UV mapping conflicts")
         
+        update_material_fix_label(context.scene)
+        mark_wizard_analysis_dirty(context.scene)
         self.report({'INFO'}, ". ".join(report_parts) + ".")
         
         return {'FINISHED'}
@@ -5993,51 +6519,7 @@ class META_HORIZON_OT_analyze_materials(Operator):
                         material_data[material.name]['material_ref'] = material
                         
                         # Determine shader type and check if material is empty
-                        shader_type = "Unknown"
-                        is_empty = False
-                        
-                        if material.use_nodes and material.node_tree:
-                            # Check if the node tree is effectively empty
-                            shader_nodes = [node for node in material.node_tree.nodes 
-                                          if node.type not in ['OUTPUT_MATERIAL']]
-                            
-                            if not shader_nodes:
-                                # Only has output node or no nodes at all
-                                shader_type = "Empty Material"
-                                is_empty = True
-                            elif len(shader_nodes) == 1 and shader_nodes[0].type == 'OUTPUT_MATERIAL':
-                                # Only has output node
-                                shader_type = "Empty Material"
-                                is_empty = True
-                            else:
-                                # Has actual shader nodes
-                                for node in material.node_tree.nodes:
-                                    if node.type == 'BSDF_PRINCIPLED':
-                                        shader_type = "Principled BSDF"
-                                        break
-                                    elif node.type == 'BSDF_DIFFUSE':
-                                        shader_type = "Diffuse BSDF"
-                                        break
-                                    elif node.type == 'EMISSION':
-                                        shader_type = "Emission"
-                                        break
-                                    elif node.type == 'BSDF_GLOSSY':
-                                        shader_type = "Glossy BSDF"
-                                        break
-                                    elif node.type == 'BSDF_TRANSPARENT':
-                                        shader_type = "Transparent BSDF"
-                                        break
-                                    elif node.type == 'BSDF_GLASS':
-                                        shader_type = "Glass BSDF"
-                                        break
-                        elif not material.use_nodes:
-                            # Legacy material system (no nodes enabled)
-                            shader_type = "Empty Material (No Nodes)"
-                            is_empty = True
-                        else:
-                            # Nodes enabled but no node tree
-                            shader_type = "Empty Material"
-                            is_empty = True
+                        shader_type, is_empty = classify_material_shader(material)
                         
                         material_data[material.name]['shader_type'] = shader_type
                         material_data[material.name]['is_empty'] = is_empty
@@ -6061,47 +6543,10 @@ class META_HORIZON_OT_analyze_materials(Operator):
         uv_conflict_materials = 0
         for material_name, data in material_data.items():
             item = context.scene.material_analysis_results.add()
-            item.material_name = material_name
-            item.shader_type = data['shader_type']
-            item.using_objects = ", ".join(sorted(data['objects']))
+            fill_material_analysis_item(item, material_name, data)
             
-            # Handle empty materials
-            item.is_empty_material = data.get('is_empty', False)
             if item.is_empty_material:
                 empty_materials += 1
-                # Try to guess the purpose of empty materials
-                if any(keyword in material_name.lower() for keyword in ['placeholder', 'temp', 'wip']):
-                    item.empty_material_purpose = 'PLACEHOLDER'
-                elif any(keyword in material_name.lower() for keyword in ['group', 'selection', 'org']):
-                    item.empty_material_purpose = 'ORGANIZATIONAL'
-                elif any(keyword in material_name.lower() for keyword in ['vertex', 'color', 'vx']):
-                    item.empty_material_purpose = 'VERTEX_COLOR'
-                elif any(keyword in material_name.lower() for keyword in ['external', 'system']):
-                    item.empty_material_purpose = 'EXTERNAL'
-                else:
-                    item.empty_material_purpose = 'UNKNOWN'
-            
-            # Analyze naming and get recommendations
-            issues, recommended_name, recommended_suffix = get_material_naming_recommendation(
-                material_name, data['shader_type'], data['material_ref']
-            )
-            
-            item.has_naming_issues = len(issues) > 0
-            item.naming_issues = "; ".join(issues) if issues else ""
-            item.recommended_name = recommended_name
-            item.recommended_suffix = recommended_suffix
-            
-            # Check for UV conflicts
-            has_uv_conflicts, uv_conflict_details, conflicting_objects = detect_uv_conflicts(data['objects'])
-            item.has_uv_conflicts = has_uv_conflicts
-            item.uv_conflict_details = uv_conflict_details
-            item.conflicting_objects = conflicting_objects
-            
-            # Check for UV mapping nodes
-            has_uv_mapping_nodes, uv_mapping_node_details = detect_uv_mapping_nodes(data['material_ref'])
-            item.has_uv_mapping_nodes = has_uv_mapping_nodes
-            item.uv_mapping_node_details = uv_mapping_node_details
-            item.needs_uv_correction = has_uv_mapping_nodes
             
             if item.has_naming_issues:
                 total_issues += 1
@@ -6128,6 +6573,7 @@ class META_HORIZON_OT_analyze_materials(Operator):
                 item.naming_issues = ""
                 item.recommended_name = ""
                 item.recommended_suffix = ""
+                update_material_display(item)
         
         total_materials = len(material_data)
         total_objects = len(set().union(*[data['objects'] for data in material_data.values()]))
@@ -6149,6 +6595,8 @@ class META_HORIZON_OT_analyze_materials(Operator):
         if uv_conflict_materials > 0:
             report_parts.append(f"{uv_conflict_materials} materials have UV mapping conflicts")
         
+        update_material_fix_label(context.scene)
+        mark_wizard_analysis_dirty(context.scene)
         self.report({'INFO'}, ". ".join(report_parts) + ".")
         
         return {'FINISHED'}
@@ -6198,12 +6646,11 @@ class META_HORIZON_OT_bake_material(Operator):
         
         # Find objects using this material
         objects_using_material = []
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'MESH' and obj.data and obj.data.materials:
-                for slot in obj.material_slots:
-                    if slot.material and slot.material.name == self.material_name:
-                        objects_using_material.append(obj)
-                        break
+        for obj in scene_mesh_objects_with_materials(bpy.context.scene):
+            for slot in obj.material_slots:
+                if slot.material and slot.material.name == self.material_name:
+                    objects_using_material.append(obj)
+                    break
         
         if not objects_using_material:
             self.report({'WARNING'}, f"No objects found using material '{self.material_name}'")
@@ -6273,18 +6720,20 @@ class META_HORIZON_OT_bake_all_materials(Operator):
         failed_bakes = 0
         total_start_time = time.time()
         
+        # Mesh objects with materials, gathered once for all materials
+        mesh_objects = scene_mesh_objects_with_materials(context.scene)
+        
         for i, material in enumerate(bakeable_materials):
             if bake_settings.show_progress:
                 print(f"\n--- Baking material {i+1}/{len(bakeable_materials)}: '{material.name}' ---")
             
             # Find objects using this material
             objects_using_material = []
-            for obj in bpy.context.scene.objects:
-                if obj.type == 'MESH' and obj.data and obj.data.materials:
-                    for slot in obj.material_slots:
-                        if slot.material and slot.material.name == material.name:
-                            objects_using_material.append(obj)
-                            break
+            for obj in mesh_objects:
+                for slot in obj.material_slots:
+                    if slot.material and slot.material.name == material.name:
+                        objects_using_material.append(obj)
+                        break
             
             if not objects_using_material:
                 if bake_settings.show_progress:
@@ -6415,15 +6864,8 @@ class META_HORIZON_OT_bake_all_materials(Operator):
         
         # Material count info
         if context.scene.material_analysis_results:
-            bakeable_count = 0
-            for item in context.scene.material_analysis_results:
-                if not item.material_name.startswith('[Empty Slot'):
-                    material = bpy.data.materials.get(item.material_name)
-                    if material:
-                        # Check if this is a VXC material (Vertex Color only - no textures needed)
-                        base_name, material_type, texture_info = get_meta_horizon_texture_info(material.name, material)
-                        if material_type != "VXC":  # Exclude VXC materials from baking
-                            bakeable_count += 1
+            # Bakeable materials are flagged at analysis time
+            bakeable_count = sum(1 for item in context.scene.material_analysis_results if item.is_bakeable)
             
             layout.separator()
             info_box = layout.box()
@@ -6472,6 +6914,114 @@ class META_HORIZON_PT_quick_start(bpy.types.Panel):
         button_row.operator("meta_horizon.wizard_reset", text="🚀 Launch Export Wizard", icon='SCRIPT', depress=True)
 
 
+# === PANEL DRAW HELPERS ===
+
+# Per-material action buttons: (flag attribute, operator id, text, icon), critical issues first
+MATERIAL_ACTIONS = (
+    ("has_uv_mapping_nodes", "meta_horizon.simplify_material", "Simplify", 'MATERIAL'),
+    ("has_uv_conflicts", "meta_horizon.resolve_uv_conflicts", "Fix UVs", 'UV_DATA'),
+    ("needs_setup", "meta_horizon.setup_empty_material", "Setup", 'ADD'),
+)
+
+def draw_material_row(layout, item):
+    """Draw one material analysis row from the values precomputed at analysis time"""
+    material_name = item.material_name
+    
+    # Create a box for each material for better organization
+    mat_box = layout.box()
+    
+    # Main material info row with status icon
+    mat_row = mat_box.row()
+    mat_row.label(text="", icon=ANALYSIS_STATUS_ICONS[item.status])
+    
+    # Show material name and type (take up full width)
+    name_col = mat_row.column()
+    name_col.scale_x = 3.0
+    name_col.label(text=f"{item.status_glyph} {item.display_name}")
+    
+    # Show shader type
+    type_col = mat_row.column()
+    type_col.scale_x = 1.5
+    type_col.label(text=item.display_shader)
+    
+    # Action buttons section - in a separate row for better readability
+    actions_row = mat_box.row(align=True)
+    actions_row.scale_y = 1.1
+    
+    for attr, op_id, text, icon in MATERIAL_ACTIONS:
+        if getattr(item, attr):
+            actions_row.operator(op_id, text=text, icon=icon).material_name = material_name
+    
+    # Always show Edit Type button
+    actions_row.operator("meta_horizon.choose_material_suffix", text="Edit Type", icon='MATERIAL').material_name = material_name
+    
+    # Objects using this material row
+    objects_row = mat_box.row()
+    objects_row.scale_y = 0.8
+    if item.using_objects:
+        # Objects label
+        objects_label_col = objects_row.column()
+        objects_label_col.scale_x = 0.3
+        objects_label_col.label(text="Objects:", icon='OBJECT_DATA')
+        
+        # Objects list (truncated at analysis time)
+        objects_col = objects_row.column()
+        objects_col.scale_x = 2.0
+        objects_col.label(text=item.display_objects)
+        
+        # Select objects button
+        select_col = objects_row.column()
+        select_col.scale_x = 0.8
+        select_col.operator("meta_horizon.select_objects_by_material", text="Select", icon='RESTRICT_SELECT_OFF').material_name = material_name
+    else:
+        # No objects using this material
+        objects_row.label(text="⚠ No objects using this material", icon='INFO')
+
+
+def draw_mesh_row(layout, item):
+    """Draw one mesh analysis row from the values precomputed at analysis time"""
+    object_name = item.object_name
+    needs_uvs = item.uv_channel_count == 0
+    has_geometry_modifiers = item.has_geometry_adding_modifiers
+    can_optimize = item.polygon_count > 100
+    
+    # Create a box for each mesh for better organization
+    mesh_box = layout.box()
+    
+    # Main mesh info row with status icon
+    mesh_row = mesh_box.row()
+    mesh_row.label(text="", icon=ANALYSIS_STATUS_ICONS[item.status])
+    
+    # Show object name and poly count (take up more space)
+    name_col = mesh_row.column()
+    name_col.scale_x = 2.5
+    name_col.label(text=f"{item.status_glyph} {item.display_name} {item.display_poly_text}")
+    
+    # Show issues summary
+    issue_col = mesh_row.column()
+    issue_col.scale_x = 2.0
+    issue_col.label(text=item.display_issues)
+    
+    # Action buttons section - in a separate row for better readability
+    if needs_uvs or has_geometry_modifiers or can_optimize:
+        actions_row = mesh_box.row(align=True)
+        actions_row.scale_y = 1.1
+        
+        if needs_uvs:
+            actions_row.operator("meta_horizon.smart_uv_project", text="Create UVs", icon='UV_DATA').object_name = object_name
+        
+        if has_geometry_modifiers:
+            actions_row.operator("meta_horizon.apply_geometry_modifiers", text="Apply Mods", icon='MODIFIER').object_name = object_name
+        
+        if can_optimize:
+            actions_row.operator("meta_horizon.decimate_single_mesh", text="Optimize", icon='MOD_DECIM').object_name = object_name
+    else:
+        # If no actions are needed, show ready status
+        status_row = mesh_box.row()
+        status_row.scale_y = 0.8
+        status_row.label(text="✅ Mesh ready for export", icon='CHECKMARK')
+
+
 class META_HORIZON_PT_analysis(bpy.types.Panel):
     """Analysis Panel - Step 1 in logical workflow"""
     bl_label = "1. Scene Analysis"
@@ -6489,6 +7039,8 @@ class META_HORIZON_PT_analysis(bpy.types.Panel):
         analysis_box.label(text="Analyze Your Scene", icon='VIEWZOOM')
         
         settings = context.scene.horizon_export_settings
+        mat_results = context.scene.material_analysis_results
+        mesh_results = context.scene.mesh_analysis_results
         
         # Mode selection
         mode_row = analysis_box.row()
@@ -6524,15 +7076,15 @@ class META_HORIZON_PT_analysis(bpy.types.Panel):
             disabled_row.label(text="Select objects to analyze meshes", icon='INFO')
         
         # Show analysis summary if available
-        if context.scene.material_analysis_results or context.scene.mesh_analysis_results:
+        if mat_results or mesh_results:
             layout.separator()
             summary_box = layout.box()
             summary_box.label(text="Analysis Results", icon='INFO')
             
             # Material summary
-            if context.scene.material_analysis_results:
-                total_materials = len(context.scene.material_analysis_results)
-                issues = sum(1 for item in context.scene.material_analysis_results if item.has_naming_issues)
+            if mat_results:
+                total_materials = len(mat_results)
+                issues = sum(1 for item in mat_results if item.has_naming_issues)
                 
                 mat_summary_row = summary_box.row()
                 if issues > 0:
@@ -6541,12 +7093,20 @@ class META_HORIZON_PT_analysis(bpy.types.Panel):
                     mat_summary_row.label(text=f"Materials: {total_materials} total, all compliant", icon='CHECKMARK')
             
             # Mesh summary
-            if context.scene.mesh_analysis_results:
-                total_meshes = len(context.scene.mesh_analysis_results)
-                total_polygons = sum(item.polygon_count_final for item in context.scene.mesh_analysis_results)
-                total_vertices = sum(item.vertex_count_final for item in context.scene.mesh_analysis_results)
-                high_poly = sum(1 for item in context.scene.mesh_analysis_results if item.is_high_poly)
-                no_uvs = sum(1 for item in context.scene.mesh_analysis_results if item.uv_channel_count == 0)
+            if mesh_results:
+                total_meshes = len(mesh_results)
+                # Totals and warning counts in one pass over the results
+                total_polygons = 0
+                total_vertices = 0
+                high_poly = 0
+                no_uvs = 0
+                for item in mesh_results:
+                    total_polygons += item.polygon_count_final
+                    total_vertices += item.vertex_count_final
+                    if item.is_high_poly:
+                        high_poly += 1
+                    if item.uv_channel_count == 0:
+                        no_uvs += 1
                 
                 mesh_summary_row = summary_box.row()
                 if high_poly > 0 or no_uvs > 0:
@@ -6562,440 +7122,252 @@ class META_HORIZON_PT_analysis(bpy.types.Panel):
                 # Show total polygon and vertex counts
                 totals_row = summary_box.row()
                 totals_row.label(text=f"Total: {total_polygons:,} polygons, {total_vertices:,} vertices", icon='MESH_DATA')
-            
-            # Detailed Material List
-            if context.scene.material_analysis_results:
-                layout.separator()
-                materials_box = layout.box()
-                
-                # Header with expand/collapse button
-                header_row = materials_box.row()
-                toggle_op = header_row.operator("meta_horizon.toggle_materials_list", 
-                                              text="", 
-                                              icon='TRIA_DOWN' if settings.materials_list_expanded else 'TRIA_RIGHT')
-                header_row.label(text=f"📋 Material Analysis Details ({len(context.scene.material_analysis_results)} total)", 
-                               icon='MATERIAL_DATA')
-                
-                # Status Legend inside Material Analysis Details
-                if settings.materials_list_expanded:
-                    legend_box = materials_box.box()
-                    legend_box.label(text="Status Legend", icon='INFO')
-                    legend_col = legend_box.column()
-                    legend_col.scale_y = 0.8
-                    
-                    legend_row1 = legend_col.row()
-                    legend_row1.label(text="✓ Ready for export", icon='CHECKMARK')
-                    legend_row1.label(text="⚠️ Needs attention", icon='CANCEL')
-                    
-                    legend_row2 = legend_col.row()
-                    legend_row2.label(text="❌ Critical issues", icon='ERROR')
-                    legend_row2.label(text="", icon='BLANK1')  # Empty space for alignment
-                
-                # Show expandable list if expanded
-                if settings.materials_list_expanded:
-                    # Filter out empty slots for cleaner display
-                    filtered_materials = [item for item in context.scene.material_analysis_results 
-                                        if not item.material_name.startswith('[Empty Slot')]
-                    
-                    if filtered_materials:
-                        # Pagination controls
-                        total_filtered = len(filtered_materials)
-                        page_size = settings.materials_page_size
-                        current_page = settings.materials_current_page
-                        max_page = max(0, (total_filtered - 1) // page_size)
-                        
-                        # Ensure current page is valid
-                        if current_page > max_page:
-                            settings.materials_current_page = max_page
-                            current_page = max_page
-                        
-                        start_idx = current_page * page_size
-                        end_idx = min(start_idx + page_size, total_filtered)
-                        
-                        # Pagination header
-                        if total_filtered > page_size:
-                            nav_row = materials_box.row()
-                            nav_row.label(text=f"Page {current_page + 1} of {max_page + 1} ({start_idx + 1}-{end_idx} of {total_filtered})")
-                            
-                            nav_buttons = nav_row.row()
-                            nav_buttons.scale_x = 0.8
-                            
-                            # Previous button
-                            prev_button = nav_buttons.row()
-                            prev_button.enabled = current_page > 0
-                            prev_op = prev_button.operator("meta_horizon.materials_page_nav", text="◀ Prev", icon='TRIA_LEFT')
-                            prev_op.direction = "prev"
-                            
-                            # Next button
-                            next_button = nav_buttons.row()
-                            next_button.enabled = current_page < max_page
-                            next_op = next_button.operator("meta_horizon.materials_page_nav", text="Next ▶", icon='TRIA_RIGHT')
-                            next_op.direction = "next"
-                        
-                        # Material list for current page
-                        materials_col = materials_box.column()
-                        
-                        for i, item in enumerate(filtered_materials[start_idx:end_idx]):
-                            # Create a box for each material for better organization
-                            mat_box = materials_col.box()
-                            
-                            # Main material info row
-                            mat_row = mat_box.row()
-                            
-                            # Status icon and material name
-                            if item.has_naming_issues or item.is_empty_material or item.has_uv_conflicts or item.has_uv_mapping_nodes:
-                                if item.is_empty_material:
-                                    mat_row.label(text="", icon='ERROR')  # Red X for empty materials
-                                    status_text = "❌"
-                                elif item.has_uv_conflicts:
-                                    mat_row.label(text="", icon='ERROR')  # Red X for UV conflicts
-                                    status_text = "❌"
-                                elif item.has_uv_mapping_nodes:
-                                    mat_row.label(text="", icon='ERROR')  # Red X for UV mapping nodes
-                                    status_text = "❌"
-                                else:
-                                    mat_row.label(text="", icon='CANCEL')  # Warning for naming issues
-                                    status_text = "⚠️"
-                            else:
-                                mat_row.label(text="", icon='CHECKMARK')  # Green check for compliant
-                                status_text = "✓"
-                            
-                            # Material name with truncation for long names
-                            mat_name = item.material_name
-                            if len(mat_name) > 20:
-                                mat_name = mat_name[:17] + "..."
-                            
-                            # Show material name and type (take up full width)
-                            name_col = mat_row.column()
-                            name_col.scale_x = 3.0
-                            name_col.label(text=f"{status_text} {mat_name}")
-                            
-                            # Show shader type
-                            type_col = mat_row.column()
-                            type_col.scale_x = 1.5
-                            shader_display = item.shader_type.replace("ShaderNodeBsdf", "").replace("Principled", "PBR")
-                            type_col.label(text=shader_display)
-                            
-                            # Action buttons section - in a separate row for better readability
-                            buttons_added = False
-                            
-                            # Critical issues first
-                            if item.has_uv_mapping_nodes or item.has_uv_conflicts or (item.is_empty_material and item.can_be_setup):
-                                actions_row = mat_box.row()
-                                actions_row.scale_y = 1.1
-                                
-                                if item.has_uv_mapping_nodes:
-                                    simplify_op = actions_row.operator("meta_horizon.simplify_material", text="Simplify", icon='MATERIAL')
-                                    simplify_op.material_name = item.material_name
-                                    buttons_added = True
-                                
-                                if item.has_uv_conflicts:
-                                    resolve_op = actions_row.operator("meta_horizon.resolve_uv_conflicts", text="Fix UVs", icon='UV_DATA')
-                                    resolve_op.material_name = item.material_name
-                                    buttons_added = True
-                                
-                                if item.is_empty_material and item.can_be_setup:
-                                    setup_op = actions_row.operator("meta_horizon.setup_empty_material", text="Setup", icon='ADD')
-                                    setup_op.material_name = item.material_name
-                                    buttons_added = True
-                            
-                            # Always show Edit Type button
-                            if buttons_added:
-                                # Add to existing row if there's space, otherwise new row
-                                edit_type_op = actions_row.operator("meta_horizon.choose_material_suffix", text="Edit Type", icon='MATERIAL')
-                            else:
-                                # Create new row for edit type
-                                edit_type_row = mat_box.row()
-                                edit_type_row.scale_y = 1.1
-                                edit_type_op = edit_type_row.operator("meta_horizon.choose_material_suffix", text="Edit Type", icon='MATERIAL')
-                            edit_type_op.material_name = item.material_name
-                            buttons_added = True
-                            
-                            # If no buttons were added, show ready status
-                            if not buttons_added:
-                                status_row = mat_box.row()
-                                status_row.scale_y = 0.8
-                                status_row.label(text="✅ Material ready for export", icon='CHECKMARK')
-                            
-                            # Objects using this material row
-                            if item.using_objects:
-                                objects_row = mat_box.row()
-                                objects_row.scale_y = 0.8
-                                
-                                # Objects label
-                                objects_label_col = objects_row.column()
-                                objects_label_col.scale_x = 0.3
-                                objects_label_col.label(text="Objects:", icon='OBJECT_DATA')
-                                
-                                # Objects list (truncated if too long)
-                                objects_col = objects_row.column()
-                                objects_col.scale_x = 2.0
-                                objects_text = item.using_objects
-                                if len(objects_text) > 40:
-                                    objects_text = objects_text[:37] + "..."
-                                objects_col.label(text=objects_text)
-                                
-                                # Select objects button
-                                select_col = objects_row.column()
-                                select_col.scale_x = 0.8
-                                select_op = select_col.operator("meta_horizon.select_objects_by_material", text="Select", icon='RESTRICT_SELECT_OFF')
-                                select_op.material_name = item.material_name
-                            else:
-                                # No objects using this material
-                                objects_row = mat_box.row()
-                                objects_row.scale_y = 0.8
-                                objects_row.label(text="⚠ No objects using this material", icon='INFO')
-                        
-                        # Page size settings
-                        if total_filtered > 5:
-                            page_settings_row = materials_box.row()
-                            page_settings_row.prop(settings, "materials_page_size", text="Items per page")
-                    else:
-                        materials_box.label(text="No materials to display (empty slots filtered out)")
-                    
-                    # Material Fixes section - inside Material Analysis Details
-                    materials_box.separator()
-                    fixes_box = materials_box.box()
-                    fixes_box.label(text="Material Fixes", icon='TOOL_SETTINGS')
-                    
-                    # Quick fix button
-                    fix_col = fixes_box.column()
-                    fix_col.scale_y = 1.3
-                    
-                    # Check if we have materials that need renaming
-                    materials_needing_rename = 0
-                    if context.scene.material_analysis_results:
-                        materials_needing_rename = sum(1 for item in context.scene.material_analysis_results 
-                                                     if not item.material_name.startswith('[Empty Slot') and
-                                                     item.has_naming_issues and 
-                                                     item.recommended_name and 
-                                                     item.recommended_name != item.material_name)
-                    
-                    fix_button_row = fix_col.row()
-                    if materials_needing_rename > 0:
-                        fix_button_row.operator("meta_horizon.apply_all_recommended_names", 
-                                               text=f"🏷️ Fix All Material Names ({materials_needing_rename})", 
-                                               icon='FILE_REFRESH')
-                    else:
-                        fix_button_row.operator("meta_horizon.apply_all_recommended_names", 
-                                               text="🏷️ Fix All Material Names (Run Analysis First)", 
-                                               icon='FILE_REFRESH')
-                        fix_button_row.enabled = False
-                    
-                    # Create unique materials
-                    fix_col.operator("meta_horizon.create_unique_materials", text="🎯 Make Materials Unique", icon='DUPLICATE')
-                    # Resolve all UV conflicts
-                    fix_col.operator("meta_horizon.resolve_all_uv_conflicts", text="🔄 Resolve All UV Conflicts", icon='UV_DATA')
-                else:
-                    # Collapsed state - show brief summary
-                    materials_box.label(text="Click to expand detailed material list", icon='INFO')
-            
-            # Detailed Mesh List
-            if context.scene.mesh_analysis_results:
-                layout.separator()
-                meshes_box = layout.box()
-                
-                # Header with expand/collapse button
-                header_row = meshes_box.row()
-                toggle_op = header_row.operator("meta_horizon.toggle_meshes_list", 
-                                              text="", 
-                                              icon='TRIA_DOWN' if settings.meshes_list_expanded else 'TRIA_RIGHT')
-                header_row.label(text=f"🔧 Mesh Analysis Details ({len(context.scene.mesh_analysis_results)} total)", 
-                               icon='MESH_DATA')
-                
-                # Status Legend inside Mesh Analysis Details
-                if settings.meshes_list_expanded:
-                    legend_box = meshes_box.box()
-                    legend_box.label(text="Status Legend", icon='INFO')
-                    legend_col = legend_box.column()
-                    legend_col.scale_y = 0.8
-                    
-                    legend_row1 = legend_col.row()
-                    legend_row1.label(text="✓ Ready for export", icon='CHECKMARK')
-                    legend_row1.label(text="⚠️ Needs attention", icon='CANCEL')
-                    
-                    legend_row2 = legend_col.row()
-                    legend_row2.label(text="❌ Critical issues", icon='ERROR')
-                    legend_row2.label(text="", icon='BLANK1')  # Empty space for alignment
-                
-                # Show expandable list if expanded
-                if settings.meshes_list_expanded:
-                    mesh_results = context.scene.mesh_analysis_results
-                    
-                    if mesh_results:
-                        # Pagination controls
-                        total_meshes = len(mesh_results)
-                        page_size = settings.meshes_page_size
-                        current_page = settings.meshes_current_page
-                        max_page = max(0, (total_meshes - 1) // page_size)
-                        
-                        # Ensure current page is valid
-                        if current_page > max_page:
-                            settings.meshes_current_page = max_page
-                            current_page = max_page
-                        
-                        start_idx = current_page * page_size
-                        end_idx = min(start_idx + page_size, total_meshes)
-                        
-                        # Pagination header
-                        if total_meshes > page_size:
-                            nav_row = meshes_box.row()
-                            nav_row.label(text=f"Page {current_page + 1} of {max_page + 1} ({start_idx + 1}-{end_idx} of {total_meshes})")
-                            
-                            nav_buttons = nav_row.row()
-                            nav_buttons.scale_x = 0.8
-                            
-                            # Previous button
-                            prev_button = nav_buttons.row()
-                            prev_button.enabled = current_page > 0
-                            prev_op = prev_button.operator("meta_horizon.meshes_page_nav", text="◀ Prev", icon='TRIA_LEFT')
-                            prev_op.direction = "prev"
-                            
-                            # Next button
-                            next_button = nav_buttons.row()
-                            next_button.enabled = current_page < max_page
-                            next_op = next_button.operator("meta_horizon.meshes_page_nav", text="Next ▶", icon='TRIA_RIGHT')
-                            next_op.direction = "next"
-                        
-                        # Mesh list for current page
-                        meshes_col = meshes_box.column()
-                        
-                        for i, item in enumerate(mesh_results[start_idx:end_idx]):
-                            # Create a box for each mesh for better organization
-                            mesh_box = meshes_col.box()
-                            
-                            # Main mesh info row
-                            mesh_row = mesh_box.row()
-                            
-                            # Status icon and object name
-                            has_issues = (item.is_high_poly or 
-                                        item.uv_channel_count == 0 or 
-                                        item.has_geometry_adding_modifiers or
-                                        item.has_destructive_modifiers)
-                            
-                            if has_issues:
-                                if item.is_high_poly or item.uv_channel_count == 0:
-                                    mesh_row.label(text="", icon='ERROR')  # Red X for critical issues
-                                    status_text = "❌"
-                                else:
-                                    mesh_row.label(text="", icon='CANCEL')  # Warning for modifier issues
-                                    status_text = "⚠️"
-                            else:
-                                mesh_row.label(text="", icon='CHECKMARK')  # Green check for ready objects
-                                status_text = "✓"
-                            
-                            # Object name with truncation
-                            obj_name = item.object_name
-                            if len(obj_name) > 18:
-                                obj_name = obj_name[:15] + "..."
-                            
-                            # Show object name and poly count (take up more space)
-                            name_col = mesh_row.column()
-                            name_col.scale_x = 2.5
-                            poly_text = f"({item.polygon_count})" if item.polygon_count > 0 else ""
-                            name_col.label(text=f"{status_text} {obj_name} {poly_text}")
-                            
-                            # Show issues summary
-                            issue_col = mesh_row.column()
-                            issue_col.scale_x = 2.0
-                            issues = []
-                            if item.is_high_poly:
-                                issues.append("High-poly")
-                            if item.uv_channel_count == 0:
-                                issues.append("No UVs")
-                            if item.has_geometry_adding_modifiers:
-                                issues.append("Modifiers")
-                            
-                            if issues:
-                                issue_col.label(text=", ".join(issues))
-                            else:
-                                issue_col.label(text="Ready")
-                            
-                            # Action buttons section - in a separate row for better readability
-                            actions_added = False
-                            
-                            # Critical issues first
-                            if item.uv_channel_count == 0 or item.has_geometry_adding_modifiers or item.polygon_count > 100:
-                                actions_row = mesh_box.row()
-                                actions_row.scale_y = 1.1
-                                
-                                if item.uv_channel_count == 0:
-                                    unwrap_op = actions_row.operator("meta_horizon.smart_uv_project", text="Create UVs", icon='UV_DATA')
-                                    unwrap_op.object_name = item.object_name
-                                    actions_added = True
-                                
-                                if item.has_geometry_adding_modifiers:
-                                    apply_op = actions_row.operator("meta_horizon.apply_geometry_modifiers", text="Apply Mods", icon='MODIFIER')
-                                    apply_op.object_name = item.object_name
-                                    actions_added = True
-                                
-                                if item.polygon_count > 100:
-                                    decimate_op = actions_row.operator("meta_horizon.decimate_single_mesh", text="Optimize", icon='MOD_DECIM')
-                                    decimate_op.object_name = item.object_name
-                                    actions_added = True
-                            
-                            # If no actions are needed, show ready status
-                            if not actions_added:
-                                status_row = mesh_box.row()
-                                status_row.scale_y = 0.8
-                                status_row.label(text="✅ Mesh ready for export", icon='CHECKMARK')
-                        
-                        # Page size settings
-                        if total_meshes > 5:
-                            page_settings_row = meshes_box.row()
-                            page_settings_row.prop(settings, "meshes_page_size", text="Items per page")
-                    else:
-                        meshes_box.label(text="No mesh analysis results available")
-                    
-                    # Mesh Preparation section - inside Mesh Analysis Details
-                    meshes_box.separator()
-                    prep_box = meshes_box.box()
-                    prep_box.label(text="Mesh Preparation", icon='TOOL_SETTINGS')
-                    
-                    prep_col = prep_box.column()
-                    prep_col.scale_y = 1.3
-                    
-                    # UV unwrapping
-                    prep_col.operator("meta_horizon.smart_uv_project_selected", text="📐 Unwrap UVs (Selected)", icon='UV_DATA')
-                    
-                    # Decimation
-                    export_settings = context.scene.horizon_export_settings
-                    selected_objects = context.selected_objects
-                    all_objects = set()
-                    for obj in selected_objects:
-                        collect_children_objects(obj, all_objects)
-                    
-                    mesh_objects = [obj for obj in all_objects if obj.type == 'MESH' and obj.data]
-                    has_mesh_objects = len(mesh_objects) > 0
-                    
-                    # Decimation settings row
-                    decimate_row = prep_box.row()
-                    decimate_row.prop(export_settings, "decimate_type", text="Type")
-                    decimate_row.prop(export_settings, "decimate_ratio", text="Ratio", slider=True)
-                    
-                    # Decimation button
-                    decimate_button_row = prep_col.row()
-                    decimate_button_row.enabled = has_mesh_objects
-                    
-                    if has_mesh_objects:
-                        decimate_button_row.operator("meta_horizon.decimate_meshes", 
-                                                    text=f"🔻 Decimate Meshes ({len(mesh_objects)} objects)", 
-                                                    icon='MOD_DECIM')
-                    else:
-                        decimate_button_row.operator("meta_horizon.decimate_meshes", 
-                                                    text="🔻 Decimate Meshes (No Meshes Selected)", 
-                                                    icon='MOD_DECIM')
-                    
-                    # Apply all modifiers button
-                    prep_col.operator("meta_horizon.apply_all_modifiers", text="🔧 Apply All Modifiers", icon='MODIFIER')
-                else:
-                    # Collapsed state - show brief summary
-                    meshes_box.label(text="Click to expand detailed mesh list", icon='INFO')
-            
 
 
+class META_HORIZON_PT_material_details(bpy.types.Panel):
+    """Material Analysis Details - sub-panel of Scene Analysis"""
+    bl_label = "Material Analysis Details"
+    bl_idname = "META_HORIZON_PT_material_details"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Horizon Worlds"
+    bl_parent_id = "META_HORIZON_PT_analysis"
+    bl_options = {'DEFAULT_CLOSED'}
 
-class META_HORIZON_PT_preparation(bpy.types.Panel):
+    @classmethod
+    def poll(cls, context):
+        return len(context.scene.material_analysis_results) > 0
+
+    def draw_header(self, context):
+        self.layout.label(text="", icon='MATERIAL_DATA')
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.horizon_export_settings
+        mat_results = context.scene.material_analysis_results
+        
+        layout.label(text=f"📋 {len(mat_results)} materials analyzed")
+        
+        # Status Legend
+        legend_box = layout.box()
+        legend_box.label(text="Status Legend", icon='INFO')
+        legend_col = legend_box.column()
+        legend_col.scale_y = 0.8
+        
+        legend_row1 = legend_col.row()
+        legend_row1.label(text="✓ Ready for export", icon='CHECKMARK')
+        legend_row1.label(text="⚠️ Needs attention", icon='CANCEL')
+        
+        legend_row2 = legend_col.row()
+        legend_row2.label(text="❌ Critical issues", icon='ERROR')
+        legend_row2.label(text="", icon='BLANK1')  # Empty space for alignment
+        
+        # Filter out empty slots for cleaner display
+        filtered_materials = [item for item in mat_results 
+                            if not item.material_name.startswith('[Empty Slot')]
+        
+        if not filtered_materials:
+            layout.label(text="No materials to display (empty slots filtered out)")
+            return
+        
+        # Pagination controls
+        total_filtered = len(filtered_materials)
+        page_size = settings.materials_page_size
+        max_page = max(0, (total_filtered - 1) // page_size)
+        
+        # Ensure current page is valid (the stored page is clamped by the page size callback)
+        current_page = min(settings.materials_current_page, max_page)
+        
+        start_idx = current_page * page_size
+        end_idx = min(start_idx + page_size, total_filtered)
+        
+        # Pagination header
+        if total_filtered > page_size:
+            nav_row = layout.row()
+            nav_row.label(text=f"Page {current_page + 1} of {max_page + 1} ({start_idx + 1}-{end_idx} of {total_filtered})")
+            
+            nav_buttons = nav_row.row()
+            nav_buttons.scale_x = 0.8
+            
+            # Previous button
+            prev_button = nav_buttons.row()
+            prev_button.enabled = current_page > 0
+            prev_op = prev_button.operator("meta_horizon.materials_page_nav", text="◀ Prev", icon='TRIA_LEFT')
+            prev_op.direction = "prev"
+            
+            # Next button
+            next_button = nav_buttons.row()
+            next_button.enabled = current_page < max_page
+            next_op = next_button.operator("meta_horizon.materials_page_nav", text="Next ▶", icon='TRIA_RIGHT')
+            next_op.direction = "next"
+        
+        # Material list for current page
+        materials_col = layout.column()
+        
+        for i in range(start_idx, end_idx):
+            draw_material_row(materials_col, filtered_materials[i])
+        
+        # Page size settings
+        if total_filtered > 5:
+            page_settings_row = layout.row()
+            page_settings_row.prop(settings, "materials_page_size", text="Items per page")
+
+
+class META_HORIZON_PT_material_fixes(bpy.types.Panel):
+    """Material Fixes - sub-panel of Material Analysis Details"""
+    bl_label = "Material Fixes"
+    bl_idname = "META_HORIZON_PT_material_fixes"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Horizon Worlds"
+    bl_parent_id = "META_HORIZON_PT_material_details"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header(self, context):
+        self.layout.label(text="", icon='TOOL_SETTINGS')
+
+    def draw(self, context):
+        layout = self.layout
+        
+        # Quick fix button
+        fix_col = layout.column(align=True)
+        fix_col.scale_y = 1.3
+        
+        # Count and label are cached when the material analysis runs
+        settings = context.scene.horizon_export_settings
+        fix_button_row = fix_col.row()
+        fix_button_row.enabled = settings.materials_needing_rename > 0
+        fix_button_row.operator("meta_horizon.apply_all_recommended_names", 
+                               text=settings.fix_names_button_label, 
+                               icon='FILE_REFRESH')
+        
+        # Create unique materials
+        fix_col.operator("meta_horizon.create_unique_materials", text="🎯 Make Materials Unique", icon='DUPLICATE')
+        # Resolve all UV conflicts
+        fix_col.operator("meta_horizon.resolve_all_uv_conflicts", text="🔄 Resolve All UV Conflicts", icon='UV_DATA')
+
+
+class META_HORIZON_PT_mesh_details(bpy.types.Panel):
+    """Mesh Analysis Details - sub-panel of Scene Analysis"""
+    bl_label = "Mesh Analysis Details"
+    bl_idname = "META_HORIZON_PT_mesh_details"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Horizon Worlds"
+    bl_parent_id = "META_HORIZON_PT_analysis"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return len(context.scene.mesh_analysis_results) > 0
+
+    def draw_header(self, context):
+        self.layout.label(text="", icon='MESH_DATA')
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.horizon_export_settings
+        mesh_results = context.scene.mesh_analysis_results
+        
+        layout.label(text=f"🔧 {len(mesh_results)} meshes analyzed")
+        
+        # Status Legend
+        legend_box = layout.box()
+        legend_box.label(text="Status Legend", icon='INFO')
+        legend_col = legend_box.column()
+        legend_col.scale_y = 0.8
+        
+        legend_row1 = legend_col.row()
+        legend_row1.label(text="✓ Ready for export", icon='CHECKMARK')
+        legend_row1.label(text="⚠️ Needs attention", icon='CANCEL')
+        
+        legend_row2 = legend_col.row()
+        legend_row2.label(text="❌ Critical issues", icon='ERROR')
+        legend_row2.label(text="", icon='BLANK1')  # Empty space for alignment
+        
+        # Pagination controls
+        total_meshes = len(mesh_results)
+        page_size = settings.meshes_page_size
+        max_page = max(0, (total_meshes - 1) // page_size)
+        
+        # Ensure current page is valid (the stored page is clamped by the page size callback)
+        current_page = min(settings.meshes_current_page, max_page)
+        
+        start_idx = current_page * page_size
+        end_idx = min(start_idx + page_size, total_meshes)
+        
+        # Pagination header
+        if total_meshes > page_size:
+            nav_row = layout.row()
+            nav_row.label(text=f"Page {current_page + 1} of {max_page + 1} ({start_idx + 1}-{end_idx} of {total_meshes})")
+            
+            nav_buttons = nav_row.row()
+            nav_buttons.scale_x = 0.8
+            
+            # Previous button
+            prev_button = nav_buttons.row()
+            prev_button.enabled = current_page > 0
+            prev_op = prev_button.operator("meta_horizon.meshes_page_nav", text="◀ Prev", icon='TRIA_LEFT')
+            prev_op.direction = "prev"
+            
+            # Next button
+            next_button = nav_buttons.row()
+            next_button.enabled = current_page < max_page
+            next_op = next_button.operator("meta_horizon.meshes_page_nav", text="Next ▶", icon='TRIA_RIGHT')
+            next_op.direction = "next"
+        
+        # Mesh list for current page
+        meshes_col = layout.column()
+        
+        for i in range(start_idx, end_idx):
+            draw_mesh_row(meshes_col, mesh_results[i])
+        
+        # Page size settings
+        if total_meshes > 5:
+            page_settings_row = layout.row()
+            page_settings_row.prop(settings, "meshes_page_size", text="Items per page")
+
+
+class META_HORIZON_PT_mesh_preparation(bpy.types.Panel):
+    """Mesh Preparation - sub-panel of Mesh Analysis Details"""
+    bl_label = "Mesh Preparation"
+    bl_idname = "META_HORIZON_PT_mesh_preparation"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Horizon Worlds"
+    bl_parent_id = "META_HORIZON_PT_mesh_details"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header(self, context):
+        self.layout.label(text="", icon='TOOL_SETTINGS')
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.horizon_export_settings
+        
+        prep_col = layout.column(align=True)
+        prep_col.scale_y = 1.3
+        
+        # UV unwrapping
+        prep_col.operator("meta_horizon.smart_uv_project_selected", text="📐 Unwrap UVs (Selected)", icon='UV_DATA')
+        
+        # Decimation settings row
+        decimate_row = layout.row()
+        decimate_row.prop(settings, "decimate_type", text="Type")
+        decimate_row.prop(settings, "decimate_ratio", text="Ratio", slider=True)
+        
+        # Decimation button (count and label are cached by the depsgraph handler)
+        decimate_button_row = prep_col.row()
+        decimate_button_row.enabled = settings.selected_mesh_count > 0
+        decimate_button_row.operator("meta_horizon.decimate_meshes", 
+                                    text=settings.decimate_button_label, 
+                                    icon='MOD_DECIM')
+        
+        # Apply all modifiers button
+        prep_col.operator("meta_horizon.apply_all_modifiers", text="🔧 Apply All Modifiers", icon='MODIFIER')
+
+
+class META_HORIZON_PT_preparation(bpy.types.Panel):
     """Preparation Panel - Step 2 in logical workflow"""
     bl_label = "2. Performance"
     bl_idname = "META_HORIZON_PT_preparation"
@@ -7007,43 +7379,22 @@ class META_HORIZON_PT_preparation(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         
+        # Bind settings groups once (selection counts and button labels are cached by the depsgraph handler)
+        scene = context.scene
+        atlas_settings = scene.horizon_atlas_settings
+        export_settings = scene.horizon_export_settings
+        
         # Performance optimization
         perf_box = layout.box()
         perf_box.label(text="Combine Mesh & Create UV Atlas", icon='SETTINGS')
         
-        # UV Atlas
-        atlas_settings = context.scene.horizon_atlas_settings
-        selected_objects = context.selected_objects
-        mesh_objects = [obj for obj in selected_objects if obj.type == 'MESH' and obj.data]
-        has_enough_objects = len(mesh_objects) >= 2
-        
         # Apply All Modifiers button
         apply_modifiers_row = perf_box.row()
         apply_modifiers_row.scale_y = 1.2
-        
-        # Count objects with modifiers
-        objects_with_modifiers = 0
-        total_modifiers = 0
-        for obj in mesh_objects:
-            if len(obj.modifiers) > 0:
-                objects_with_modifiers += 1
-                total_modifiers += len(obj.modifiers)
-        
-        if mesh_objects:
-            if objects_with_modifiers > 0:
-                apply_modifiers_row.operator("meta_horizon.apply_all_modifiers", 
-                                        text=f"🔧 Apply All Modifiers ({total_modifiers} modifiers on {objects_with_modifiers} objects)", 
-                                        icon='MODIFIER')
-            else:
-                apply_modifiers_row.operator("meta_horizon.apply_all_modifiers", 
-                                        text="🔧 Apply All Modifiers (No Modifiers Found)", 
-                                        icon='MODIFIER')
-                apply_modifiers_row.enabled = False
-        else:
-            apply_modifiers_row.operator("meta_horizon.apply_all_modifiers", 
-                                    text="🔧 Apply All Modifiers (Select Objects)", 
-                                    icon='MODIFIER')
-            apply_modifiers_row.enabled = False
+        apply_modifiers_row.enabled = export_settings.selected_direct_mesh_count > 0 and export_settings.objects_with_modifiers > 0
+        apply_modifiers_row.operator("meta_horizon.apply_all_modifiers", 
+                                text=export_settings.apply_modifiers_button_label, 
+                                icon='MODIFIER')
         
         perf_box.separator()
         
@@ -7053,12 +7404,8 @@ class META_HORIZON_PT_preparation(bpy.types.Panel):
         
         atlas_button_row = perf_box.row()
         atlas_button_row.scale_y = 1.3
-        atlas_button_row.enabled = has_enough_objects
-        
-        if has_enough_objects:
-            atlas_button_row.operator("meta_horizon.create_uv_atlas", text=f"🗂️ Create UV Atlas ({len(mesh_objects)} objects)", icon='UV_DATA')
-        else:
-            atlas_button_row.operator("meta_horizon.create_uv_atlas", text="🗂️ Create UV Atlas (Select 2+ Objects)", icon='UV_DATA')
+        atlas_button_row.enabled = export_settings.selected_direct_mesh_count >= 2
+        atlas_button_row.operator("meta_horizon.create_uv_atlas", text=export_settings.atlas_button_label, icon='UV_DATA')
 
 
 class META_HORIZON_PT_export_options(bpy.types.Panel):
@@ -7073,14 +7420,18 @@ class META_HORIZON_PT_export_options(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         
-        export_settings = context.scene.horizon_export_settings
+        # Bind settings groups once per draw
+        scene = context.scene
+        export_settings = scene.horizon_export_settings
+        bake_settings = scene.horizon_bake_settings
+        
+        # Check if file is saved
+        file_is_saved = bpy.data.is_saved
         
         # Texture Baking Section (moved to top)
         baking_box = layout.box()
         baking_box.label(text="Texture Baking", icon='RENDER_STILL')
         
-        bake_settings = context.scene.horizon_bake_settings
-        
         # Output directory (moved to first)
         baking_box.prop(bake_settings, "output_directory", text="Output")
         
@@ -7093,23 +7444,11 @@ class META_HORIZON_PT_export_options(bpy.types.Panel):
         bake_col = baking_box.column()
         bake_col.scale_y = 1.3
         
-        # Check if we have materials to bake
-        bakeable_count = 0
-        if context.scene.material_analysis_results:
-            for item in context.scene.material_analysis_results:
-                if not item.material_name.startswith('[Empty Slot'):
-                    material = bpy.data.materials.get(item.material_name)
-                    if material:
-                        # Check if this is a VXC material (Vertex Color only - no textures needed)
-                        base_name, material_type, texture_info = get_meta_horizon_texture_info(material.name, material)
-                        if material_type != "VXC":  # Exclude VXC materials from baking
-                            bakeable_count += 1
+        # Check if we have materials to bake (flagged at analysis time)
+        bakeable_count = sum(1 for item in scene.material_analysis_results if item.is_bakeable)
         
         bake_button_row = bake_col.row()
         
-        # Check if file is saved
-        file_is_saved = bpy.data.is_saved
-        
         if bakeable_count > 0:
             if file_is_saved:
                 bake_button_row.operator("meta_horizon.bake_all_materials", text=f"🔥 Bake All Materials ({bakeable_count})", icon='RENDER_ANIMATION')
@@ -7141,34 +7480,19 @@ class META_HORIZON_PT_export_options(bpy.types.Panel):
         
         export_box.separator()
         
-        # Check selection and show appropriate text
-        selected_count = len([obj for obj in context.selected_objects if obj.type == 'MESH'])
-        
-        # Export button
+        # Export button (label reflects the selection and is cached by the depsgraph handler)
         export_col = export_box.column()
         export_col.scale_y = 1.8
+        export_label = export_settings.export_button_label
         
-        # Check if file is saved
-        file_is_saved = bpy.data.is_saved
-        
-        if selected_count > 0:
-            if file_is_saved:
-                export_button = export_col.operator("meta_horizon.export_with_details", text=f"Export {selected_count} Selected Objects (FBX)", icon='EXPORT')
-            else:
-                export_button = export_col.operator("meta_horizon.export_with_details", text=f"💾 Save File & Export {selected_count} Selected Objects (FBX)", icon='FILE_TICK')
-                # Add a warning row
-                warning_row = export_col.row()
-                warning_row.alert = True
-                warning_row.label(text="⚠️ File must be saved before exporting", icon='ERROR')
+        if file_is_saved:
+            export_col.operator("meta_horizon.export_with_details", text=export_label, icon='EXPORT')
         else:
-            if file_is_saved:
-                export_button = export_col.operator("meta_horizon.export_with_details", text="Export All Objects (FBX)", icon='EXPORT')
-            else:
-                export_button = export_col.operator("meta_horizon.export_with_details", text="💾 Save File & Export All Objects (FBX)", icon='FILE_TICK')
-                # Add a warning row
-                warning_row = export_col.row()
-                warning_row.alert = True
-                warning_row.label(text="⚠️ File must be saved before exporting", icon='ERROR')
+            export_col.operator("meta_horizon.export_with_details", text="💾 Save File & " + export_label, icon='FILE_TICK')
+            # Add a warning row
+            warning_row = export_col.row()
+            warning_row.alert = True
+            warning_row.label(text="⚠️ File must be saved before exporting", icon='ERROR')
 
 
 
@@ -7223,13 +7547,13 @@ class META_HORIZON_OT_create_uv_atlas(Operator):
             self.report({'INFO'}, ". ".join(message_parts) + ".")
             
             # Refresh analyses if they exist
-            if hasattr(context.scene, 'material_analysis_results') and context.scene.material_analysis_results:
+            if context.scene.material_analysis_results:
                 if context.scene.horizon_export_settings.analyze_all_materials:
                     bpy.ops.meta_horizon.analyze_all_materials()
                 else:
                     bpy.ops.meta_horizon.analyze_materials()
             
-            if hasattr(context.scene, 'mesh_analysis_results') and context.scene.mesh_analysis_results:
+            if context.scene.mesh_analysis_results:
                 bpy.ops.meta_horizon.analyze_meshes()
         else:
             self.report({'ERROR'}, f"Failed to create UV atlas: {error_msg}")
@@ -7250,8 +7574,12 @@ class META_HORIZON_OT_create_uv_atlas(Operator):
             self.report({'WARNING'}, "Select at least 2 mesh objects to create an atlas")
             return {'CANCELLED'}
         
-        # Store for the draw method
+        # Store for the draw method, with the object list lines built once here
         self.mesh_objects = mesh_objects
+        display_limit = 8
+        self.object_lines = [f"  • {obj.name}" for obj in mesh_objects[:display_limit]]
+        hidden_count = len(mesh_objects) - display_limit
+        self.more_objects_text = f"  ... and {hidden_count} more objects" if hidden_count > 0 else ""
         
         return context.window_manager.invoke_props_dialog(self, width=600)
 
@@ -7266,15 +7594,14 @@ class META_HORIZON_OT_create_uv_atlas(Operator):
         objects_box = layout.box()
         objects_box.label(text="Objects to be atlased:", icon='MESH_DATA')
         
-        # Limit display to prevent UI overflow
-        display_limit = 8
-        for i, obj in enumerate(self.mesh_objects[:display_limit]):
+        # Display list is limited and formatted in invoke to prevent UI overflow
+        for line in self.object_lines:
             row = objects_box.row()
-            row.label(text=f"  • {obj.name}", icon='OBJECT_DATA')
+            row.label(text=line, icon='OBJECT_DATA')
         
-        if len(self.mesh_objects) > display_limit:
+        if self.more_objects_text:
             more_row = objects_box.row()
-            more_row.label(text=f"  ... and {len(self.mesh_objects) - display_limit} more objects", icon='THREE_DOTS')
+            more_row.label(text=self.more_objects_text, icon='THREE_DOTS')
         
         layout.separator()
         
@@ -7334,29 +7661,49 @@ class META_HORIZON_OT_create_uv_atlas(Operator):
         warning_box.label(text="• Atlas reduces draw calls = better performance", icon='BLANK1')
 
 
+def find_shared_material_slots(scene):
+    """Map each material used by more than one mesh slot in the scene to its (object, slot_index) pairs"""
+    mesh_objects = scene_mesh_objects_with_materials(scene)
+    
+    # First pass: count slot usage per material name
+    usage_counts = Counter()
+    for obj in mesh_objects:
+        for slot in obj.material_slots:
+            material = slot.material
+            if material:
+                usage_counts[material.name] += 1
+    
+    shared_names = {material_name for material_name, count in usage_counts.items() if count > 1}
+    if not shared_names:
+        return {}
+    
+    # Second pass: collect (object, slot_index) pairs only for shared materials
+    shared_materials = defaultdict(list)
+    for obj in mesh_objects:
+        for slot_index, slot in enumerate(obj.material_slots):
+            material = slot.material
+            if material and material.name in shared_names:
+                shared_materials[material.name].append((obj, slot_index))
+    
+    return shared_materials
+
+
 class META_HORIZON_OT_create_unique_materials(Operator):
     """Create unique material copies for all objects that share materials"""
     bl_idname = "meta_horizon.create_unique_materials"
     bl_label = "Create Unique Materials"
     bl_description = "Create unique material copies for all objects that share materials with other objects"
     bl_options = {'REGISTER', 'UNDO'}
+    
+    _shared_materials = None  # Scan made in invoke, used by the next execute only
 
     def execute(self, context):
-        # Dictionary to track material usage: material_name -> list of objects using it
-        material_usage = defaultdict(list)
-        
-        # Collect all objects and their material usage
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'MESH' and obj.data and obj.data.materials:
-                for slot_index, slot in enumerate(obj.material_slots):
-                    if slot.material:
-                        material_usage[slot.material.name].append((obj, slot_index))
-        
-        # Find materials used by multiple objects
-        shared_materials = {}
-        for material_name, object_slots in material_usage.items():
-            if len(object_slots) > 1:
-                shared_materials[material_name] = object_slots
+        # Reuse the scan made in invoke only once; redo runs execute again after undo has
+        # invalidated the cached object references, and scripts skip invoke, so both rescan
+        shared_materials = self._shared_materials
+        self._shared_materials = None
+        if shared_materials is None:
+            shared_materials = find_shared_material_slots(context.scene)
         
         if not shared_materials:
             self.report({'INFO'}, "No shared materials found - all materials are already unique to their objects")
@@ -7366,6 +7713,11 @@ class META_HORIZON_OT_create_unique_materials(Operator):
         created_materials = []
         total_new_materials = 0
         
+        # Existing material names, kept in sync as copies are renamed (avoids rescanning bpy.data.materials)
+        existing_names = {material.name for material in bpy.data.materials}
+        # Next suffix to probe per base name, so repeated copies don't re-probe taken suffixes
+        next_counter_for = {}
+        
         for material_name, object_slots in shared_materials.items():
             original_material = bpy.data.materials.get(material_name)
             if not original_material:
@@ -7380,11 +7732,14 @@ class META_HORIZON_OT_create_unique_materials(Operator):
                 
                 # Find a unique name for the material copy
                 base_name = original_material.name
-                counter = 1
-                while bpy.data.materials.get(f"{base_name}.{counter:03d}"):
+                counter = next_counter_for.get(base_name, 1)
+                while f"{base_name}.{counter:03d}" in existing_names:
                     counter += 1
                 
-                material_copy.name = f"{base_name}.{counter:03d}"
+                new_name = f"{base_name}.{counter:03d}"
+                existing_names.add(new_name)
+                next_counter_for[base_name] = counter + 1
+                material_copy.name = new_name
                 created_materials.append({
                     'original': material_name,
                     'copy': material_copy.name,
@@ -7397,10 +7752,13 @@ class META_HORIZON_OT_create_unique_materials(Operator):
         
         # Create comprehensive report
         if created_materials:
-            print(f"\n=== Created Unique Materials ===")
-            print(f"Found {len(shared_materials)} materials shared between objects")
-            print(f"Created {total_new_materials} unique material copies")
-            print(f"\nDetails:")
+            # Build the console report and write it with a single print
+            report_lines = [
+                "\n=== Created Unique Materials ===",
+                f"Found {len(shared_materials)} materials shared between objects",
+                f"Created {total_new_materials} unique material copies",
+                "\nDetails:",
+            ]
             
             # Group by original material for cleaner reporting
             by_original = defaultdict(list)
@@ -7408,57 +7766,62 @@ class META_HORIZON_OT_create_unique_materials(Operator):
                 by_original[item['original']].append(item)
             
             for original_name, copies in by_original.items():
-                print(f"\n  '{original_name}' was shared by {len(copies) + 1} objects:")
-                print(f"    • First object keeps original material")
+                report_lines.append(f"\n  '{original_name}' was shared by {len(copies) + 1} objects:")
+                report_lines.append("    • First object keeps original material")
                 for copy_info in copies:
-                    print(f"    • '{copy_info['object']}' now uses '{copy_info['copy']}'")
+                    report_lines.append(f"    • '{copy_info['object']}' now uses '{copy_info['copy']}'")
+            
+            print("\n".join(report_lines))
             
             self.report({'INFO'}, 
                        f"Created {total_new_materials} unique materials from {len(shared_materials)} shared materials. "
                        f"Check console for details.")
             
-            # Refresh the material analysis to show the updated state
+            # Update only the originals and their new copies in the material analysis
             if context.scene.horizon_export_settings.analyze_all_materials:
-                bpy.ops.meta_horizon.analyze_all_materials()
+                scope_objects = context.scene.objects
             else:
-                bpy.ops.meta_horizon.analyze_materials()
+                scope_objects = set()
+                for obj in context.selected_objects:
+                    collect_children_objects(obj, scope_objects)
+            changed_names = {item['original'] for item in created_materials} | {item['copy'] for item in created_materials}
+            refresh_material_analysis(context.scene, changed_names, scope_objects)
         else:
             self.report({'WARNING'}, "No material copies were created")
         
         return {'FINISHED'}
 
     def invoke(self, context, event):
-        # Count materials that would be affected
-        material_usage = defaultdict(list)
-        
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'MESH' and obj.data and obj.data.materials:
-                for slot_index, slot in enumerate(obj.material_slots):
-                    if slot.material:
-                        material_usage[slot.material.name].append((obj, slot_index))
+        # Find shared materials once; execute reuses this mapping after the dialog is confirmed
+        shared_materials = find_shared_material_slots(context.scene)
+        self._shared_materials = shared_materials
         
-        # Count shared materials and total new materials that would be created
-        shared_materials = {}
-        total_new_materials = 0
-        for material_name, object_slots in material_usage.items():
-            if len(object_slots) > 1:
-                shared_materials[material_name] = object_slots
-                total_new_materials += len(object_slots) - 1  # -1 because first object keeps original
+        # Total new materials that would be created (-1 because first object keeps original)
+        total_new_materials = sum(len(object_slots) - 1 for object_slots in shared_materials.values())
         
         if not shared_materials:
             self.report({'INFO'}, "No shared materials found - all materials are already unique to their objects")
             return {'CANCELLED'}
         
-        # Store for the draw method
+        # Store the display lines for the draw method (limited to prevent UI overflow)
+        display_limit = 15
         self.shared_materials_info = []
-        for material_name, object_slots in shared_materials.items():
+        for material_name, object_slots in list(shared_materials.items())[:display_limit]:
             object_names = [obj.name for obj, _ in object_slots]
+            
+            # Show object names (limited to prevent overflow)
+            objects_text = ", ".join(object_names[:5])
+            if len(object_names) > 5:
+                objects_text += f" (and {len(object_names) - 5} more)"
+            
             self.shared_materials_info.append({
-                'material': material_name,
-                'objects': object_names,
-                'count': len(object_slots)
+                'header': f"• '{material_name}' shared by {len(object_slots)} objects:",
+                'objects_text': f"    Objects: {objects_text}"
             })
         
+        hidden_count = len(shared_materials) - display_limit
+        self.more_materials_text = f"... and {hidden_count} more shared materials" if hidden_count > 0 else ""
+        
         self.total_new_materials = total_new_materials
         
         return context.window_manager.invoke_props_dialog(self, width=700)
@@ -7472,23 +7835,16 @@ class META_HORIZON_OT_create_unique_materials(Operator):
         box = layout.box()
         box.label(text="Shared Materials Found:", icon='MATERIAL')
         
-        # Limit the display to prevent UI overflow
-        display_limit = 15
-        for i, info in enumerate(self.shared_materials_info[:display_limit]):
+        for info in self.shared_materials_info:
             row = box.row()
-            row.label(text=f"• '{info['material']}' shared by {info['count']} objects:", icon='MATERIAL_DATA')
-            
-            # Show object names (limited to prevent overflow)
-            objects_text = ", ".join(info['objects'][:5])
-            if len(info['objects']) > 5:
-                objects_text += f" (and {len(info['objects']) - 5} more)"
+            row.label(text=info['header'], icon='MATERIAL_DATA')
             
             obj_row = box.row()
-            obj_row.label(text=f"    Objects: {objects_text}", icon='OBJECT_DATA')
+            obj_row.label(text=info['objects_text'], icon='OBJECT_DATA')
         
-        if len(self.shared_materials_info) > display_limit:
+        if self.more_materials_text:
             more_row = box.row()
-            more_row.label(text=f"... and {len(self.shared_materials_info) - display_limit} more shared materials", icon='THREE_DOTS')
+            more_row.label(text=self.more_materials_text, icon='THREE_DOTS')
         
         layout.separator()
         
@@ -7501,312 +7857,339 @@ class META_HORIZON_OT_create_unique_materials(Operator):
         info_box.label(text="• Prevents materials from affecting multiple objects simultaneously", icon='BLANK1')
 
 
-class META_HORIZON_OT_export_wizard(Operator):
-    """Ultimate Export Wizard for Meta Horizon Worlds - Step-by-step guided workflow"""
-    bl_idname = "meta_horizon.export_wizard"
-    bl_label = "Export Wizard"
-    bl_description = "Ultimate guided workflow for preparing and exporting assets to Meta Horizon Worlds"
-    bl_options = {'REGISTER', 'UNDO'}
+# Progress shown while the wizard is at each step index; the last entry is the completed wizard
+WIZARD_STEP_PERCENTAGES = (0, 15, 30, 45, 60, 80, 100)
+WIZARD_LAST_STEP = len(WIZARD_STEP_PERCENTAGES) - 1
+
+# Wizard export formats: (file name suffix, bpy.ops.export_scene operator, extra operator arguments)
+# FBX uses simplified export parameters for Blender 4.4 compatibility; BLEND saves a copy of the file
+WIZARD_EXPORT_FORMATS = {
+    'FBX': (".fbx", "fbx", {}),
+    'GLTF': (".gltf", "gltf", {'export_apply': True}),
+    'OBJ': (".obj", "obj", {'use_materials': True}),
+    'BLEND': ("_prepared.blend", None, {}),
+}
+
+def get_export_base_name():
+    """Return the .blend file name without extension, or a default for unsaved files"""
+    blend_name = bpy.path.basename(bpy.data.filepath)
+    if blend_name.endswith('.blend'):
+        return blend_name[:-6]
+    return "HorizonExport"
+
+def get_wizard_export_file(export_settings, export_format, base_name):
+    """Resolve the wizard export file path, creating the export directory if needed"""
+    # Ensure export directory exists
+    if not export_settings.export_location:
+        export_settings.export_location = "//exports/"
+    
+    export_path = bpy.path.abspath(export_settings.export_location)
+    os.makedirs(export_path, exist_ok=True)
+    
+    return os.path.join(export_path, base_name + WIZARD_EXPORT_FORMATS[export_format][0])
+
+def run_wizard_export(export_format, export_file, use_selection):
+    """Dispatch the wizard export to the operator registered for the format"""
+    suffix, exporter_name, extra_args = WIZARD_EXPORT_FORMATS[export_format]
+    if exporter_name is None:
+        bpy.ops.wm.save_as_mainfile(filepath=export_file)
+    else:
+        exporter = getattr(bpy.ops.export_scene, exporter_name)
+        exporter(filepath=export_file, use_selection=use_selection, **extra_args)
+
+
+def wizard_analyze_scene(context, wizard):
+    """Analyze the scene and collect statistics, returning a status message"""
+    # Nothing the analysis reads changed since the last run, so keep the results and only recount
+    signature = get_analysis_signature(context)
+    if signature == wizard.last_analysis_signature:
+        update_wizard_counters(context.scene)
+        assign_if_changed(wizard, "scene_changed", False)
+        assign_if_changed(wizard, "current_task", "Analysis complete")
+        return f"Analysis up to date: {wizard.mesh_objects} mesh objects, {wizard.materials_with_issues} materials with issues"
     
-    def execute(self, context):
-        # Initialize wizard state
-        wizard = context.scene.horizon_wizard_state
+    # Clear previous analysis - use correct property names
+    context.scene.mesh_analysis_results.clear()
+    context.scene.material_analysis_results.clear()
+    
+    # Get selected objects or all objects
+    objects_to_analyze = context.selected_objects if context.selected_objects else context.scene.objects
+    
+    mesh_objects = [obj for obj in objects_to_analyze if obj.type == 'MESH']
+    
+    wizard.total_objects = len(objects_to_analyze)
+    wizard.mesh_objects = len(mesh_objects)
+    assign_if_changed(wizard, "current_task", "Analyzing scene...")
+    
+    try:
+        # Analyze meshes
+        bpy.ops.meta_horizon.analyze_meshes()
         
-        if wizard.current_step == 0:
-            # Step 1: Scene Analysis
-            self.perform_scene_analysis(context)
-            wizard.current_step = 1
-            wizard.step_analysis_complete = True
-            wizard.progress_percentage = 15
-            
-        elif wizard.current_step == 1:
-            # Step 2: Material Preparation
-            if wizard.auto_fix_materials:
-                self.auto_fix_materials(context)
-            wizard.current_step = 2
-            wizard.step_materials_complete = True
-            wizard.progress_percentage = 30
-            
-        elif wizard.current_step == 2:
-            # Step 3: Mesh Preparation
-            if wizard.auto_apply_modifiers:
-                self.auto_apply_modifiers(context)
-            wizard.current_step = 3
-            wizard.step_meshes_complete = True
-            wizard.progress_percentage = 45
-            
-        elif wizard.current_step == 3:
-            # Step 4: UV Preparation
-            if wizard.auto_unwrap_uvs:
-                self.auto_unwrap_uvs(context)
-            wizard.current_step = 4
-            wizard.step_uvs_complete = True
-            wizard.progress_percentage = 60
-            
-        elif wizard.current_step == 4:
-            # Step 5: Texture Baking (optional)
-            if wizard.bake_textures:
-                self.bake_textures(context)
-            wizard.current_step = 5
-            wizard.step_baking_complete = True
-            wizard.progress_percentage = 80
-            
-        elif wizard.current_step == 5:
-            # Step 6: Final Export
-            self.perform_export(context)
-            wizard.current_step = 6
-            wizard.step_export_complete = True
-            wizard.progress_percentage = 100
+        # Analyze materials
+        bpy.ops.meta_horizon.analyze_all_materials()
         
-        # Force UI update to show the new step
-        for area in context.screen.areas:
-            area.tag_redraw()
-            
-        return {'FINISHED'}
-    
-    def perform_scene_analysis(self, context):
-        """Analyze the scene and collect statistics"""
-        wizard = context.scene.horizon_wizard_state
+        # Count issues once here; the wizard draw only reads the stored counters
+        update_wizard_counters(context.scene)
+        wizard.last_analysis_signature = signature
+        assign_if_changed(wizard, "scene_changed", False)
         
-        # Clear previous analysis - use correct property names
-        if hasattr(context.scene, 'mesh_analysis_results'):
-            context.scene.mesh_analysis_results.clear()
-        if hasattr(context.scene, 'material_analysis_results'):  
-            context.scene.material_analysis_results.clear()
+        assign_if_changed(wizard, "current_task", "Analysis complete")
+        
+    except Exception as e:
+        assign_if_changed(wizard, "current_task", f"Analysis failed: {str(e)}")
+        print(f"Wizard analysis error: {e}")
+        raise e
+    
+    return f"Analysis complete: {wizard.mesh_objects} mesh objects, {wizard.materials_with_issues} materials with issues"
+
+
+def wizard_fix_materials(context, wizard):
+    """Automatically fix material issues, returning a status message"""
+    assign_if_changed(wizard, "current_task", "Fixing materials...")
+    
+    try:
+        # Apply recommended names
+        bpy.ops.meta_horizon.apply_all_recommended_names()
         
-        # Get selected objects or all objects
-        objects_to_analyze = context.selected_objects if context.selected_objects else context.scene.objects
+        # Collect empty materials and UV conflicts in a single pass over the analysis results
+        empty_material_names = []
+        conflict_material_names = []
+        for material_data in context.scene.material_analysis_results:
+            if material_data.is_empty_material and material_data.can_be_setup:
+                empty_material_names.append(material_data.material_name)
+            if material_data.has_uv_conflicts:
+                conflict_material_names.append(material_data.material_name)
         
-        mesh_objects = [obj for obj in objects_to_analyze if obj.type == 'MESH']
+        # Neither fix changes what the other reads, so the analyses are refreshed once afterwards
+        for material_name in empty_material_names:
+            material = bpy.data.materials.get(material_name)
+            if material:
+                setup_empty_material_nodes(material, 'BASE_PBR')
         
-        wizard.total_objects = len(objects_to_analyze)
-        wizard.mesh_objects = len(mesh_objects)
-        wizard.current_task = "Analyzing scene..."
+        for material_name in conflict_material_names:
+            created_materials, warning = resolve_material_uv_conflicts(material_name)
+            if not created_materials:
+                print(f"Wizard could not resolve UV conflicts for '{material_name}': {warning}")
         
-        try:
-            # Analyze meshes
-            bpy.ops.meta_horizon.analyze_meshes()
-            
-            # Analyze materials
-            bpy.ops.meta_horizon.analyze_all_materials()
-            
-            # Count issues - use correct property names
-            materials_with_issues = 0
-            objects_with_modifiers = 0
-            objects_needing_uvs = 0
-            
-            # Check if the properties exist
-            if hasattr(context.scene, 'material_analysis_results'):
-                for material_data in context.scene.material_analysis_results:
-                    if material_data.has_naming_issues or material_data.is_empty_material or material_data.has_uv_conflicts:
-                        materials_with_issues += 1
-            
-            if hasattr(context.scene, 'mesh_analysis_results'):
-                for mesh_data in context.scene.mesh_analysis_results:
-                    if mesh_data.has_geometry_adding_modifiers:
-                        objects_with_modifiers += 1
-                    if mesh_data.uv_channel_count == 0:
-                        objects_needing_uvs += 1
-            
-            wizard.materials_with_issues = materials_with_issues
-            wizard.objects_with_modifiers = objects_with_modifiers
-            wizard.objects_needing_uvs = objects_needing_uvs
-            wizard.materials_for_baking = len([m for m in bpy.data.materials if m.users > 0])
-            
-            wizard.current_task = "Analysis complete"
+        if empty_material_names or conflict_material_names:
+            if context.scene.horizon_export_settings.analyze_all_materials:
+                bpy.ops.meta_horizon.analyze_all_materials()
+            else:
+                bpy.ops.meta_horizon.analyze_materials()
             
-            self.report({'INFO'}, f"Analysis complete: {wizard.mesh_objects} mesh objects, {materials_with_issues} materials with issues")
+            if context.scene.mesh_analysis_results:
+                bpy.ops.meta_horizon.analyze_meshes()
         
-        except Exception as e:
-            wizard.current_task = f"Analysis failed: {str(e)}"
-            self.report({'ERROR'}, f"Analysis failed: {str(e)}")
-            print(f"Wizard analysis error: {e}")
-    
-    def auto_fix_materials(self, context):
-        """Automatically fix material issues"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Fixing materials..."
+        assign_if_changed(wizard, "current_task", "Materials fixed")
         
-        try:
-            # Apply recommended names
-            bpy.ops.meta_horizon.apply_all_recommended_names()
-            
-            # Setup empty materials
-            if hasattr(context.scene, 'material_analysis_results'):
-                for material_data in context.scene.material_analysis_results:
-                    if material_data.is_empty_material and material_data.can_be_setup:
-                        bpy.ops.meta_horizon.setup_empty_material(material_name=material_data.material_name)
-            
-            # Resolve UV conflicts
-            if hasattr(context.scene, 'material_analysis_results'):
-                for material_data in context.scene.material_analysis_results:
-                    if material_data.has_uv_conflicts:
-                        bpy.ops.meta_horizon.resolve_uv_conflicts(material_name=material_data.material_name)
-            
-            wizard.current_task = "Materials fixed"
-            self.report({'INFO'}, "Material issues automatically resolved")
-            
-        except Exception as e:
-            wizard.current_task = f"Material fix failed: {str(e)}"
-            self.report({'ERROR'}, f"Material fix failed: {str(e)}")
-            print(f"Wizard material fix error: {e}")
+    except Exception as e:
+        assign_if_changed(wizard, "current_task", f"Material fix failed: {str(e)}")
+        print(f"Wizard material fix error: {e}")
+        raise e
     
-    def auto_apply_modifiers(self, context):
-        """Automatically apply geometry-adding modifiers"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Applying modifiers..."
-        
-        try:
-            if hasattr(context.scene, 'mesh_analysis_results'):
-                for mesh_data in context.scene.mesh_analysis_results:
-                    if mesh_data.has_geometry_adding_modifiers:
-                        bpy.ops.meta_horizon.apply_geometry_modifiers(object_name=mesh_data.object_name)
-            
-            wizard.current_task = "Modifiers applied"
-            self.report({'INFO'}, "Geometry modifiers applied")
-            
-        except Exception as e:
-            wizard.current_task = f"Modifier application failed: {str(e)}"
-            self.report({'ERROR'}, f"Modifier application failed: {str(e)}")
-            print(f"Wizard modifier error: {e}")
+    return "Material issues automatically resolved"
+
+
+def wizard_apply_modifiers(context, wizard):
+    """Automatically apply geometry-adding modifiers, returning a status message"""
+    assign_if_changed(wizard, "current_task", "Applying modifiers...")
     
-    def auto_unwrap_uvs(self, context):
-        """Automatically unwrap UVs for objects that need it"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Unwrapping UVs..."
+    try:
+        # Candidates come from the scene's current analysis results, which undo restores along with the modifiers
+        modifier_object_names = modifier_fix_object_names(context.scene)
+        if not modifier_object_names:
+            assign_if_changed(wizard, "current_task", "No modifiers to apply")
+            return wizard.current_task
         
-        try:
-            # Select objects that need UV unwrapping
-            objects_to_unwrap = []
-            if hasattr(context.scene, 'mesh_analysis_results'):
-                for mesh_data in context.scene.mesh_analysis_results:
-                    if mesh_data.uv_channel_count == 0:
-                        obj = bpy.data.objects.get(mesh_data.object_name)
-                        if obj:
-                            objects_to_unwrap.append(obj)
-            
-            if objects_to_unwrap:
-                # Clear selection
-                bpy.ops.object.select_all(action='DESELECT')
-                
-                # Select objects that need unwrapping
-                for obj in objects_to_unwrap:
-                    obj.select_set(True)
-                
-                if objects_to_unwrap:
-                    context.view_layer.objects.active = objects_to_unwrap[0]
-                    bpy.ops.meta_horizon.smart_uv_project_selected()
-            
-            wizard.current_task = "UVs unwrapped"
-            self.report({'INFO'}, f"UV unwrapping complete for {len(objects_to_unwrap)} objects")
-            
-        except Exception as e:
-            wizard.current_task = f"UV unwrapping failed: {str(e)}"
-            self.report({'ERROR'}, f"UV unwrapping failed: {str(e)}")
-            print(f"Wizard UV unwrap error: {e}")
-    
-    def create_atlas(self, context):
-        """Create UV atlas if requested"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Creating UV atlas..."
+        # Apply directly and refresh the mesh analysis once for all objects
+        for object_name in modifier_object_names:
+            obj = bpy.data.objects.get(object_name)
+            if obj and obj.type == 'MESH':
+                apply_geometry_adding_modifiers(obj)
+        bpy.ops.meta_horizon.analyze_meshes()
         
-        # Select mesh objects
-        mesh_objects = [obj for obj in context.scene.objects if obj.type == 'MESH']
-        if len(mesh_objects) > 1:
-            bpy.ops.object.select_all(action='DESELECT')
-            for obj in mesh_objects:
-                obj.select_set(True)
-            
-            if mesh_objects:
-                context.view_layer.objects.active = mesh_objects[0]
-                bpy.ops.meta_horizon.create_uv_atlas()
+        assign_if_changed(wizard, "current_task", "Modifiers applied")
         
-        wizard.current_task = "Atlas created"
-        self.report({'INFO'}, "UV atlas creation complete")
+    except Exception as e:
+        assign_if_changed(wizard, "current_task", f"Modifier application failed: {str(e)}")
+        print(f"Wizard modifier error: {e}")
+        raise e
     
-    def bake_textures(self, context):
-        """Bake textures if requested"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Baking textures..."
-        
-        bpy.ops.meta_horizon.bake_all_materials()
-        
-        wizard.current_task = "Textures baked"
-        self.report({'INFO'}, "Texture baking complete")
+    return "Geometry modifiers applied"
+
+
+def wizard_unwrap_uvs(context, wizard):
+    """Automatically unwrap UVs for objects that need it, returning a status message"""
+    assign_if_changed(wizard, "current_task", "Unwrapping UVs...")
     
-    def perform_export(self, context):
-        """Perform the final export"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Exporting assets..."
+    try:
+        # Select objects that need UV unwrapping, taken from the scene's current analysis results
+        objects_to_unwrap = []
+        for object_name in uv_fix_object_names(context.scene):
+            obj = bpy.data.objects.get(object_name)
+            if obj:
+                objects_to_unwrap.append(obj)
         
-        # Restore original selection for export
-        if wizard.export_selected_only and wizard.original_selected_objects:
-            # Clear current selection
-            bpy.ops.object.select_all(action='DESELECT')
-            
-            # Restore original selection
-            object_names = wizard.original_selected_objects.split(",")
-            restored_objects = []
-            for obj_name in object_names:
-                obj = bpy.data.objects.get(obj_name.strip())
-                if obj:
-                    obj.select_set(True)
-                    restored_objects.append(obj)
-            
-            # Restore active object
-            if wizard.original_active_object:
-                active_obj = bpy.data.objects.get(wizard.original_active_object)
-                if active_obj:
-                    context.view_layer.objects.active = active_obj
-            
-            wizard.current_task = f"Restored selection of {len(restored_objects)} objects for export..."
+        if objects_to_unwrap:
+            # Replace the selection in a single pass instead of deselect-all plus per-object calls.
+            # Keep this a single operator call covering every object; never dispatch it per object.
+            select_only(context.view_layer, objects_to_unwrap)
+            bpy.ops.meta_horizon.smart_uv_project_selected()
         
-        export_settings = context.scene.horizon_export_settings
+        assign_if_changed(wizard, "current_task", "UVs unwrapped")
         
-        # Ensure export directory exists
-        if not export_settings.export_location:
-            export_settings.export_location = "//exports/"
+    except Exception as e:
+        assign_if_changed(wizard, "current_task", f"UV unwrapping failed: {str(e)}")
+        print(f"Wizard UV unwrap error: {e}")
+        raise e
+    
+    return f"UV unwrapping complete for {len(objects_to_unwrap)} objects"
+
+
+def wizard_bake_textures(context, wizard):
+    """Bake textures if requested, returning a status message"""
+    assign_if_changed(wizard, "current_task", "Baking textures...")
+    
+    bpy.ops.meta_horizon.bake_all_materials()
+    
+    assign_if_changed(wizard, "current_task", "Textures baked")
+    return "Texture baking complete"
+
+
+def wizard_export(context, wizard):
+    """Perform the final export, returning a status message"""
+    assign_if_changed(wizard, "current_task", "Exporting assets...")
+    
+    # Restore original selection for export
+    if wizard.export_selected_only and wizard.original_selected_objects:
+        # Restore original selection in one pass over the view layer, collecting the objects still present
+        wanted_names = {item.name for item in wizard.original_selected_objects}
+        restored_objects = select_by_names(context.view_layer, wanted_names)
+        if restored_objects:
+            context.view_layer.objects.active = restored_objects[0]
         
-        export_path = bpy.path.abspath(export_settings.export_location)
-        os.makedirs(export_path, exist_ok=True)
+        # Restore active object
+        if wizard.original_active_object:
+            active_obj = bpy.data.objects.get(wizard.original_active_object)
+            if active_obj:
+                context.view_layer.objects.active = active_obj
         
-        # Generate filename
-        blend_name = bpy.path.basename(bpy.data.filepath)
-        if blend_name.endswith('.blend'):
-            base_name = blend_name[:-6]
-        else:
-            base_name = "HorizonExport"
+        assign_if_changed(wizard, "current_task", f"Restored selection of {len(restored_objects)} objects for export...")
+    
+    # Resolve the name now, since the file may have been saved or renamed since the wizard started;
+    # the stored copy only feeds the step's file preview
+    export_base_name = get_export_base_name()
+    assign_if_changed(wizard, "export_base_name", export_base_name)
+    export_file = get_wizard_export_file(context.scene.horizon_export_settings, wizard.export_format,
+                                         export_base_name)
+    
+    # Use selection based on wizard settings
+    run_wizard_export(wizard.export_format, export_file, wizard.export_selected_only)
+    
+    assign_if_changed(wizard, "current_task", f"Export complete: {export_file}")
+    return wizard.current_task
+
+
+def run_recoverable_wizard_step(step_function, context, wizard):
+    """Run a preparation step whose failure is reported without stopping the wizard
+    
+    Returns tuple: (message, error_message)
+    """
+    try:
+        return step_function(context, wizard), ""
+    except Exception:
+        # The step already recorded the failure as its current task
+        return "", wizard.current_task
+
+def run_wizard_step(context, wizard):
+    """Run the current wizard step and advance to the next one
+    
+    Analysis and preparation failures are returned and the wizard moves on; baking and export failures raise.
+    Returns tuple: (message, error_message)
+    """
+    message = ""
+    error = ""
+    
+    if wizard.current_step == 0:
+        # Step 1: Scene Analysis
+        message, error = run_recoverable_wizard_step(wizard_analyze_scene, context, wizard)
+        wizard.current_step = 1
+        wizard.step_analysis_complete = True
+        
+    elif wizard.current_step == 1:
+        # Step 2: Material Preparation
+        if wizard.auto_fix_materials:
+            message, error = run_recoverable_wizard_step(wizard_fix_materials, context, wizard)
+        wizard.current_step = 2
+        wizard.step_materials_complete = True
+        
+    elif wizard.current_step == 2:
+        # Step 3: Mesh Preparation
+        if wizard.auto_apply_modifiers:
+            message, error = run_recoverable_wizard_step(wizard_apply_modifiers, context, wizard)
+        wizard.current_step = 3
+        wizard.step_meshes_complete = True
+        
+    elif wizard.current_step == 3:
+        # Step 4: UV Preparation
+        if wizard.auto_unwrap_uvs:
+            message, error = run_recoverable_wizard_step(wizard_unwrap_uvs, context, wizard)
+        wizard.current_step = 4
+        wizard.step_uvs_complete = True
+        
+    elif wizard.current_step == 4:
+        # Step 5: Texture Baking (optional)
+        if wizard.bake_textures:
+            message = wizard_bake_textures(context, wizard)
+        wizard.current_step = 5
+        wizard.step_baking_complete = True
         
-        # Determine if we should use selection based on wizard settings
-        use_selection = wizard.export_selected_only
+    elif wizard.current_step == 5:
+        # Step 6: Final Export
+        message = wizard_export(context, wizard)
+        wizard.current_step = 6
+        wizard.step_export_complete = True
+    
+    assign_if_changed(wizard, "progress_percentage", WIZARD_STEP_PERCENTAGES[min(wizard.current_step, WIZARD_LAST_STEP)])
+    
+    # Refresh the summary counters if the step changed the analysis results
+    if wizard.analysis_dirty and wizard.step_analysis_complete:
+        update_wizard_counters(context.scene)
+    finish_wizard_step_edits(wizard)
+    
+    return message, error
+
+
+class META_HORIZON_OT_export_wizard(Operator):
+    """Ultimate Export Wizard for Meta Horizon Worlds - Step-by-step guided workflow"""
+    bl_idname = "meta_horizon.export_wizard"
+    bl_label = "Export Wizard"
+    bl_description = "Ultimate guided workflow for preparing and exporting assets to Meta Horizon Worlds"
+    # Operators called from a step run nested inside this one, so the whole step is a single undo push
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        wizard = context.scene.horizon_wizard_state
         
-        if wizard.export_format == 'FBX':
-            export_file = os.path.join(export_path, f"{base_name}.fbx")
-            # Use simplified FBX export parameters for Blender 4.4 compatibility
-            bpy.ops.export_scene.fbx(
-                filepath=export_file,
-                use_selection=use_selection
-            )
-        elif wizard.export_format == 'GLTF':
-            export_file = os.path.join(export_path, f"{base_name}.gltf")
-            bpy.ops.export_scene.gltf(
-                filepath=export_file,
-                use_selection=use_selection,
-                export_apply=True
-            )
-        elif wizard.export_format == 'OBJ':
-            export_file = os.path.join(export_path, f"{base_name}.obj")
-            bpy.ops.export_scene.obj(
-                filepath=export_file,
-                use_selection=use_selection,
-                use_materials=True
-            )
-        elif wizard.export_format == 'BLEND':
-            export_file = os.path.join(export_path, f"{base_name}_prepared.blend")
-            bpy.ops.wm.save_as_mainfile(filepath=export_file)
+        try:
+            message, error = run_wizard_step(context, wizard)
+        except Exception as e:
+            # Finish even on failure: the step may already have edited the scene, and only a
+            # finished operator pushes an undo step for those edits
+            finish_wizard_step_edits(wizard)
+            self.report({'ERROR'}, f"Step failed: {str(e)}")
+            return {'FINISHED'}
         
-        wizard.current_task = f"Export complete: {export_file}"
-        self.report({'INFO'}, f"Export complete: {export_file}")
+        if error:
+            self.report({'ERROR'}, error)
+        elif message:
+            self.report({'INFO'}, message)
+        
+        # Force UI update to show the new step
+        for area in context.screen.areas:
+            area.tag_redraw()
+            
+        return {'FINISHED'}
     
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self, width=600)
@@ -7823,32 +8206,38 @@ class META_HORIZON_OT_export_wizard(Operator):
         progress_box = header.box()
         progress_row = progress_box.row()
         progress_row.prop(wizard, "progress_percentage", text="Progress", slider=True)
-        if wizard.current_step >= wizard.total_steps:
+        current_step = wizard.current_step
+        total_steps = wizard.total_steps
+        if current_step >= total_steps:
             progress_row.label(text="Complete")
         else:
-            progress_row.label(text=f"Step {wizard.current_step + 1} of {wizard.total_steps}")
+            progress_row.label(text=f"Step {current_step + 1} of {total_steps}")
         
         # Current task
-        if wizard.current_task:
-            progress_box.label(text=f"Current: {wizard.current_task}", icon='TIME')
+        current_task = wizard.current_task
+        if current_task:
+            progress_box.label(text=f"Current: {current_task}", icon='TIME')
+        
+        if wizard.scene_changed:
+            progress_box.label(text="🔄 Scene changed — re-analyze for up-to-date results", icon='INFO')
         
         layout.separator()
         
         # Step-by-step wizard interface
-        if wizard.current_step == 0:
-            self.draw_step_analysis(layout, context)
-        elif wizard.current_step == 1:
-            self.draw_step_materials(layout, context)
-        elif wizard.current_step == 2:
-            self.draw_step_meshes(layout, context)
-        elif wizard.current_step == 3:
-            self.draw_step_uvs(layout, context)
-        elif wizard.current_step == 4:
-            self.draw_step_baking(layout, context)
-        elif wizard.current_step == 5:
-            self.draw_step_export(layout, context)
-        elif wizard.current_step >= 6:
-            self.draw_step_complete(layout, context)
+        if current_step == 0:
+            self.draw_step_analysis(layout, context, wizard)
+        elif current_step == 1:
+            self.draw_step_materials(layout, context, wizard)
+        elif current_step == 2:
+            self.draw_step_meshes(layout, context, wizard)
+        elif current_step == 3:
+            self.draw_step_uvs(layout, context, wizard)
+        elif current_step == 4:
+            self.draw_step_baking(layout, context, wizard)
+        elif current_step == 5:
+            self.draw_step_export(layout, context, wizard)
+        elif current_step >= 6:
+            self.draw_step_complete(layout, context, wizard)
         
         # Navigation buttons
         layout.separator()
@@ -7856,12 +8245,12 @@ class META_HORIZON_OT_export_wizard(Operator):
         nav_row = nav_box.row()
         
         # Previous button
-        if wizard.current_step > 0 and wizard.current_step < 6:
+        if current_step > 0 and current_step < 6:
             prev_button = nav_row.operator("meta_horizon.wizard_previous", text="◀ Previous")
         
         # Next/Action button
-        if wizard.current_step < 6:
-            if wizard.current_step == 0:
+        if current_step < 6:
+            if current_step == 0:
                 # Split into two rows for better layout
                 first_row = nav_box.row()
                 start_button = first_row.operator("meta_horizon.wizard_start_analysis", text="🔍 Start Analysis")
@@ -7872,14 +8261,18 @@ class META_HORIZON_OT_export_wizard(Operator):
         else:
             close_button = nav_row.operator("meta_horizon.wizard_close", text="✓ Close Wizard")
     
-    def draw_step_analysis(self, layout, context):
-        wizard = context.scene.horizon_wizard_state
+    def draw_step_analysis(self, layout, context, wizard):
         
         step_box = layout.box()
         header_row = step_box.row()
         header_row.label(text="Step 1: Scene Analysis", icon='ZOOM_ALL')
         
         if wizard.step_analysis_complete:
+            # Read each counter once
+            materials_with_issues = wizard.materials_with_issues
+            objects_with_modifiers = wizard.objects_with_modifiers
+            objects_needing_uvs = wizard.objects_needing_uvs
+            
             # Summary stats
             results_box = step_box.box()
             results_box.label(text="📊 Analysis Results:", icon='INFO')
@@ -7890,12 +8283,12 @@ class META_HORIZON_OT_export_wizard(Operator):
             stats_col1.label(text=f"🔺 Mesh Objects: {wizard.mesh_objects}")
             
             stats_col2 = stats_row.column()
-            stats_col2.label(text=f"🎨 Materials w/ Issues: {wizard.materials_with_issues}")
-            stats_col2.label(text=f"⚙️ Objects w/ Modifiers: {wizard.objects_with_modifiers}")
-            stats_col2.label(text=f"🗺️ Objects Needing UVs: {wizard.objects_needing_uvs}")
+            stats_col2.label(text=f"🎨 Materials w/ Issues: {materials_with_issues}")
+            stats_col2.label(text=f"⚙️ Objects w/ Modifiers: {objects_with_modifiers}")
+            stats_col2.label(text=f"🗺️ Objects Needing UVs: {objects_needing_uvs}")
             
             # Status indicator
-            if wizard.materials_with_issues > 0 or wizard.objects_with_modifiers > 0 or wizard.objects_needing_uvs > 0:
+            if materials_with_issues > 0 or objects_with_modifiers > 0 or objects_needing_uvs > 0:
                 warning_box = step_box.box()
                 warning_box.alert = True
                 warning_box.label(text="⚠ Issues found that need attention before export", icon='ERROR')
@@ -7903,65 +8296,64 @@ class META_HORIZON_OT_export_wizard(Operator):
                 success_box = step_box.box()
                 success_box.label(text="✅ Scene is ready for Meta Horizon Worlds", icon='CHECKMARK')
     
-    def draw_step_materials(self, layout, context):
-        wizard = context.scene.horizon_wizard_state
+    def draw_step_materials(self, layout, context, wizard):
         
         step_box = layout.box()
         header_row = step_box.row()
         header_row.label(text="Step 2: Material Preparation", icon='MATERIAL')
         
-        if wizard.materials_with_issues == 0:
+        materials_with_issues = wizard.materials_with_issues
+        if materials_with_issues == 0:
             success_box = step_box.box()
             success_box.label(text="✅ No material issues found!", icon='CHECKMARK')
         else:
             issues_box = step_box.box()
             issues_box.alert = True
-            issues_box.label(text=f"⚠ Found {wizard.materials_with_issues} materials that need attention", icon='ERROR')
+            issues_box.label(text=f"⚠ Found {materials_with_issues} materials that need attention", icon='ERROR')
             
             # Auto-fix settings
             settings_box = step_box.box()
             settings_box.prop(wizard, "auto_fix_materials", text="🔧 Auto-fix material issues")
     
-    def draw_step_meshes(self, layout, context):
-        wizard = context.scene.horizon_wizard_state
+    def draw_step_meshes(self, layout, context, wizard):
         
         step_box = layout.box()
         header_row = step_box.row()
         header_row.label(text="Step 3: Mesh Preparation", icon='MESH_DATA')
         
-        if wizard.objects_with_modifiers == 0:
+        objects_with_modifiers = wizard.objects_with_modifiers
+        if objects_with_modifiers == 0:
             success_box = step_box.box()
             success_box.label(text="✅ No geometry modifiers found!", icon='CHECKMARK')
         else:
             issues_box = step_box.box()
             issues_box.alert = True
-            issues_box.label(text=f"⚠ Found {wizard.objects_with_modifiers} objects with geometry modifiers", icon='MODIFIER')
+            issues_box.label(text=f"⚠ Found {objects_with_modifiers} objects with geometry modifiers", icon='MODIFIER')
             
             # Auto-apply settings
             settings_box = step_box.box()
             settings_box.prop(wizard, "auto_apply_modifiers", text="🔧 Auto-apply geometry modifiers")
     
-    def draw_step_uvs(self, layout, context):
-        wizard = context.scene.horizon_wizard_state
+    def draw_step_uvs(self, layout, context, wizard):
         
         step_box = layout.box()
         header_row = step_box.row()
         header_row.label(text="Step 4: UV Preparation", icon='UV')
         
-        if wizard.objects_needing_uvs == 0:
+        objects_needing_uvs = wizard.objects_needing_uvs
+        if objects_needing_uvs == 0:
             success_box = step_box.box()
             success_box.label(text="✅ All objects have UV coordinates!", icon='CHECKMARK')
         else:
             issues_box = step_box.box()
             issues_box.alert = True
-            issues_box.label(text=f"⚠ Found {wizard.objects_needing_uvs} objects without UV coordinates", icon='ERROR')
+            issues_box.label(text=f"⚠ Found {objects_needing_uvs} objects without UV coordinates", icon='ERROR')
             
             # Auto-unwrap settings
             settings_box = step_box.box()
             settings_box.prop(wizard, "auto_unwrap_uvs", text="🔧 Auto-unwrap UVs")
     
-    def draw_step_baking(self, layout, context):
-        wizard = context.scene.horizon_wizard_state
+    def draw_step_baking(self, layout, context, wizard):
         
         step_box = layout.box()
         header_row = step_box.row()
@@ -7970,11 +8362,13 @@ class META_HORIZON_OT_export_wizard(Operator):
         step_box.prop(wizard, "bake_textures", text="🔥 Bake Textures")
         
         if wizard.bake_textures:
-            # Baking settings
-            bake_settings = context.scene.horizon_bake_settings
-            settings_box = step_box.box()
-            settings_box.label(text="🎛️ Baking Settings:", icon='SETTINGS')
+            # Baking settings in a collapsible section; a collapsed section skips building its widgets
+            settings_header, settings_box = step_box.panel("horizon_wizard_bake_settings", default_closed=False)
+            settings_header.label(text="🎛️ Baking Settings:", icon='SETTINGS')
+            if settings_box is None:
+                return
             
+            bake_settings = context.scene.horizon_bake_settings
             settings_row = settings_box.row()
             settings_col1 = settings_row.column()
             settings_col1.prop(bake_settings, "bake_type", text="Bake Type")
@@ -7996,8 +8390,7 @@ class META_HORIZON_OT_export_wizard(Operator):
             output_col2.prop(bake_settings, "margin", text="Margin")
             output_col2.prop(bake_settings, "use_denoising", text="Denoising")
     
-    def draw_step_export(self, layout, context):
-        wizard = context.scene.horizon_wizard_state
+    def draw_step_export(self, layout, context, wizard):
         
         step_box = layout.box()
         header_row = step_box.row()
@@ -8006,31 +8399,36 @@ class META_HORIZON_OT_export_wizard(Operator):
         # Show what will be exported
         export_info_box = step_box.box()
         if wizard.export_selected_only and wizard.original_selected_objects:
-            object_names = wizard.original_selected_objects.split(",")
-            valid_objects = [name.strip() for name in object_names if bpy.data.objects.get(name.strip())]
+            # Validity is cached by the depsgraph handler when objects are added or removed
+            valid_count = wizard.valid_export_count
             
-            export_info_box.label(text=f"📦 Will Export: {len(valid_objects)} Originally Selected Objects", icon='INFO')
+            export_info_box.label(text=f"📦 Will Export: {valid_count} Originally Selected Objects", icon='INFO')
             
             # Show object names in a compact way
-            if len(valid_objects) <= 5:
-                for obj_name in valid_objects:
-                    export_info_box.label(text=f"  • {obj_name}")
-            else:
-                for obj_name in valid_objects[:3]:
-                    export_info_box.label(text=f"  • {obj_name}")
-                export_info_box.label(text=f"  • ... and {len(valid_objects) - 3} more objects")
+            shown_count = valid_count if valid_count <= 5 else 3
+            if shown_count:
+                for item in wizard.original_selected_objects:
+                    if item.exists:
+                        export_info_box.label(text=f"  • {item.name}")
+                        shown_count -= 1
+                        if not shown_count:
+                            break
+            if valid_count > 5:
+                export_info_box.label(text=f"  • ... and {valid_count - 3} more objects")
         else:
-            all_mesh_objects = [obj for obj in context.scene.objects if obj.type == 'MESH']
-            export_info_box.label(text=f"📦 Will Export: All Scene Objects ({len(all_mesh_objects)} mesh objects)", icon='INFO')
+            # Mesh count cached by the analysis step; refreshed lazily when objects are added or removed
+            export_info_box.label(text=f"📦 Will Export: All Scene Objects ({wizard.mesh_objects} mesh objects)", icon='INFO')
         
         # Export location
         export_settings = context.scene.horizon_export_settings
         location_box = step_box.box()
         location_box.label(text="📂 Export Location:", icon='FOLDER_REDIRECT')
         location_box.prop(export_settings, "export_location", text="")
+        export_base_name = wizard.export_base_name
+        if export_base_name:
+            location_box.label(text=f"📄 File: {export_base_name}{WIZARD_EXPORT_FORMATS[wizard.export_format][0]}")
     
-    def draw_step_complete(self, layout, context):
-        wizard = context.scene.horizon_wizard_state
+    def draw_step_complete(self, layout, context, wizard):
         
         complete_box = layout.box()
         header_row = complete_box.row()
@@ -8053,7 +8451,7 @@ class META_HORIZON_OT_wizard_previous(Operator):
         wizard = context.scene.horizon_wizard_state
         if wizard.current_step > 0:
             wizard.current_step -= 1
-            wizard.progress_percentage = max(0, wizard.progress_percentage - 15)
+            assign_if_changed(wizard, "progress_percentage", WIZARD_STEP_PERCENTAGES[wizard.current_step])
         return {'FINISHED'}
 
 
@@ -8067,16 +8465,30 @@ class META_HORIZON_OT_wizard_run_all(Operator):
     def execute(self, context):
         wizard = context.scene.horizon_wizard_state
         
-        # Run all steps in sequence
-        for step in range(7):
-            wizard.current_step = step
-            wizard.progress_percentage = int((step + 1) * (100 / 7))
-            
-            # Execute the main wizard operator for each step
-            result = bpy.ops.meta_horizon.export_wizard()
-            if 'CANCELLED' in result:
-                self.report({'WARNING'}, f"Wizard stopped at step {step + 1}")
+        # Run all steps in-process; nested operators fold into this operator's single undo push
+        wizard.current_step = 0
+        steps_completed = 0
+        failed_steps = []
+        while wizard.current_step < WIZARD_LAST_STEP:
+            step = wizard.current_step
+            try:
+                message, error = run_wizard_step(context, wizard)
+            except Exception as e:
+                # Baking and export failures stop the run; earlier failures only skip their fixes
+                finish_wizard_step_edits(wizard)
+                self.report({'WARNING'}, f"Wizard stopped at step {step + 1}: {str(e)}")
                 break
+            if error:
+                failed_steps.append(step + 1)
+            steps_completed += 1
+        else:
+            if failed_steps:
+                self.report({'WARNING'}, f"Wizard completed all {steps_completed} steps, but steps {', '.join(map(str, failed_steps))} failed. Check console for details.")
+            else:
+                self.report({'INFO'}, f"Wizard completed all {steps_completed} steps")
+        
+        for area in context.screen.areas:
+            area.tag_redraw()
         
         return {'FINISHED'}
 
@@ -8092,8 +8504,9 @@ class META_HORIZON_OT_wizard_reset(Operator):
         # Reset wizard state
         wizard = context.scene.horizon_wizard_state
         wizard.current_step = 0
-        wizard.progress_percentage = 0
-        wizard.current_task = "Starting export wizard..."
+        assign_if_changed(wizard, "progress_percentage", 0)
+        assign_if_changed(wizard, "current_task", "Starting export wizard...")
+        wizard.export_base_name = get_export_base_name()
         
         # Reset step completion
         wizard.step_analysis_complete = False
@@ -8104,20 +8517,7 @@ class META_HORIZON_OT_wizard_reset(Operator):
         wizard.step_export_complete = False
         
         # Capture original selection for later export
-        selected_objects = context.selected_objects
-        if selected_objects:
-            # Store names of selected objects
-            wizard.original_selected_objects = ",".join([obj.name for obj in selected_objects])
-            wizard.export_selected_only = True
-            
-            # Store active object
-            if context.active_object:
-                wizard.original_active_object = context.active_object.name
-        else:
-            # No selection, export all objects
-            wizard.original_selected_objects = ""
-            wizard.original_active_object = ""
-            wizard.export_selected_only = False
+        store_original_selection(context, wizard)
         
         # Launch the wizard
         bpy.ops.meta_horizon.export_wizard('INVOKE_DEFAULT')
@@ -8130,7 +8530,7 @@ class META_HORIZON_OT_wizard_close(Operator):
     bl_idname = "meta_horizon.wizard_close"
     bl_label = "Close Wizard"
     bl_description = "Close the export wizard"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_options = {'REGISTER'}  # Changes no data, so no undo step is needed
     
     def execute(self, context):
         return {'FINISHED'}
@@ -8148,102 +8548,31 @@ class META_HORIZON_OT_wizard_start_analysis(Operator):
         
         # Capture original selection for later export if not already captured
         if not wizard.original_selected_objects and not wizard.export_selected_only:
-            selected_objects = context.selected_objects
-            if selected_objects:
-                # Store names of selected objects
-                wizard.original_selected_objects = ",".join([obj.name for obj in selected_objects])
-                wizard.export_selected_only = True
-                
-                # Store active object
-                if context.active_object:
-                    wizard.original_active_object = context.active_object.name
-            else:
-                # No selection, export all objects
-                wizard.original_selected_objects = ""
-                wizard.original_active_object = ""
-                wizard.export_selected_only = False
+            store_original_selection(context, wizard)
         
         # Reset analysis completion status
         wizard.step_analysis_complete = False
-        wizard.current_task = "Starting scene analysis..."
-        wizard.progress_percentage = 10
+        assign_if_changed(wizard, "current_task", "Starting scene analysis...")
+        assign_if_changed(wizard, "progress_percentage", 10)
         
         try:
             # Perform scene analysis directly
-            self.perform_scene_analysis(context)
+            wizard_analyze_scene(context, wizard)
             
             # Mark analysis as complete and advance to next step
             wizard.step_analysis_complete = True
             wizard.current_step = 1
-            wizard.current_task = "Analysis complete!"
-            wizard.progress_percentage = 20
+            assign_if_changed(wizard, "current_task", "Analysis complete!")
+            assign_if_changed(wizard, "progress_percentage", WIZARD_STEP_PERCENTAGES[1])
             
             self.report({'INFO'}, "Scene analysis completed successfully!")
             
         except Exception as e:
             self.report({'ERROR'}, f"Analysis failed: {str(e)}")
-            wizard.current_task = f"Analysis failed: {str(e)}"
+            assign_if_changed(wizard, "current_task", f"Analysis failed: {str(e)}")
             return {'CANCELLED'}
         
         return {'FINISHED'}
-    
-    def perform_scene_analysis(self, context):
-        """Analyze the scene and collect statistics"""
-        wizard = context.scene.horizon_wizard_state
-        
-        # Clear previous analysis - use correct property names
-        if hasattr(context.scene, 'mesh_analysis_results'):
-            context.scene.mesh_analysis_results.clear()
-        if hasattr(context.scene, 'material_analysis_results'):  
-            context.scene.material_analysis_results.clear()
-        
-        # Get selected objects or all objects
-        objects_to_analyze = context.selected_objects if context.selected_objects else context.scene.objects
-        
-        mesh_objects = [obj for obj in objects_to_analyze if obj.type == 'MESH']
-        
-        wizard.total_objects = len(objects_to_analyze)
-        wizard.mesh_objects = len(mesh_objects)
-        wizard.current_task = "Analyzing scene..."
-        
-        try:
-            # Analyze meshes
-            bpy.ops.meta_horizon.analyze_meshes()
-            
-            # Analyze materials
-            bpy.ops.meta_horizon.analyze_all_materials()
-            
-            # Count issues - use correct property names
-            materials_with_issues = 0
-            objects_with_modifiers = 0
-            objects_needing_uvs = 0
-            
-            # Check if the properties exist
-            if hasattr(context.scene, 'material_analysis_results'):
-                for material_data in context.scene.material_analysis_results:
-                    if material_data.has_naming_issues or material_data.is_empty_material or material_data.has_uv_conflicts:
-                        materials_with_issues += 1
-            
-            if hasattr(context.scene, 'mesh_analysis_results'):
-                for mesh_data in context.scene.mesh_analysis_results:
-                    if mesh_data.has_geometry_adding_modifiers:
-                        objects_with_modifiers += 1
-                    if mesh_data.uv_channel_count == 0:
-                        objects_needing_uvs += 1
-            
-            wizard.materials_with_issues = materials_with_issues
-            wizard.objects_with_modifiers = objects_with_modifiers
-            wizard.objects_needing_uvs = objects_needing_uvs
-            wizard.materials_for_baking = len([m for m in bpy.data.materials if m.users > 0])
-            
-            wizard.current_task = "Analysis complete"
-            
-            self.report({'INFO'}, f"Analysis complete: {wizard.mesh_objects} mesh objects, {materials_with_issues} materials with issues")
-        
-        except Exception as e:
-            wizard.current_task = f"Analysis failed: {str(e)}"
-            self.report({'ERROR'}, f"Analysis failed: {str(e)}")
-            print(f"Wizard analysis error: {e}")
 
 
 class META_HORIZON_OT_wizard_next(Operator):
@@ -8251,6 +8580,7 @@ class META_HORIZON_OT_wizard_next(Operator):
     bl_idname = "meta_horizon.wizard_next"
     bl_label = "Next Step"
     bl_description = "Advance to the next step in the export wizard"
+    # Operators called from a step run nested inside this one, so the whole step is a single undo push
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
@@ -8262,199 +8592,187 @@ class META_HORIZON_OT_wizard_next(Operator):
         try:
             if current_step == 1:  # Materials step
                 if wizard.auto_fix_materials:
-                    self.auto_fix_materials(context)
+                    wizard_fix_materials(context, wizard)
                 wizard.step_materials_complete = True
                 
             elif current_step == 2:  # Meshes step
                 if wizard.auto_apply_modifiers:
-                    self.auto_apply_modifiers(context)
+                    wizard_apply_modifiers(context, wizard)
                 wizard.step_meshes_complete = True
                 
             elif current_step == 3:  # UVs step
                 if wizard.auto_unwrap_uvs:
-                    self.auto_unwrap_uvs(context)
+                    wizard_unwrap_uvs(context, wizard)
                 wizard.step_uvs_complete = True
                 
             elif current_step == 4:  # Baking step
                 if wizard.bake_textures:
-                    self.bake_textures(context)
+                    wizard_bake_textures(context, wizard)
                 wizard.step_baking_complete = True
                 
             elif current_step == 5:  # Export step
-                self.perform_export(context)
+                wizard_export(context, wizard)
                 wizard.step_export_complete = True
             
+            # Refresh the summary counters if the step changed the analysis results
+            if wizard.analysis_dirty and wizard.step_analysis_complete:
+                update_wizard_counters(context.scene)
+            finish_wizard_step_edits(wizard)
+            
             # Advance to next step
-            wizard.current_step = min(wizard.current_step + 1, wizard.total_steps)
-            wizard.progress_percentage = min(100, int((wizard.current_step / wizard.total_steps) * 100))
+            wizard.current_step = min(wizard.current_step + 1, WIZARD_LAST_STEP)
+            assign_if_changed(wizard, "progress_percentage", WIZARD_STEP_PERCENTAGES[wizard.current_step])
             
             self.report({'INFO'}, f"Step {current_step + 1} completed successfully!")
             
         except Exception as e:
+            # The step stays current so it can be retried, but any edits it made before failing
+            # still need the undo step that only a finished operator pushes
+            finish_wizard_step_edits(wizard)
             self.report({'ERROR'}, f"Step failed: {str(e)}")
-            wizard.current_task = f"Step failed: {str(e)}"
-            return {'CANCELLED'}
+            assign_if_changed(wizard, "current_task", f"Step failed: {str(e)}")
+            return {'FINISHED'}
         
         return {'FINISHED'}
-    
-    def auto_fix_materials(self, context):
-        """Automatically fix material issues"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Fixing materials..."
-        
-        try:
-            # Apply recommended names
-            bpy.ops.meta_horizon.apply_all_recommended_names()
-            
-            # Setup empty materials
-            if hasattr(context.scene, 'material_analysis_results'):
-                for material_data in context.scene.material_analysis_results:
-                    if material_data.is_empty_material and material_data.can_be_setup:
-                        bpy.ops.meta_horizon.setup_empty_material(material_name=material_data.material_name)
-            
-            # Resolve UV conflicts
-            if hasattr(context.scene, 'material_analysis_results'):
-                for material_data in context.scene.material_analysis_results:
-                    if material_data.has_uv_conflicts:
-                        bpy.ops.meta_horizon.resolve_uv_conflicts(material_name=material_data.material_name)
-            
-            wizard.current_task = "Materials fixed"
-            
-        except Exception as e:
-            wizard.current_task = f"Material fix failed: {str(e)}"
-            raise e
-    
-    def auto_apply_modifiers(self, context):
-        """Automatically apply geometry-adding modifiers"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Applying modifiers..."
-        
-        try:
-            if hasattr(context.scene, 'mesh_analysis_results'):
-                for mesh_data in context.scene.mesh_analysis_results:
-                    if mesh_data.has_geometry_adding_modifiers:
-                        bpy.ops.meta_horizon.apply_geometry_modifiers(object_name=mesh_data.object_name)
-            
-            wizard.current_task = "Modifiers applied"
-            
-        except Exception as e:
-            wizard.current_task = f"Modifier application failed: {str(e)}"
-            raise e
-    
-    def auto_unwrap_uvs(self, context):
-        """Automatically unwrap UVs for objects that need it"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Unwrapping UVs..."
-        
+
+
+# === EXPORT DETAIL STATISTICS ===
+
+# Exports with more objects than this are counted in timer batches before the details popup opens
+EXPORT_STATS_SYNC_LIMIT = 200
+EXPORT_STATS_BATCH_SIZE = 50
+EXPORT_STATS_DISPLAY_LIMIT = 8  # Objects listed individually in the popup
+EXPORT_HIGH_POLYGON_COUNT = 50000
+EXPORT_MODERATE_POLYGON_COUNT = 20000
+
+def new_export_stats(objects):
+    """Return the running polygon/vertex statistics for the export details popup"""
+    return {
+        'objects': list(objects),
+        'pending': list(objects),
+        'object_count': len(objects),
+        'processed': 0,
+        'complete': False,
+        'total_polygons': 0,
+        'total_vertices': 0,
+        'object_rows': [],  # Formatted list rows for the first EXPORT_STATS_DISPLAY_LIMIT objects
+        'mesh_counts': {},  # Instances sharing one original mesh are counted once, keyed by the mesh data pointer
+        'polygons_label': "",
+        'vertices_label': "",
+        'more_objects_label': "",
+        'perf_notice': None,  # (title, icon, lines) for the performance box, or None below the thresholds
+    }
+
+def count_export_stats(stats, batch_size=None, depsgraph=None):
+    """Count the next batch of pending objects (all when no batch size is given), returning True once complete"""
+    pending = stats['pending']
+    batch = pending[:batch_size] if batch_size else pending[:]
+    del pending[:len(batch)]
+    
+    mesh_counts = stats['mesh_counts']
+    object_rows = stats['object_rows']
+    # Unless passed in, fetched on the first object with modifiers; static scenes never touch the depsgraph
+    for obj in batch:
+        obj_polys = 0
+        obj_verts = 0
         try:
-            # Select objects that need UV unwrapping
-            objects_to_unwrap = []
-            if hasattr(context.scene, 'mesh_analysis_results'):
-                for mesh_data in context.scene.mesh_analysis_results:
-                    if mesh_data.uv_channel_count == 0:
-                        obj = bpy.data.objects.get(mesh_data.object_name)
-                        if obj:
-                            objects_to_unwrap.append(obj)
-            
-            if objects_to_unwrap:
-                # Clear selection
-                bpy.ops.object.select_all(action='DESELECT')
-                
-                # Select objects that need unwrapping
-                for obj in objects_to_unwrap:
-                    obj.select_set(True)
-                
-                if objects_to_unwrap:
-                    context.view_layer.objects.active = objects_to_unwrap[0]
-                    bpy.ops.meta_horizon.smart_uv_project_selected()
-            
-            wizard.current_task = "UVs unwrapped"
-            
-        except Exception as e:
-            wizard.current_task = f"UV unwrapping failed: {str(e)}"
-            raise e
-    
-    def bake_textures(self, context):
-        """Bake textures if requested"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Baking textures..."
-        
-        bpy.ops.meta_horizon.bake_all_materials()
-        
-        wizard.current_task = "Textures baked"
-    
-    def perform_export(self, context):
-        """Perform the final export"""
-        wizard = context.scene.horizon_wizard_state
-        wizard.current_task = "Exporting assets..."
-        
-        # Restore original selection for export
-        if wizard.export_selected_only and wizard.original_selected_objects:
-            # Clear current selection
-            bpy.ops.object.select_all(action='DESELECT')
-            
-            # Restore original selection
-            object_names = wizard.original_selected_objects.split(",")
-            restored_objects = []
-            for obj_name in object_names:
-                obj = bpy.data.objects.get(obj_name.strip())
-                if obj:
-                    obj.select_set(True)
-                    restored_objects.append(obj)
-            
-            # Restore active object
-            if wizard.original_active_object:
-                active_obj = bpy.data.objects.get(wizard.original_active_object)
-                if active_obj:
-                    context.view_layer.objects.active = active_obj
-            
-            wizard.current_task = f"Restored selection of {len(restored_objects)} objects for export..."
-        
-        export_settings = context.scene.horizon_export_settings
-        
-        # Ensure export directory exists
-        if not export_settings.export_location:
-            export_settings.export_location = "//exports/"
-        
-        export_path = bpy.path.abspath(export_settings.export_location)
-        os.makedirs(export_path, exist_ok=True)
-        
-        # Generate filename
-        blend_name = bpy.path.basename(bpy.data.filepath)
-        if blend_name.endswith('.blend'):
-            base_name = blend_name[:-6]
-        else:
-            base_name = "HorizonExport"
-        
-        # Determine if we should use selection based on wizard settings
-        use_selection = wizard.export_selected_only
-        
-        if wizard.export_format == 'FBX':
-            export_file = os.path.join(export_path, f"{base_name}.fbx")
-            # Use simplified FBX export parameters for Blender 4.4 compatibility
-            bpy.ops.export_scene.fbx(
-                filepath=export_file,
-                use_selection=use_selection
-            )
-        elif wizard.export_format == 'GLTF':
-            export_file = os.path.join(export_path, f"{base_name}.gltf")
-            bpy.ops.export_scene.gltf(
-                filepath=export_file,
-                use_selection=use_selection,
-                export_apply=True
-            )
-        elif wizard.export_format == 'OBJ':
-            export_file = os.path.join(export_path, f"{base_name}.obj")
-            bpy.ops.export_scene.obj(
-                filepath=export_file,
-                use_selection=use_selection,
-                use_materials=True
-            )
-        elif wizard.export_format == 'BLEND':
-            export_file = os.path.join(export_path, f"{base_name}_prepared.blend")
-            bpy.ops.wm.save_as_mainfile(filepath=export_file)
-        
-        wizard.current_task = f"Export complete: {export_file}"
+            obj_name = obj.name
+            if obj.data:
+                # Get final mesh data considering modifiers; unmodified meshes need no evaluation
+                if obj.modifiers:
+                    if depsgraph is None:
+                        depsgraph = bpy.context.evaluated_depsgraph_get()
+                    # Evaluated meshes can be freed and reallocated between batches, so they are never cached
+                    mesh = obj.evaluated_get(depsgraph).data
+                    if mesh:
+                        obj_polys, obj_verts = len(mesh.polygons), len(mesh.vertices)
+                else:
+                    mesh_key = obj.data.as_pointer()
+                    counts = mesh_counts.get(mesh_key)
+                    if counts is None:
+                        counts = mesh_counts[mesh_key] = (len(obj.data.polygons), len(obj.data.vertices))
+                    obj_polys, obj_verts = counts
+        except ReferenceError:
+            # The object was deleted while its statistics were pending
+            continue
+        
+        if len(object_rows) < EXPORT_STATS_DISPLAY_LIMIT:
+            object_rows.append(f"  • {obj_name} ({obj_polys:,} polys, {obj_verts:,} verts)")
+        stats['total_polygons'] += obj_polys
+        stats['total_vertices'] += obj_verts
+    
+    stats['processed'] += len(batch)
+    if not pending:
+        # Format the labels once; redraws of the popup only read them
+        stats['polygons_label'] = f"{stats['total_polygons']:,}"
+        stats['vertices_label'] = f"{stats['total_vertices']:,}"
+        hidden_count = stats['object_count'] - EXPORT_STATS_DISPLAY_LIMIT
+        stats['more_objects_label'] = f"  ... and {hidden_count} more objects" if hidden_count > 0 else ""
+        # Pick the performance recommendation tier once; the totals no longer change
+        if stats['total_polygons'] > EXPORT_HIGH_POLYGON_COUNT:
+            stats['perf_notice'] = ("⚠️ Performance Warning", 'ERROR', (
+                f"High polygon count ({stats['polygons_label']}) may impact performance",
+                "Consider using decimation or LOD models for Meta Horizon Worlds",
+            ))
+        elif stats['total_polygons'] > EXPORT_MODERATE_POLYGON_COUNT:
+            stats['perf_notice'] = ("💡 Performance Tip", 'INFO', (
+                f"Moderate polygon count ({stats['polygons_label']})",
+                "Consider optimization for better performance",
+            ))
+        stats['complete'] = True
+    return stats['complete']
+
+# Statistics being counted by the timer, the pointer of the window whose export details popup
+# opens once they are complete, and the finished statistics handed to that popup's invoke
+_export_stats_count = {'stats': None, 'window': None, 'ready': None}
+
+def start_export_stats_count(window, stats):
+    """Count export statistics in timer batches, then open the export details popup in the window"""
+    stop_export_stats_count()
+    _export_stats_count['stats'] = stats
+    _export_stats_count['window'] = window.as_pointer()
+    bpy.context.window_manager.progress_begin(0, stats['object_count'])
+    bpy.app.timers.register(tick_export_stats, first_interval=0.0)
+
+def stop_export_stats_count():
+    """Cancel a running export statistics count"""
+    if bpy.app.timers.is_registered(tick_export_stats):
+        bpy.app.timers.unregister(tick_export_stats)
+        bpy.context.window_manager.progress_end()
+    _export_stats_count['stats'] = None
+    _export_stats_count['ready'] = None
+
+def take_ready_export_stats(objects):
+    """Return the statistics a finished timer count left for these export objects, if any"""
+    stats = _export_stats_count['ready']
+    _export_stats_count['ready'] = None
+    if stats is not None and stats['objects'] == objects:
+        return stats
+    return None
+
+def tick_export_stats():
+    """Timer callback counting one batch of export statistics, opening the details popup once all are counted"""
+    stats = _export_stats_count['stats']
+    window_manager = bpy.context.window_manager
+    # The view layer's depsgraph is evaluated between event loop passes; reading it never triggers an update
+    view_layer = bpy.context.view_layer
+    depsgraph = view_layer.depsgraph if view_layer else None
+    if not count_export_stats(stats, EXPORT_STATS_BATCH_SIZE, depsgraph):
+        window_manager.progress_update(stats['processed'])
+        return 0.0
+    
+    window_manager.progress_end()
+    _export_stats_count['stats'] = None
+    
+    # Python cannot rebuild an open popup, so the popup only opens with complete statistics
+    window = next((window for window in window_manager.windows
+                   if window.as_pointer() == _export_stats_count['window']), None)
+    if window:
+        _export_stats_count['ready'] = stats
+        with bpy.context.temp_override(window=window, screen=window.screen):
+            bpy.ops.meta_horizon.export_with_details('INVOKE_DEFAULT')
+        _export_stats_count['ready'] = None
+    return None
 
 
 class META_HORIZON_OT_export_with_details(Operator):
@@ -8462,7 +8780,8 @@ class META_HORIZON_OT_export_with_details(Operator):
     bl_idname = "meta_horizon.export_with_details"
     bl_label = "Export to FBX"
     bl_description = "Export scene to FBX with detailed information about the export"
-    bl_options = {'REGISTER', 'UNDO'}
+    # No UNDO: exporting only writes a file and restores the selection, so an undo step would just snapshot the scene
+    bl_options = {'REGISTER'}
     
     # Export filename property
     filename: StringProperty(
@@ -8473,8 +8792,7 @@ class META_HORIZON_OT_export_with_details(Operator):
     
     # Store export information for display
     export_objects = []
-    total_polygons = 0
-    total_vertices = 0
+    stats = None  # Complete polygon/vertex statistics from new_export_stats, counted in invoke or by a timer
     export_path = ""
     
     def execute(self, context):
@@ -8495,8 +8813,8 @@ class META_HORIZON_OT_export_with_details(Operator):
                 self.report({'ERROR'}, f"Failed to create export directory: {e}")
                 return {'CANCELLED'}
         
-        # Determine which objects to export
-        selected_count = len([obj for obj in context.selected_objects if obj.type == 'MESH'])
+        # Determine which objects to export; the selected meshes are collected once and reused
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
         
         # Use user-provided filename
         base_filename = self.filename.strip()
@@ -8509,12 +8827,12 @@ class META_HORIZON_OT_export_with_details(Operator):
         else:
             filename = base_filename
         
-        if selected_count > 0:
+        if selected_meshes:
             # Export only selected objects
-            export_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+            export_objects = selected_meshes
         else:
-            # Export all mesh objects
-            export_objects = [obj for obj in context.scene.objects if obj.type == 'MESH']
+            # Export all mesh objects in the view layer; objects outside it cannot be selected for export
+            export_objects = [obj for obj in context.view_layer.objects if obj.type == 'MESH']
         
         full_path = os.path.join(export_path, filename)
         
@@ -8523,13 +8841,8 @@ class META_HORIZON_OT_export_with_details(Operator):
         original_active = context.active_object
         
         try:
-            # Select objects to export
-            bpy.ops.object.select_all(action='DESELECT')
-            for obj in export_objects:
-                obj.select_set(True)
-            
-            if export_objects:
-                context.view_layer.objects.active = export_objects[0]
+            # Select objects to export in one pass over the view layer
+            select_only(context.view_layer, export_objects)
             
             # Export to FBX
             bpy.ops.export_scene.fbx(
@@ -8567,18 +8880,14 @@ class META_HORIZON_OT_export_with_details(Operator):
             )
             
             # Restore original selection
-            bpy.ops.object.select_all(action='DESELECT')
-            for obj in original_selection:
-                obj.select_set(True)
+            select_only(context.view_layer, original_selection)
             context.view_layer.objects.active = original_active
             
             self.report({'INFO'}, f"Successfully exported {len(export_objects)} objects to {filename}")
             
         except Exception as e:
             # Restore original selection even if export fails
-            bpy.ops.object.select_all(action='DESELECT')
-            for obj in original_selection:
-                obj.select_set(True)
+            select_only(context.view_layer, original_selection)
             context.view_layer.objects.active = original_active
             
             self.report({'ERROR'}, f"Export failed: {e}")
@@ -8598,12 +8907,12 @@ class META_HORIZON_OT_export_with_details(Operator):
         export_settings = context.scene.horizon_export_settings
         self.export_path = bpy.path.abspath(export_settings.export_location)
         
-        # Determine which objects will be exported
-        selected_count = len([obj for obj in context.selected_objects if obj.type == 'MESH'])
+        # Determine which objects will be exported; the selected meshes are collected once and reused
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
         
-        if selected_count > 0:
+        if selected_meshes:
             # Export selected objects
-            self.export_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+            self.export_objects = selected_meshes
             # Set default filename based on first selected object
             if self.export_objects:
                 # Use the first selected mesh object's name
@@ -8612,33 +8921,29 @@ class META_HORIZON_OT_export_with_details(Operator):
             else:
                 self.filename = "selected_objects_export"
         else:
-            # Export all mesh objects
-            self.export_objects = [obj for obj in context.scene.objects if obj.type == 'MESH']
+            # Export all mesh objects in the view layer, matching what execute selects
+            self.export_objects = [obj for obj in context.view_layer.objects if obj.type == 'MESH']
             # Set default filename based on scene name
             scene_name = context.scene.name if context.scene.name != "Scene" else "scene"
             self.filename = f"{scene_name}_export"
         
-        # Calculate total polygons and vertices
-        self.total_polygons = 0
-        self.total_vertices = 0
-        
-        for obj in self.export_objects:
-            if obj.data:
-                # Get final mesh data considering modifiers
-                depsgraph = context.evaluated_depsgraph_get()
-                eval_obj = obj.evaluated_get(depsgraph)
-                
-                if eval_obj.data:
-                    mesh = eval_obj.data
-                    self.total_polygons += len(mesh.polygons)
-                    self.total_vertices += len(mesh.vertices)
+        # Count polygons and vertices; large exports are counted in timer batches first,
+        # and the timer invokes this operator again once their statistics are ready
+        self.stats = take_ready_export_stats(self.export_objects)
+        if self.stats is None:
+            stats = new_export_stats(self.export_objects)
+            if stats['object_count'] > EXPORT_STATS_SYNC_LIMIT:
+                start_export_stats_count(context.window, stats)
+                self.report({'INFO'}, f"Counting polygons for {stats['object_count']} objects...")
+                return {'CANCELLED'}
+            count_export_stats(stats)
+            self.stats = stats
         
         # Show the popup
         return context.window_manager.invoke_props_dialog(self, width=500)
     
     def draw(self, context):
         layout = self.layout
-        export_settings = context.scene.horizon_export_settings
         
         # Title
         layout.label(text="Export Details", icon='EXPORT')
@@ -8657,10 +8962,7 @@ class META_HORIZON_OT_export_with_details(Operator):
         info_box.label(text="📦 Export Information", icon='INFO')
         
         # Export path
-        path_row = info_box.row()
-        path_row.label(text="Export Location:")
-        path_col = info_box.column()
-        path_col.label(text=self.export_path)
+        info_box.label(text=f"Export Location: {self.export_path}")
         
         # Object count
         count_row = info_box.row()
@@ -8668,27 +8970,25 @@ class META_HORIZON_OT_export_with_details(Operator):
         count_row.label(text=str(len(self.export_objects)))
         
         # Geometry statistics
+        stats = self.stats
         stats_row = info_box.row()
         stats_row.label(text="Total Polygons:")
-        stats_row.label(text=f"{self.total_polygons:,}")
+        stats_row.label(text=stats['polygons_label'])
         
         verts_row = info_box.row()
         verts_row.label(text="Total Vertices:")
-        verts_row.label(text=f"{self.total_vertices:,}")
+        verts_row.label(text=stats['vertices_label'])
         
         layout.separator()
         
-        # Performance recommendations
-        if self.total_polygons > 50000:
-            perf_box = layout.box()
-            perf_box.label(text="⚠️ Performance Warning", icon='ERROR')
-            perf_box.label(text=f"High polygon count ({self.total_polygons:,}) may impact performance")
-            perf_box.label(text="Consider using decimation or LOD models for Meta Horizon Worlds")
-        elif self.total_polygons > 20000:
+        # Performance recommendations, chosen once when the statistics completed
+        perf_notice = stats['perf_notice']
+        if perf_notice:
+            perf_title, perf_icon, perf_lines = perf_notice
             perf_box = layout.box()
-            perf_box.label(text="💡 Performance Tip", icon='INFO')
-            perf_box.label(text=f"Moderate polygon count ({self.total_polygons:,})")
-            perf_box.label(text="Consider optimization for better performance")
+            perf_box.label(text=perf_title, icon=perf_icon)
+            for line in perf_lines:
+                perf_box.label(text=line)
         
         layout.separator()
         
@@ -8697,162 +8997,135 @@ class META_HORIZON_OT_export_with_details(Operator):
             objects_box = layout.box()
             objects_box.label(text="Objects to Export:", icon='OUTLINER_OB_MESH')
             
-            # Limit display to prevent UI overflow
-            display_limit = 8
-            for i, obj in enumerate(self.export_objects[:display_limit]):
-                row = objects_box.row()
-                
-                # Get object stats
-                obj_polys = 0
-                obj_verts = 0
-                if obj.data:
-                    depsgraph = context.evaluated_depsgraph_get()
-                    eval_obj = obj.evaluated_get(depsgraph)
-                    if eval_obj.data:
-                        mesh = eval_obj.data
-                        obj_polys = len(mesh.polygons)
-                        obj_verts = len(mesh.vertices)
-                
-                row.label(text=f"  • {obj.name} ({obj_polys:,} polys, {obj_verts:,} verts)")
+            # Limit display to prevent UI overflow; the rows share one aligned column
+            objects_col = objects_box.column(align=True)
+            for row_text in stats['object_rows']:
+                objects_col.label(text=row_text)
             
-            if len(self.export_objects) > display_limit:
-                objects_box.label(text=f"  ... and {len(self.export_objects) - display_limit} more objects")
+            if stats['more_objects_label']:
+                objects_col.label(text=stats['more_objects_label'])
         
         layout.separator()
         
         # Export format info
         format_box = layout.box()
         format_box.label(text="📋 Export Format: FBX", icon='FILE_3D')
-        format_box.label(text="✅ Compatible with Meta Horizon Worlds")
-        format_box.label(text="✅ Preserves materials and UV coordinates")
-        format_box.label(text="✅ Includes mesh modifiers")
+        format_col = format_box.column(align=True)
+        format_col.label(text="✅ Compatible with Meta Horizon Worlds")
+        format_col.label(text="✅ Preserves materials and UV coordinates")
+        format_col.label(text="✅ Includes mesh modifiers")
+
+
+# Registered in this order and unregistered in reverse, so property groups exist before the
+# types that point at them and parent panels before their children
+classes = (
+    # Property groups: leaf groups first, then the groups that reference them
+    MaterialAnalysisData,
+    MeshAnalysisData,
+    HorizonSelectedObjectName,
+    HorizonExportWizardState,  # original_selected_objects -> HorizonSelectedObjectName
+    HorizonBakeSettings,
+    HorizonExportSettings,
+    HorizonAtlasSettings,
+    
+    # Operators
+    META_HORIZON_OT_export_wizard,
+    META_HORIZON_OT_wizard_reset,
+    META_HORIZON_OT_wizard_previous,
+    META_HORIZON_OT_wizard_run_all,
+    META_HORIZON_OT_wizard_close,
+    META_HORIZON_OT_analyze_materials,
+    META_HORIZON_OT_analyze_all_materials,
+    META_HORIZON_OT_analyze_meshes,
+    META_HORIZON_OT_apply_geometry_modifiers,
+    META_HORIZON_OT_apply_all_modifiers,
+    META_HORIZON_OT_decimate_meshes,
+    META_HORIZON_OT_smart_uv_project_selected,
+    META_HORIZON_OT_smart_uv_project,
+    META_HORIZON_OT_select_objects_by_material,
+    META_HORIZON_OT_apply_recommended_name,
+    META_HORIZON_OT_materials_page_nav,
+    META_HORIZON_OT_meshes_page_nav,
+    META_HORIZON_OT_apply_all_recommended_names,
+    META_HORIZON_OT_resolve_uv_conflicts,
+    META_HORIZON_OT_simplify_material,
+    META_HORIZON_OT_create_material_for_slot,
+    META_HORIZON_OT_setup_empty_material,
+    META_HORIZON_OT_convert_glass_to_principled,
+    META_HORIZON_OT_create_uv_atlas,
+    META_HORIZON_OT_create_unique_materials,
+    META_HORIZON_OT_bake_material,
+    META_HORIZON_OT_bake_all_materials,
+    META_HORIZON_OT_wizard_start_analysis,
+    META_HORIZON_OT_wizard_next,
+    META_HORIZON_OT_export_with_details,
+    META_HORIZON_OT_decimate_single_mesh,
+    META_HORIZON_OT_resolve_all_uv_conflicts,
+    META_HORIZON_OT_choose_material_suffix,
+    
+    # Panels
+    META_HORIZON_PT_quick_start,
+    META_HORIZON_PT_analysis,
+    META_HORIZON_PT_material_details,
+    META_HORIZON_PT_material_fixes,
+    META_HORIZON_PT_mesh_details,
+    META_HORIZON_PT_mesh_preparation,
+    META_HORIZON_PT_preparation,
+    META_HORIZON_PT_export_options,
+)
+
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
+# Scene properties as (attribute name, property factory, property group), removed in reverse
+scene_properties = (
+    ('horizon_wizard_state', bpy.props.PointerProperty, HorizonExportWizardState),
+    ('horizon_bake_settings', bpy.props.PointerProperty, HorizonBakeSettings),
+    ('horizon_export_settings', bpy.props.PointerProperty, HorizonExportSettings),
+    ('horizon_atlas_settings', bpy.props.PointerProperty, HorizonAtlasSettings),
+    ('material_analysis_results', bpy.props.CollectionProperty, MaterialAnalysisData),
+    ('mesh_analysis_results', bpy.props.CollectionProperty, MeshAnalysisData),
+)
+
+# App handlers as (bpy.app.handlers list name, callback), added and removed by the same table
+app_handlers = (
+    ('depsgraph_update_post', horizon_depsgraph_update_handler),
+    ('load_post', horizon_load_post_handler),
+)
 
 
 def register():
-    # Register property groups
-    bpy.utils.register_class(HorizonExportWizardState)
-    bpy.utils.register_class(HorizonBakeSettings)
-    bpy.utils.register_class(HorizonExportSettings)
-    bpy.utils.register_class(HorizonAtlasSettings)
-
-    bpy.utils.register_class(MeshAnalysisData)
-    bpy.utils.register_class(MaterialAnalysisData)
-    
-    # Register operators
-    bpy.utils.register_class(META_HORIZON_OT_export_wizard)
-    bpy.utils.register_class(META_HORIZON_OT_wizard_reset)
-    bpy.utils.register_class(META_HORIZON_OT_wizard_previous)
-    bpy.utils.register_class(META_HORIZON_OT_wizard_run_all)
-    bpy.utils.register_class(META_HORIZON_OT_wizard_close)
-    bpy.utils.register_class(META_HORIZON_OT_analyze_materials)
-    bpy.utils.register_class(META_HORIZON_OT_analyze_all_materials)
-    bpy.utils.register_class(META_HORIZON_OT_analyze_meshes)
-    bpy.utils.register_class(META_HORIZON_OT_apply_geometry_modifiers)
-    bpy.utils.register_class(META_HORIZON_OT_apply_all_modifiers)
-    bpy.utils.register_class(META_HORIZON_OT_decimate_meshes)
-    bpy.utils.register_class(META_HORIZON_OT_smart_uv_project_selected)
-    bpy.utils.register_class(META_HORIZON_OT_smart_uv_project)
-    bpy.utils.register_class(META_HORIZON_OT_select_objects_by_material)
-    bpy.utils.register_class(META_HORIZON_OT_apply_recommended_name)
-    bpy.utils.register_class(META_HORIZON_OT_toggle_materials_list)
-    bpy.utils.register_class(META_HORIZON_OT_toggle_meshes_list)
-    bpy.utils.register_class(META_HORIZON_OT_materials_page_nav)
-    bpy.utils.register_class(META_HORIZON_OT_meshes_page_nav)
-    bpy.utils.register_class(META_HORIZON_OT_apply_all_recommended_names)
-    bpy.utils.register_class(META_HORIZON_OT_resolve_uv_conflicts)
-    bpy.utils.register_class(META_HORIZON_OT_simplify_material)
-    bpy.utils.register_class(META_HORIZON_OT_create_material_for_slot)
-    bpy.utils.register_class(META_HORIZON_OT_setup_empty_material)
-    bpy.utils.register_class(META_HORIZON_OT_convert_glass_to_principled)
-    bpy.utils.register_class(META_HORIZON_OT_create_uv_atlas)
-    bpy.utils.register_class(META_HORIZON_OT_create_unique_materials)
-    bpy.utils.register_class(META_HORIZON_OT_bake_material)
-    bpy.utils.register_class(META_HORIZON_OT_bake_all_materials)
-    bpy.utils.register_class(META_HORIZON_OT_wizard_start_analysis)
-    bpy.utils.register_class(META_HORIZON_OT_wizard_next)
-    bpy.utils.register_class(META_HORIZON_OT_export_with_details)
-    bpy.utils.register_class(META_HORIZON_OT_decimate_single_mesh)
-    bpy.utils.register_class(META_HORIZON_OT_resolve_all_uv_conflicts)
-    bpy.utils.register_class(META_HORIZON_OT_choose_material_suffix)
-    
-    # Register new panels
-    bpy.utils.register_class(META_HORIZON_PT_quick_start)
-    bpy.utils.register_class(META_HORIZON_PT_analysis)
-    bpy.utils.register_class(META_HORIZON_PT_preparation)
-    bpy.utils.register_class(META_HORIZON_PT_export_options)
+    global _MATERIAL_HAS_BLEND_METHOD
+    _MATERIAL_HAS_BLEND_METHOD = 'blend_method' in bpy.types.Material.bl_rna.properties
+    
+    _register_classes()
     
     # Add properties to scene
-    bpy.types.Scene.horizon_wizard_state = bpy.props.PointerProperty(type=HorizonExportWizardState)
-    bpy.types.Scene.horizon_bake_settings = bpy.props.PointerProperty(type=HorizonBakeSettings)
-    bpy.types.Scene.horizon_export_settings = bpy.props.PointerProperty(type=HorizonExportSettings)
-    bpy.types.Scene.horizon_atlas_settings = bpy.props.PointerProperty(type=HorizonAtlasSettings)
-
-    bpy.types.Scene.material_analysis_results = bpy.props.CollectionProperty(type=MaterialAnalysisData)
-    bpy.types.Scene.mesh_analysis_results = bpy.props.CollectionProperty(type=MeshAnalysisData)
+    for prop_name, prop_factory, prop_type in scene_properties:
+        setattr(bpy.types.Scene, prop_name, prop_factory(type=prop_type))
+    
+    # Add handlers
+    _selection_cache['signature'] = None
+    for handler_list_name, handler in app_handlers:
+        handler_list = getattr(bpy.app.handlers, handler_list_name)
+        if handler not in handler_list:
+            handler_list.append(handler)
 
 
 def unregister():
+    # Remove handlers
+    for handler_list_name, handler in app_handlers:
+        handler_list = getattr(bpy.app.handlers, handler_list_name)
+        if handler in handler_list:
+            handler_list.remove(handler)
+    if bpy.app.timers.is_registered(end_wizard_step_edits):
+        bpy.app.timers.unregister(end_wizard_step_edits)
+    stop_export_stats_count()
+    
     # Remove properties from scene
-    del bpy.types.Scene.horizon_wizard_state
-    del bpy.types.Scene.horizon_bake_settings
-    del bpy.types.Scene.horizon_export_settings
-    del bpy.types.Scene.horizon_atlas_settings
-
-    del bpy.types.Scene.material_analysis_results
-    del bpy.types.Scene.mesh_analysis_results
-    
-    # Unregister panels
-    bpy.utils.unregister_class(META_HORIZON_PT_export_options)
-    bpy.utils.unregister_class(META_HORIZON_PT_preparation)
-    bpy.utils.unregister_class(META_HORIZON_PT_analysis)
-    bpy.utils.unregister_class(META_HORIZON_PT_quick_start)
-    
-    # Unregister operators
-
-    bpy.utils.unregister_class(META_HORIZON_OT_bake_all_materials)
-    bpy.utils.unregister_class(META_HORIZON_OT_bake_material)
-    bpy.utils.unregister_class(META_HORIZON_OT_create_unique_materials)
-    bpy.utils.unregister_class(META_HORIZON_OT_create_uv_atlas)
-    bpy.utils.unregister_class(META_HORIZON_OT_convert_glass_to_principled)
-    bpy.utils.unregister_class(META_HORIZON_OT_setup_empty_material)
-    bpy.utils.unregister_class(META_HORIZON_OT_create_material_for_slot)
-    bpy.utils.unregister_class(META_HORIZON_OT_smart_uv_project)
-    bpy.utils.unregister_class(META_HORIZON_OT_smart_uv_project_selected)
-    bpy.utils.unregister_class(META_HORIZON_OT_decimate_meshes)
-    bpy.utils.unregister_class(META_HORIZON_OT_apply_geometry_modifiers)
-    bpy.utils.unregister_class(META_HORIZON_OT_apply_all_modifiers)
-    bpy.utils.unregister_class(META_HORIZON_OT_analyze_meshes)
-    bpy.utils.unregister_class(META_HORIZON_OT_analyze_all_materials)
-    bpy.utils.unregister_class(META_HORIZON_OT_analyze_materials)
-    bpy.utils.unregister_class(META_HORIZON_OT_select_objects_by_material)
-    bpy.utils.unregister_class(META_HORIZON_OT_apply_recommended_name)
-    bpy.utils.unregister_class(META_HORIZON_OT_toggle_materials_list)
-    bpy.utils.unregister_class(META_HORIZON_OT_toggle_meshes_list)
-    bpy.utils.unregister_class(META_HORIZON_OT_materials_page_nav)
-    bpy.utils.unregister_class(META_HORIZON_OT_meshes_page_nav)
-    bpy.utils.unregister_class(META_HORIZON_OT_apply_all_recommended_names)
-    bpy.utils.unregister_class(META_HORIZON_OT_resolve_uv_conflicts)
-    bpy.utils.unregister_class(META_HORIZON_OT_simplify_material)
-    bpy.utils.unregister_class(META_HORIZON_OT_export_wizard)
-    bpy.utils.unregister_class(META_HORIZON_OT_wizard_reset)
-    bpy.utils.unregister_class(META_HORIZON_OT_wizard_previous)
-    bpy.utils.unregister_class(META_HORIZON_OT_wizard_run_all)
-    bpy.utils.unregister_class(META_HORIZON_OT_wizard_close)
-    bpy.utils.unregister_class(META_HORIZON_OT_wizard_start_analysis)
-    bpy.utils.unregister_class(META_HORIZON_OT_wizard_next)
-    bpy.utils.unregister_class(META_HORIZON_OT_export_with_details)
-    bpy.utils.unregister_class(META_HORIZON_OT_decimate_single_mesh)
-    bpy.utils.unregister_class(META_HORIZON_OT_resolve_all_uv_conflicts)
-    bpy.utils.unregister_class(META_HORIZON_OT_choose_material_suffix)
-    
-    # Unregister property groups
-    bpy.utils.unregister_class(MaterialAnalysisData)
-    bpy.utils.unregister_class(MeshAnalysisData)
-
-    bpy.utils.unregister_class(HorizonAtlasSettings)
-    bpy.utils.unregister_class(HorizonExportSettings)
-    bpy.utils.unregister_class(HorizonBakeSettings)
-    bpy.utils.unregister_class(HorizonExportWizardState)
+    for prop_name, _prop_factory, _prop_type in reversed(scene_properties):
+        delattr(bpy.types.Scene, prop_name)
+    
+    _unregister_classes()
 
 
 if __name__ == "__main__":